@@ -0,0 +1,290 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark suite of the fiscal calendar: generation, rendering and export.
+
+Every benchmark records the best wall time of a number of runs and the peak memory (tracemalloc) of one extra run.
+Results are compared with a stored baseline, a benchmark that is slower or uses more memory than the baseline plus the
+tolerance is reported as a regression and the script exits with status 1 (0 with --report-only).
+
+Timings depend on the machine: every run times a fixed calibration workload that does not use the package, and the
+baseline timings are scaled by the ratio of the calibration times before comparing. This absorbs most of the
+difference between machines, the baseline should still be re-recorded locally (--save-baseline) before relying on it.
+The tolerances default to the environment variables FISCAL_CALENDAR_BENCH_TIME_TOLERANCE and
+FISCAL_CALENDAR_BENCH_MEMORY_TOLERANCE if set, e.g. to loosen them on noisy CI runners.
+
+Usage:
+    # run the suite and compare with benchmarks/baseline.json
+    python benchmarks/bench_fiscal_calendar.py
+
+    # run a quick subset (ranges of 1 and 10 years)
+    python benchmarks/bench_fiscal_calendar.py --quick
+
+    # store the results as the new baseline e.g. after an intended change or on a new machine
+    python benchmarks/bench_fiscal_calendar.py --save-baseline
+
+    # print the comparison without failing, e.g. on shared CI hardware
+    python benchmarks/bench_fiscal_calendar.py --quick --report-only
+"""
+# standard libraries
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+from tabulate import tabulate
+
+# run from a source checkout without installing the package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fiscal_calendar import FiscalCalendarGenerator  # noqa: E402
+from fiscal_calendar.engine import fiscal_year_layout, to_day_number  # noqa: E402
+from fiscal_calendar.instrumentation import StageRecorder  # noqa: E402
+from fiscal_calendar.sinks import CsvSink  # noqa: E402
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+START_DATE = '1900-01-28'
+YEARS = (1, 10, 100, 300)
+QUICK_YEARS = (1, 10)
+
+
+def fiscal_year_range(start_date, years):
+    """
+    End date of a range of complete fiscal years.
+
+    Args:
+        start_date (str): First day of the first fiscal year in the format 'yyyy-mm-dd'.
+        years (int): Number of fiscal years.
+
+    Returns:
+        str: Last day of the last fiscal year in the format 'yyyy-mm-dd'.
+    """
+    start_day = to_day_number(start_date)
+    year_starts, year_weeks = fiscal_year_layout(start_date, np.datetime64(start_day + years * 371, 'D'))
+    return str(np.datetime64(int(year_starts[years - 1] + year_weeks[years - 1] * 7 - 1), 'D'))
+
+
+def measure(func, repeat):
+    """
+    Best wall time of repeat runs and peak traced memory of one extra run.
+
+    Args:
+        func (callable): Function without arguments to benchmark.
+        repeat (int): Number of timed runs.
+
+    Returns:
+        tuple: (seconds, peak_bytes)
+    """
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    # tracemalloc slows down allocations, measure the memory in a separate run
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        peak_bytes = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return min(timings), peak_bytes
+
+
+def calibrate(repeat):
+    """
+    Best wall time of a fixed workload of python loops and NumPy sorting, independent of the package.
+
+    The ratio of the calibration times of two machines is used to scale the baseline timings, see compare().
+
+    Args:
+        repeat (int): Number of timed runs.
+
+    Returns:
+        float: Seconds.
+    """
+    values = np.random.default_rng(0).integers(0, 1_000_000, 1_000_000)
+
+    def workload():
+        total = 0
+        for value in range(1_000_000):
+            total += value % 7
+        np.sort(values)
+        return total
+
+    return measure(workload, max(repeat, 3))[0]
+
+
+def print_quietly(func, *args):
+    # discard the printed output, only the time to render it is of interest
+    with contextlib.redirect_stdout(io.StringIO()):
+        func(*args)
+
+
+def time_legacy_stages(fc):
+    """
+    Time the stages of the legacy engine of create_dataframe() with the instrument hook.
+
+    Args:
+        fc (FiscalCalendarGenerator): The generator to time.
+
+    Returns:
+        dict: Stage name to seconds, in order of execution.
+    """
+    recorder = StageRecorder(trace_memory=False)
+    fc.create_dataframe(engine='legacy', instrument=recorder)
+    return {record.stage: record.seconds for record in recorder.records}
+
+
+def run_suite(years_list, legacy_max_years, repeat):
+    """
+    Run all benchmarks.
+
+    Args:
+        years_list (tuple): Range lengths in fiscal years.
+        legacy_max_years (int): Longest range that is benchmarked with the legacy engine.
+        repeat (int): Number of timed runs per benchmark.
+
+    Returns:
+        dict: Benchmark name to {'seconds': float, 'peak_bytes': int}.
+    """
+    results = {}
+
+    def add(name, func, runs=repeat):
+        seconds, peak_bytes = measure(func, runs)
+        results[name] = {'seconds': seconds, 'peak_bytes': peak_bytes}
+        print(f'{name:<55} {seconds:10.4f} s {peak_bytes / 2 ** 20:10.1f} MiB', flush=True)
+
+    for years in years_list:
+        end_date = fiscal_year_range(START_DATE, years)
+        fc = FiscalCalendarGenerator(START_DATE, end_date)
+        # the legacy engine takes seconds per decade, limit its repetitions and range
+        legacy_runs = 1 if years > 10 else repeat
+
+        add(f'generate_fiscal_calendar[{years}y]', fc.generate_fiscal_calendar, legacy_runs)
+        add(f'create_dataframe[vectorized,{years}y]', fc.create_dataframe)
+        add(f'create_dataframe[typed,{years}y]', lambda: fc.create_dataframe(typed=True))
+        if years <= legacy_max_years:
+            add(f'create_dataframe[legacy,{years}y]', lambda: fc.create_dataframe(engine='legacy'), legacy_runs)
+            for stage, seconds in time_legacy_stages(FiscalCalendarGenerator(START_DATE, end_date)).items():
+                results[f'legacy_stage[{stage},{years}y]'] = {'seconds': seconds, 'peak_bytes': None}
+
+        df_fiscal_calendar = fc.create_dataframe()
+        last_year = int(df_fiscal_calendar['fiscal_year'].iloc[-1])
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            add(f'export[csv,{years}y]', lambda: fc.export(CsvSink(os.path.join(tmp_dir, 'fiscal_calendar.csv'))))
+            add(f'save_fiscal_calendar_to_pdf[{years}y]', lambda: fc.save_fiscal_calendar_to_pdf(
+                df_fiscal_calendar, week_number=True, year=last_year,
+                filename=os.path.join(tmp_dir, 'fiscal_calendar.pdf')))
+            add(f'save_fiscal_calendar_to_pdf[book,{years}y]', lambda: fc.save_fiscal_calendar_to_pdf(
+                df_fiscal_calendar, week_number=True, filename=os.path.join(tmp_dir, 'planning_book.pdf')))
+        add(f'print_fiscal_calendar[{years}y]',
+            lambda: fc.print_fiscal_calendar(df_fiscal_calendar, week_number=True, year=last_year))
+        add(f'pretty_print_year[{years}y]', lambda: print_quietly(fc.pretty_print_year, df_fiscal_calendar, last_year))
+
+    return results
+
+
+def compare(results, baseline, time_tolerance, memory_tolerance, min_seconds, speed_factor=1.0):
+    """
+    Compare results with a baseline.
+
+    Args:
+        results (dict): Benchmark results of run_suite().
+        baseline (dict): Stored benchmark results.
+        time_tolerance (float): Allowed relative slowdown e.g. 0.5 for 50%.
+        memory_tolerance (float): Allowed relative increase of the peak memory e.g. 0.25 for 25%.
+        min_seconds (float): Slowdowns smaller than this number of seconds are treated as noise.
+        speed_factor (float): Calibration time of this machine divided by the calibration time of the baseline, the
+            baseline timings are multiplied by it (default is 1.0).
+
+    Returns:
+        tuple: (rows for tabulate, list of regressed benchmark names)
+    """
+    rows = []
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            rows.append([name, f"{result['seconds']:.4f}", '-', '-', 'new'])
+            continue
+        base = dict(baseline[name], seconds=baseline[name]['seconds'] * speed_factor)
+        ratio = result['seconds'] / base['seconds'] if base['seconds'] else float('inf')
+        status = 'ok'
+        if result['seconds'] - base['seconds'] > min_seconds and ratio > 1 + time_tolerance:
+            status = 'SLOWER'
+        if result['peak_bytes'] is not None and base.get('peak_bytes') \
+                and result['peak_bytes'] > base['peak_bytes'] * (1 + memory_tolerance):
+            status = 'MORE MEMORY' if status == 'ok' else 'SLOWER, MORE MEMORY'
+        if status != 'ok':
+            regressions.append(name)
+        rows.append([name, f"{result['seconds']:.4f}", f"{base['seconds']:.4f}", f'{ratio:.2f}x', status])
+    return rows, regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the fiscal calendar and compare with a stored baseline.')
+    parser.add_argument('--quick', action='store_true', help='only ranges of 1 and 10 fiscal years')
+    parser.add_argument('--years', type=int, nargs='+', help='range lengths in fiscal years (default 1 10 100 300)')
+    parser.add_argument('--legacy-max-years', type=int, default=100,
+                        help='longest range benchmarked with the legacy engine (default 100)')
+    parser.add_argument('--repeat', type=int, default=3, help='timed runs per benchmark (default 3)')
+    parser.add_argument('--baseline', default=BASELINE_PATH, help='path of the baseline json file')
+    parser.add_argument('--save-baseline', action='store_true', help='store the results as the new baseline')
+    parser.add_argument('--time-tolerance', type=float,
+                        default=float(os.environ.get('FISCAL_CALENDAR_BENCH_TIME_TOLERANCE', 0.5)),
+                        help='allowed relative slowdown (default 0.5 or $FISCAL_CALENDAR_BENCH_TIME_TOLERANCE)')
+    parser.add_argument('--memory-tolerance', type=float,
+                        default=float(os.environ.get('FISCAL_CALENDAR_BENCH_MEMORY_TOLERANCE', 0.25)),
+                        help='allowed relative increase of the peak memory (default 0.25 or '
+                             '$FISCAL_CALENDAR_BENCH_MEMORY_TOLERANCE)')
+    parser.add_argument('--report-only', action='store_true',
+                        help='print regressions but exit with status 0')
+    parser.add_argument('--min-seconds', type=float, default=0.1,
+                        help='slowdowns below this number of seconds are ignored as noise (default 0.1)')
+    args = parser.parse_args(argv)
+
+    years_list = tuple(args.years) if args.years else QUICK_YEARS if args.quick else YEARS
+    results = run_suite(years_list, args.legacy_max_years, args.repeat)
+    calibration_seconds = calibrate(args.repeat)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump({'python': platform.python_version(), 'machine': platform.machine(),
+                       'calibration_seconds': calibration_seconds, 'results': results}, f, indent=2, sort_keys=True)
+        print(f'\nBaseline saved to {args.baseline}')
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f'\nNo baseline found at {args.baseline}, run with --save-baseline first')
+        return 0
+
+    with open(args.baseline, encoding='utf-8') as f:
+        stored = json.load(f)
+    # baselines without a calibration time are compared as recorded
+    speed_factor = calibration_seconds / stored.get('calibration_seconds', calibration_seconds)
+    rows, regressions = compare(results, stored['results'], args.time_tolerance, args.memory_tolerance,
+                                args.min_seconds, speed_factor)
+    print(f'\nMachine speed relative to the baseline: {1 / speed_factor:.2f}x (baseline timings scaled by '
+          f'{speed_factor:.2f})\n')
+    print(tabulate(rows, headers=['benchmark', 'seconds', 'baseline', 'ratio', 'status'], tablefmt='pretty',
+                   colalign=('left', 'right', 'right', 'right', 'left')))
+    if regressions:
+        print(f'\nPERFORMANCE REGRESSION in {len(regressions)} benchmark(s):')
+        for name in regressions:
+            print(f'  - {name}')
+        return 0 if args.report_only else 1
+    print('\nNo performance regressions')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
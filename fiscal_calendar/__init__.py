@@ -1 +1,37 @@
-from fiscal_calendar.fiscal_calendar import FiscalCalendarGenerator
\ No newline at end of file
+# -*- coding: utf-8 -*-
+"""
+The public names are loaded on first access, so importing the package only loads the modules that are used, e.g.
+`from fiscal_calendar import FiscalDateResolver` needs neither NumPy nor pandas, and reportlab and tabulate are only
+loaded when a PDF is saved or a year is pretty printed.
+"""
+# standard libraries
+from importlib import import_module
+
+# module of every public name
+_EXPORTS = {
+    'FiscalCalendarGenerator': 'fiscal_calendar.fiscal_calendar',
+    'create_calendar': 'fiscal_calendar.fiscal_calendar',
+    'FiscalDateResolver': 'fiscal_calendar.resolver',
+    'FiscalBoundaryIndex': 'fiscal_calendar.boundaries',
+    'PackedFiscalCalendar': 'fiscal_calendar.records',
+    'FiscalDay': 'fiscal_calendar.records',
+    'FiscalWeek': 'fiscal_calendar.records',
+    'FiscalPeriod': 'fiscal_calendar.records',
+    'FiscalCalendarConfig': 'fiscal_calendar.config',
+    'ComparableAlignment': 'fiscal_calendar.comps',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name]), name)
+    # cache on the package, later accesses do not go through __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+from fiscal_calendar.core import DEFAULT_PATTERN, pattern_month_weeks, to_day_number, year_layout
+
+# period levels of the boundary index, from coarse to fine
+LEVELS = ('year', 'season', 'quarter', 'month', 'week')
+
+
+class FiscalBoundaryIndex:
+    """
+    Sorted start dates of every fiscal year, season, quarter, month and week of a fiscal calendar.
+
+    The start arrays are datetime64[D] and sorted, so any array of dates can be bucketed with np.searchsorted, and the
+    periods overlapping a date range are found with two binary searches. The inverse lookup, from fiscal periods to
+    their date ranges, is a direct index into the same arrays.
+
+    Attributes:
+        - year_starts, season_starts, quarter_starts, month_starts, week_starts (np.ndarray): Start date of every
+          period.
+        - year_weeks (np.ndarray): Number of weeks (52 or 53) of every fiscal year.
+        - has_53_weeks (np.ndarray): True for fiscal years with a 53rd week.
+        - year_labels (np.ndarray): Fiscal year of every fiscal year e.g. 2024.
+        - end_date (np.datetime64): The day after the last fiscal year.
+
+    Usage:
+        index = FiscalBoundaryIndex.from_layout(start_date='2021-01-31', end_date='2025-02-01')
+        month_index = index.locate(dates, 'month')
+        fiscal_year, fiscal_month = index.fiscal_year('month')[month_index], index.number('month')[month_index]
+        ranges = index.period_ranges('week', [202433, 202434])
+        same_day_last_quarter = index.shift(dates, -1, 'quarter')
+    """
+
+    def __init__(self, start_date, month_days, first_fiscal_year):
+        """
+        Args:
+            start_date (str | date): First day of the first fiscal year.
+            month_days (list): Number of days of each consecutive fiscal month, 12 per fiscal year. Months of an
+                incomplete last fiscal year are ignored.
+            first_fiscal_year (int): Fiscal year label of the first fiscal year.
+        """
+        num_years = len(month_days) // 12
+        month_days = np.asarray(month_days, dtype=np.int64)[:num_years * 12].reshape(num_years, 12)
+        year_days = month_days.sum(axis=1)
+
+        # start of every period as days since 1970-01-01
+        year_start_days = to_day_number(start_date) + np.cumsum(year_days) - year_days
+        month_start_days = (year_start_days[:, None] + np.cumsum(month_days, axis=1) - month_days).ravel()
+        self.year_weeks = year_days // 7
+        week_of_year = np.arange(self.year_weeks.sum()) - np.repeat(np.cumsum(self.year_weeks) - self.year_weeks,
+                                                                    self.year_weeks)
+        week_start_days = np.repeat(year_start_days, self.year_weeks) + week_of_year * 7
+
+        self.has_53_weeks = self.year_weeks == 53
+        self.year_labels = first_fiscal_year + np.arange(num_years, dtype=np.int64)
+        self.year_starts = year_start_days.astype('datetime64[D]')
+        self.season_starts = month_start_days.reshape(num_years, 12)[:, ::6].ravel().astype('datetime64[D]')
+        self.quarter_starts = month_start_days.reshape(num_years, 12)[:, ::3].ravel().astype('datetime64[D]')
+        self.month_starts = month_start_days.astype('datetime64[D]')
+        self.week_starts = week_start_days.astype('datetime64[D]')
+        self.end_date = np.datetime64(to_day_number(start_date) + int(year_days.sum()), 'D')
+
+        # fiscal year and number within the fiscal year (e.g. fiscal month 7) of every period
+        self._numbers = {
+            'year': np.ones(num_years, dtype=np.int64),
+            'season': np.tile(np.arange(1, 3), num_years),
+            'quarter': np.tile(np.arange(1, 5), num_years),
+            'month': np.tile(np.arange(1, 13), num_years),
+            'week': week_of_year + 1,
+        }
+        self._year_index = {
+            'year': np.arange(num_years),
+            'season': np.repeat(np.arange(num_years), 2),
+            'quarter': np.repeat(np.arange(num_years), 4),
+            'month': np.repeat(np.arange(num_years), 12),
+            'week': np.repeat(np.arange(num_years), self.year_weeks),
+        }
+        # number of periods of every fiscal year, and the position of its first period in the arrays of the level
+        self._year_periods = {level: np.full(num_years, count, dtype=np.int64)
+                              for level, count in [('year', 1), ('season', 2), ('quarter', 4), ('month', 12)]}
+        self._year_periods['week'] = self.year_weeks
+        self._first_position = {level: np.cumsum(counts) - counts for level, counts in self._year_periods.items()}
+
+    @classmethod
+    def from_layout(cls, start_date, end_date, pattern=DEFAULT_PATTERN):
+        """
+        Build the boundary index of the calendar starting at start_date, covering at least up to end_date.
+
+        Args:
+            start_date (str | date): First day of the first fiscal year.
+            end_date (str | date): Last day that needs to be covered.
+            pattern (str): Week pattern of the fiscal months, '4-4-5', '4-5-4' or '5-4-4' (default is '4-5-4').
+
+        Returns:
+            FiscalBoundaryIndex: The boundary index.
+        """
+        year_starts, year_weeks = year_layout(start_date, end_date)
+        month_days = np.array(pattern_month_weeks(pattern), dtype=np.int64)[np.array(year_weeks) - 52] * 7
+        first_fiscal_year = np.datetime64(year_starts[0], 'D').astype(object).year
+        return cls(start_date, month_days.ravel(), first_fiscal_year)
+
+    def starts(self, level):
+        """
+        Sorted start dates of every period of a level.
+
+        Args:
+            level (str): 'year', 'season', 'quarter', 'month' or 'week'.
+
+        Returns:
+            np.ndarray: datetime64[D] start dates.
+        """
+        return getattr(self, f'{_check_level(level)}_starts')
+
+    def ends(self, level):
+        """
+        End date (inclusive) of every period of a level.
+
+        Args:
+            level (str): 'year', 'season', 'quarter', 'month' or 'week'.
+
+        Returns:
+            np.ndarray: datetime64[D] end dates.
+        """
+        starts = self.starts(level)
+        return np.append(starts[1:], self.end_date) - np.timedelta64(1, 'D')
+
+    def fiscal_year(self, level):
+        """
+        Fiscal year of every period of a level e.g. 2024.
+        """
+        return self.year_labels[self._year_index[_check_level(level)]]
+
+    def number(self, level):
+        """
+        Number of every period within its fiscal year e.g. 1-53 for weeks, 1-12 for months and 1-2 for seasons.
+        """
+        return self._numbers[_check_level(level)]
+
+    def locate(self, dates, level):
+        """
+        Bucket dates into the periods of a level with np.searchsorted.
+
+        Args:
+            dates (np.ndarray | np.datetime64): Dates to bucket, datetime64 of any unit.
+            level (str): 'year', 'season', 'quarter', 'month' or 'week'.
+
+        Returns:
+            np.ndarray: Position of the period containing each date in the arrays of the level, -1 for dates outside
+            of the index.
+        """
+        dates = np.asarray(dates, dtype='datetime64[D]')
+        position = np.searchsorted(self.starts(level), dates, side='right') - 1
+        return np.where(dates < self.end_date, position, -1)
+
+    def periods_between(self, start_date, end_date, level):
+        """
+        Periods of a level that overlap the date range start_date to end_date (inclusive).
+
+        Args:
+            start_date (str | np.datetime64): First day of the range.
+            end_date (str | np.datetime64): Last day of the range.
+            level (str): 'year', 'season', 'quarter', 'month' or 'week'.
+
+        Returns:
+            slice: Positions of the periods in the arrays of the level.
+        """
+        starts = self.starts(level)
+        start_date, end_date = np.datetime64(start_date, 'D'), np.datetime64(end_date, 'D')
+        if start_date >= self.end_date:
+            return slice(len(starts), len(starts))
+        lower = max(int(np.searchsorted(starts, start_date, side='right')) - 1, 0)
+        upper = int(np.searchsorted(starts, end_date, side='right'))
+        return slice(lower, max(upper, lower))
+
+    def shift(self, dates, periods, level):
+        """
+        Shift dates by a number of fiscal periods of a level, e.g. the same day of the fiscal month 3 months back.
+
+        Every date keeps its day offset within its period, periods have whole weeks so the day of week is kept as well.
+        If the target period is shorter (a 4-week month after a 5-week month, a 52-week year after a 53-week year)
+        the date moves to the same day of week in the last week of the target period. The shift is a single array
+        operation on the period positions, independent of the number of dates.
+
+        Args:
+            dates (np.ndarray | np.datetime64): Dates to shift, datetime64 of any unit.
+            periods (np.ndarray | int): Number of periods to shift, negative values shift back. Arrays are aligned to
+                the dates.
+            level (str): 'year', 'season', 'quarter', 'month' or 'week'.
+
+        Returns:
+            np.ndarray: datetime64[D] shifted dates, NaT where a date or its shifted date is outside of the index.
+        """
+        days = np.asarray(dates, dtype='datetime64[D]').astype(np.int64)
+        starts = self.starts(level).astype(np.int64)
+        lengths = np.diff(starts, append=self.end_date.astype(np.int64))
+
+        # period position of every day of the index, a direct lookup instead of a binary search per date
+        day_positions = np.repeat(np.arange(len(starts)), lengths)
+        day_index = days - starts[0]
+        inside = (day_index >= 0) & (day_index < len(day_positions))
+        position = day_positions[np.where(inside, day_index, 0)]
+        target = position + np.asarray(periods, dtype=np.int64)
+        valid = inside & (target >= 0) & (target < len(starts))
+        target = np.where(valid, target, 0)
+
+        # day offset within the period, limited to the same day of week in the last week of the target period
+        offset = days - starts[position]
+        offset = np.minimum(offset, lengths[target] - 7 + offset % 7)
+        return np.where(valid, starts[target] + offset, np.iinfo(np.int64).min).astype('datetime64[D]')
+
+    def positions(self, level, fiscal_years, numbers=1):
+        """
+        Position of fiscal periods in the arrays of a level, the inverse of fiscal_year() and number().
+
+        Args:
+            level (str): 'year', 'season', 'quarter', 'month' or 'week'.
+            fiscal_years (np.ndarray | int): Fiscal year of every period e.g. 2024.
+            numbers (np.ndarray | int): Number of every period within its fiscal year e.g. 1-12 for months
+                (default is 1).
+
+        Returns:
+            np.ndarray: Position of every period, ValueError if a period is not in the index.
+        """
+        fiscal_years, numbers = np.broadcast_arrays(np.asarray(fiscal_years, dtype=np.int64),
+                                                    np.asarray(numbers, dtype=np.int64))
+        year_index = fiscal_years - self.year_labels[0]
+        valid = (year_index >= 0) & (year_index < len(self.year_labels))
+        year_index = np.where(valid, year_index, 0)
+        valid &= (numbers >= 1) & (numbers <= self._year_periods[_check_level(level)][year_index])
+        if not valid.all():
+            first_invalid = int(np.argmin(valid.ravel()))
+            raise ValueError(f"Fiscal {level} {numbers.ravel()[first_invalid]} of fiscal year "
+                             f"{fiscal_years.ravel()[first_invalid]} is not in the boundary index "
+                             f"{self.year_labels[0]} - {self.year_labels[-1]}")
+        return self._first_position[level][year_index] + numbers - 1
+
+    def period_ranges(self, level, keys):
+        """
+        Start and end dates of an array of fiscal period keys, without filtering the calendar.
+
+        Each key is looked up by direct indexing, so the cost per key does not depend on the size of the calendar.
+
+        Args:
+            level (str): 'year', 'season', 'quarter', 'month' or 'week'.
+            keys (np.ndarray | list): Integer keys, the fiscal year for 'year' and fiscal_year * 100 + number for
+                the other levels e.g. 202433 for fiscal week 2024W33, the keys of the typed dimension tables.
+
+        Returns:
+            dict: 'start_date' and 'end_date' (datetime64[D] arrays), 'number_of_days' and 'number_of_weeks' (int64
+            arrays), aligned to the keys.
+        """
+        keys = np.asarray(keys, dtype=np.int64)
+        if _check_level(level) == 'year':
+            position = self.positions(level, keys)
+        else:
+            position = self.positions(level, keys // 100, keys % 100)
+        start_dates = self.starts(level)[position]
+        end_dates = self.ends(level)[position]
+        number_of_days = (end_dates - start_dates).astype(np.int64) + 1
+        return {
+            'start_date': start_dates,
+            'end_date': end_dates,
+            'number_of_days': number_of_days,
+            'number_of_weeks': number_of_days // 7,
+        }
+
+
+def _check_level(level):
+    if level not in LEVELS:
+        raise ValueError(f"Unknown level '{level}', use one of {', '.join(LEVELS)}")
+    return level
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+# standard libraries
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+from fiscal_calendar.engine import FiscalCalendarEngine, to_day_number
+
+
+class CalendarCache:
+    """
+    Memory-bounded LRU cache of generated fiscal calendars, stored as one DataFrame fragment per fiscal year.
+
+    Fragments are keyed by the calendar configuration (start date and output mode) and the fiscal year, so any range
+    with the same start date is assembled from the fiscal years that are already cached and only the missing years are
+    generated. Once the fragments exceed max_bytes, the least recently used fragments are evicted.
+
+    Attributes:
+        - max_bytes (int): Memory budget of the cached fragments in bytes (default is 256 MiB).
+        - hits (int): Number of fiscal year fragments served from the cache.
+        - misses (int): Number of fiscal year fragments that had to be generated.
+        - evictions (int): Number of fiscal year fragments evicted to stay within the memory budget.
+
+    Usage:
+        from fiscal_calendar.cache import default_cache
+
+        fc = FiscalCalendarGenerator(start_date='2021-01-31', end_date='2025-02-01')
+        df_fiscal_calendar = fc.create_dataframe(cache=default_cache)
+        default_cache.stats()
+    """
+
+    def __init__(self, max_bytes: int = 256 * 2 ** 20):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.current_bytes = 0
+        self._fragments = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_dataframe(self, start_date, end_date, typed=False, columns=None):
+        """
+        Return the fiscal calendar for start_date to end_date, assembled from cached fiscal year fragments.
+
+        Args:
+            start_date (str): The start date of the fiscal calendar in the format 'yyyy-mm-dd'.
+            end_date (str): The end date of the fiscal calendar in the format 'yyyy-mm-dd'.
+            typed (bool, optional): If True, return compact typed columns instead of strings (default is False).
+            columns (list, optional): Columns to return, defaults to all columns. Fragments always hold all columns.
+
+        Returns:
+            pd.DataFrame: The same DataFrame as FiscalCalendarEngine(start_date, end_date).build(columns, typed=typed).
+        """
+        engine = FiscalCalendarEngine(start_date, end_date)
+        key = (to_day_number(start_date), typed)
+
+        lst_fragments = []
+        for year_index, (start_row, stop_row) in enumerate(engine.year_row_ranges()):
+            df_fragment = self._get((key, year_index))
+            if df_fragment is None:
+                # always cache complete fiscal years, so the fragment can be reused for any end date
+                year_end_row = int(engine.year_starts[year_index] - engine.start_day
+                                   + engine.year_weeks[year_index] * 7)
+                df_fragment = engine.build(start_row=start_row, stop_row=year_end_row, typed=typed)
+                self._put((key, year_index), df_fragment)
+            df_fragment = df_fragment.iloc[:stop_row - start_row]
+            lst_fragments.append(df_fragment if columns is None else df_fragment[columns])
+
+        if not lst_fragments:
+            return engine.build(columns=columns, typed=typed)
+        # concat copies the fragments, changes to the returned DataFrame do not affect the cache
+        return pd.concat(lst_fragments, ignore_index=True)
+
+    def stats(self):
+        """
+        Cache statistics.
+
+        Returns:
+            dict: hits, misses, evictions, fragments, bytes and max_bytes.
+        """
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                    'fragments': len(self._fragments), 'bytes': self.current_bytes, 'max_bytes': self.max_bytes}
+
+    def clear(self):
+        """
+        Remove all fragments and reset the statistics.
+        """
+        with self._lock:
+            self._fragments.clear()
+            self.current_bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def _get(self, key):
+        with self._lock:
+            entry = self._fragments.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._fragments.move_to_end(key)
+            return entry[0]
+
+    def _put(self, key, df_fragment):
+        size = int(df_fragment.memory_usage(index=False, deep=True).sum())
+        with self._lock:
+            if key in self._fragments:
+                self.current_bytes -= self._fragments.pop(key)[1]
+            self._fragments[key] = (df_fragment, size)
+            self.current_bytes += size
+            # evict least recently used fragments, the fragment just added is kept even if it exceeds the budget
+            while self.current_bytes > self.max_bytes and len(self._fragments) > 1:
+                _, (_, evicted_size) = self._fragments.popitem(last=False)
+                self.current_bytes -= evicted_size
+                self.evictions += 1
+
+
+# process level cache shared by all generators
+default_cache = CalendarCache()
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""
+Comparable sales alignment: last year (LY) and last last year (LLY) values of fact arrays, without merging a fact table
+with itself through the calendar.
+
+A fact array holds one value per row of the day-grain calendar (create_dataframe(), row 0 = start_date) or per row of
+the week-grain dimension table (create_week_dataframe()). The row of the LY and LLY equivalent of every row is
+precomputed once as an integer table, aligning any number of fact arrays is then a single gather per array.
+"""
+import numpy as np
+
+from fiscal_calendar.engine import fiscal_year_layout, to_day_number
+
+# grains of the fact arrays and the number of rows per fiscal week
+GRAINS = {'day': 7, 'week': 1}
+
+# handling of the 53rd week:
+# - 'shift': every row is compared with the row 52 weeks (364 days) earlier, the same rule as the last_year_equiv_*
+#   columns of the calendar. Week 53 is compared with week 1 of its own fiscal year and the weeks after a 53-week
+#   year with the week after their own week number.
+# - 'week_number': every row is compared with the same fiscal week number and day of week of the previous fiscal year.
+#   Week 53 has no equivalent, and week 53 of a 53-week year is never used as an equivalent.
+WEEK_53_POLICIES = ('shift', 'week_number')
+
+# number of weeks between a row and its equivalent per fiscal year back with the 'shift' policy
+SHIFT_WEEKS = 52
+
+
+class ComparableAlignment:
+    """
+    Precomputed LY and LLY row tables of the day and week grain of a fiscal calendar.
+
+    Attributes:
+        - start_date (str): The start date of the fiscal calendar in the format 'yyyy-mm-dd'.
+        - end_date (str): The end date of the fiscal calendar in the format 'yyyy-mm-dd'.
+        - week_53 (str): Handling of the 53rd week, 'shift' or 'week_number', see WEEK_53_POLICIES.
+        - num_rows (dict): Number of rows of the 'day' and 'week' grain.
+
+    Usage:
+        alignment = ComparableAlignment(start_date='2021-01-31', end_date='2025-02-01')
+        ly_sales, lly_sales = alignment.align(daily_sales, grain='day')
+        comp_growth = daily_sales / ly_sales - 1
+    """
+
+    def __init__(self, start_date, end_date, week_53='shift'):
+        if week_53 not in WEEK_53_POLICIES:
+            raise ValueError(f"Unknown 53rd week policy '{week_53}', use one of {', '.join(WEEK_53_POLICIES)}")
+        self.start_date = start_date
+        self.end_date = end_date
+        self.week_53 = week_53
+        _, year_weeks = fiscal_year_layout(start_date, end_date)
+        num_days = max(to_day_number(end_date) - to_day_number(start_date) + 1, 0)
+        # same rows as create_dataframe() and create_week_dataframe() (every week starting on or before end_date)
+        self.num_rows = {'day': num_days, 'week': (num_days + 6) // 7}
+        self._rows = {grain: {years_back: self._equivalent_rows(year_weeks, grain, years_back)
+                              for years_back in (1, 2)}
+                      for grain in GRAINS}
+
+    def _equivalent_rows(self, year_weeks, grain, years_back):
+        rows_per_week = GRAINS[grain]
+        num_rows = self.num_rows[grain]
+        rows = np.arange(num_rows)
+        if self.week_53 == 'shift':
+            equivalent_rows = rows - years_back * SHIFT_WEEKS * rows_per_week
+            return np.where(equivalent_rows >= 0, equivalent_rows, -1)
+
+        # same offset within the fiscal year years_back fiscal years earlier, if that fiscal year is long enough
+        year_rows = year_weeks * rows_per_week
+        year_first_row = np.cumsum(year_rows) - year_rows
+        year_index = np.repeat(np.arange(len(year_rows)), year_rows)[:num_rows]
+        offset = rows - year_first_row[year_index]
+        target_year = year_index - years_back
+        valid = target_year >= 0
+        target_year = np.where(valid, target_year, 0)
+        valid &= offset < year_rows[target_year]
+        return np.where(valid, year_first_row[target_year] + offset, -1)
+
+    def rows(self, grain='day', years_back=1):
+        """
+        Row of the equivalent of every row, years_back fiscal years earlier.
+
+        Args:
+            grain (str): 'day' or 'week' (default is 'day').
+            years_back (int): 1 for last year (LY), 2 for last last year (LLY) (default is 1).
+
+        Returns:
+            np.ndarray: Row of the equivalent, -1 for rows without an equivalent in the calendar.
+        """
+        if grain not in GRAINS:
+            raise ValueError(f"Unknown grain '{grain}', use one of {', '.join(GRAINS)}")
+        if years_back not in (1, 2):
+            raise ValueError(f"years_back must be 1 or 2, got {years_back}")
+        return self._rows[grain][years_back]
+
+    def align(self, values, grain='day', fill_value=np.nan):
+        """
+        LY and LLY aligned values of a fact array.
+
+        Args:
+            values (np.ndarray | pd.Series): One value per row of the grain, along the first axis, e.g. daily sales of
+                shape (num_days,) or (num_days, num_stores).
+            grain (str): 'day' or 'week' (default is 'day').
+            fill_value (scalar): Value of rows without an equivalent in the calendar (default is np.nan).
+
+        Returns:
+            tuple: (ly_values, lly_values), arrays of the shape of values.
+        """
+        ly_rows, lly_rows = self.rows(grain, 1), self.rows(grain, 2)
+        values = np.asarray(values)
+        if len(values) != len(ly_rows):
+            raise ValueError(f"Expected {len(ly_rows)} values for the {grain} grain, got {len(values)}")
+        return _gather(values, ly_rows, fill_value), _gather(values, lly_rows, fill_value)
+
+
+def _gather(values, rows, fill_value):
+    # rows without an equivalent read row 0 and are replaced by fill_value
+    valid = (rows >= 0).reshape((-1,) + (1,) * (values.ndim - 1))
+    return np.where(valid, values[np.maximum(rows, 0)], fill_value)
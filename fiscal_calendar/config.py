@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""
+Immutable configuration of a fiscal calendar.
+
+A FiscalCalendarConfig is a validated, hashable tuple of the start date, end date and week pattern. It can be shared
+freely between threads and used as a dictionary key, fiscal_calendar.create_calendar() builds the calendar of a
+configuration without keeping any state between calls.
+"""
+# standard libraries
+from collections import namedtuple
+from datetime import datetime
+
+from fiscal_calendar.core import DEFAULT_PATTERN, pattern_month_weeks
+
+DATE_FORMAT = '%Y-%m-%d'
+
+
+class FiscalCalendarConfig(namedtuple('FiscalCalendarConfig', ['start_date', 'end_date', 'pattern'])):
+    """
+    Immutable configuration of a fiscal calendar.
+
+    Attributes:
+        - start_date (str): The start date of the fiscal calendar in the format 'yyyy-mm-dd'.
+        - end_date (str): The end date of the fiscal calendar in the format 'yyyy-mm-dd'.
+        - pattern (str): Week pattern of the fiscal months, '4-4-5', '4-5-4' or '5-4-4' (default is '4-5-4').
+
+    Usage:
+        config = FiscalCalendarConfig(start_date='2021-01-31', end_date='2025-02-01')
+
+        # every worker thread builds from the same configuration, nothing is shared but the tuple
+        df_fiscal_calendar = create_calendar(config, columns=['day_date', 'fiscal_week_iso_code'])
+    """
+    __slots__ = ()
+
+    def __new__(cls, start_date, end_date, pattern=DEFAULT_PATTERN):
+        # validate once, every calendar built from the configuration can then rely on it
+        for value in (start_date, end_date):
+            datetime.strptime(value, DATE_FORMAT)
+        pattern_month_weeks(pattern)
+        return super().__new__(cls, start_date, end_date, pattern)
+
+    @property
+    def supports_vectorized_engine(self):
+        """
+        True if the vectorized engine can build the calendar, which treats the start date as the first day of fiscal
+        month 1 of a 4-5-4 calendar, i.e. for start dates in January and the 4-5-4 pattern.
+        """
+        return datetime.strptime(self.start_date, DATE_FORMAT).month == 1 and self.pattern == DEFAULT_PATTERN
@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+"""
+Standard library core of the fiscal calendar: constants, the fiscal year layout and the date helpers shared by every
+engine.
+
+This module imports nothing outside the standard library, so resolving single dates (fiscal_calendar.resolver) does
+not load NumPy or pandas. fiscal_calendar.engine provides the NumPy forms of these tables and functions.
+"""
+# standard libraries
+import calendar
+from datetime import date, datetime, timedelta
+
+# number of weeks of the three fiscal months of every quarter, per supported week pattern
+WEEK_PATTERNS = {'4-4-5': (4, 4, 5), '4-5-4': (4, 5, 4), '5-4-4': (5, 4, 4)}
+DEFAULT_PATTERN = '4-5-4'
+
+
+def pattern_month_weeks(pattern=DEFAULT_PATTERN):
+    """
+    Number of weeks of fiscal month 1 to 12 of a week pattern, for fiscal years of 52 and 53 weeks.
+
+    Args:
+        pattern (str): '4-4-5', '4-5-4' or '5-4-4' (default is '4-5-4').
+
+    Returns:
+        tuple: (weeks of a 52-week year, weeks of a 53-week year), 12 values each. The 53rd week is appended to fiscal
+        month 12.
+    """
+    if pattern not in WEEK_PATTERNS:
+        raise ValueError(f"Unknown week pattern '{pattern}', use one of {', '.join(WEEK_PATTERNS)}")
+    year_weeks = WEEK_PATTERNS[pattern] * 4
+    return year_weeks, year_weeks[:11] + (year_weeks[11] + 1,)
+
+
+# number of weeks in each fiscal month of the 4-5-4 schema, the 53rd week (if any) is appended to month 12
+MONTH_WEEKS = pattern_month_weeks()[0]
+
+# zero-based fiscal week of year at which each fiscal month starts e.g. (0, 4, 9, 13, ...)
+MONTH_FIRST_WEEK = tuple(sum(MONTH_WEEKS[:month]) for month in range(12))
+
+# fiscal month (1-12) for each zero-based fiscal week of year, the 53rd week (index 52) belongs to month 12
+WEEK_TO_MONTH = tuple(month for month, weeks in enumerate(MONTH_WEEKS, start=1) for _ in range(weeks)) + (12,)
+
+# day names indexed by day of week with sunday = 0
+DAY_NAMES = ('SUNDAY', 'MONDAY', 'TUESDAY', 'WEDNESDAY', 'THURSDAY', 'FRIDAY', 'SATURDAY')
+DAY_SHORT_NAMES = ('SUN', 'MON', 'TUE', 'WED', 'THU', 'FRI', 'SAT')
+DAY_LETTERS = ('U', 'M', 'T', 'W', 'H', 'F', 'S')
+SEASON_NAMES = ('SPRING', 'FALL')
+MONTH_NAMES = ['January', 'February', 'March', 'April', 'May', 'June', 'July', 'August', 'September', 'October',
+               'November', 'December']
+
+# period levels of the inverse lookup from coarse to fine, and the letter of their keys e.g. '2024M07'
+PERIOD_LEVELS = ('year', 'season', 'quarter', 'month', 'week')
+PERIOD_KEY_LETTERS = {'S': 'season', 'Q': 'quarter', 'M': 'month', 'W': 'week'}
+
+# ordinal of 1970-01-01, day numbers used by the engines are days since this date
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+# days between a date and its last year / prior year equivalent (52 and 104 weeks)
+LAST_YEAR_DAYS = 364
+PRIOR_YEAR_DAYS = 364 * 2
+
+# output columns of create_dataframe() in order
+COLUMNS = (
+    'time_day_id_pk', 'day_date', 'day_of_week_short_name', 'day_of_week_name', 'day_of_week_letter',
+    'fiscal_day_of_week', 'fiscal_week_of_year', 'fiscal_week_of_season', 'fiscal_week_of_quarter',
+    'fiscal_week_of_month', 'fiscal_week_start_date', 'fiscal_week_end_date', 'fiscal_week_iso_code',
+    'fiscal_month_of_year', 'fiscal_month_of_season', 'fiscal_month_of_quarter', 'fiscal_month_name',
+    'fiscal_month_short_name', 'fiscal_month_start_date', 'fiscal_month_end_date', 'fiscal_month_number_of_weeks',
+    'fiscal_month_number_of_days', 'fiscal_quarter_of_year', 'fiscal_quarter_of_year_str', 'fiscal_quarter_of_season',
+    'fiscal_season_of_year', 'fiscal_season_name', 'fiscal_year', 'fiscal_year_2_digit', 'fiscal_year_start_date',
+    'fiscal_year_end_date', 'fiscal_year_number_of_weeks', 'fiscal_year_number_of_days', 'last_year_equiv_day_fk',
+    'last_year_equiv_week_fk', 'last_year_equiv_day_date', 'last_year_fiscal_year', 'last_year_fiscal_month_of_year',
+    'prior_year_from_last_year_equiv_day_fk', 'prior_year_from_last_year_equiv_day_date', 'time_fiscal_week_id_fk',
+    'first_fiscal_week_of_fiscal_month_ind', 'last_fiscal_week_of_fiscal_month_ind', 'time_day_id_pk_int',
+)
+
+
+def to_day_number(value):
+    """
+    Convert a date-like value to the number of days since 1970-01-01.
+
+    Args:
+        value (str | date | datetime | np.datetime64 | pd.Timestamp): Date, strings use the format 'yyyy-mm-dd'.
+
+    Returns:
+        int: Number of days since the unix epoch.
+    """
+    if isinstance(value, str):
+        value = datetime.strptime(value, "%Y-%m-%d")
+    if isinstance(value, datetime):
+        value = value.date()
+    if isinstance(value, date):
+        return value.toordinal() - _EPOCH_ORDINAL
+    # only np.datetime64 values get here, so numpy is already loaded by the caller
+    import numpy as np
+    return int(np.datetime64(value, 'D').astype(np.int64))
+
+
+def has_53_weeks(fiscal_year_start):
+    """
+    Determine if the fiscal year starting on the provided day has a 53rd week.
+
+    A fiscal year gets an additional week (+7 days) when its 364th day falls 4 or more days away from January 31st,
+    the same rule as applied by FiscalCalendarGenerator.delta_days().
+
+    Args:
+        fiscal_year_start (int): Start of the fiscal year as number of days since 1970-01-01.
+
+    Returns:
+        bool: True if the fiscal year has 53 weeks (371 days), False if it has 52 weeks (364 days).
+    """
+    start = date.fromordinal(fiscal_year_start + _EPOCH_ORDINAL)
+    jan_end_date = date(start.year + 1, 1, 31)
+    return abs((start + timedelta(days=364 - 1)) - jan_end_date).days >= 4
+
+
+def year_layout(start_date, end_date):
+    """
+    Calculate the start day and number of weeks of each fiscal year covering the range start_date to end_date.
+
+    Each fiscal year begins the day after the previous one ends, so only the 52/53 week decision is evaluated per
+    year. All other fiscal attributes are derived from the day offset relative to these start days.
+
+    Args:
+        start_date (str | date): First day of the first fiscal year.
+        end_date (str | date): Last day that needs to be covered.
+
+    Returns:
+        tuple: (year_starts, year_weeks) as lists of int, year_starts in days since 1970-01-01.
+    """
+    year_start = to_day_number(start_date)
+    last_day = to_day_number(end_date)
+    lst_starts, lst_weeks = [], []
+    # always create the first fiscal year, even if the range is empty
+    while not lst_starts or year_start <= last_day:
+        num_weeks = 53 if has_53_weeks(year_start) else 52
+        lst_starts.append(year_start)
+        lst_weeks.append(num_weeks)
+        year_start += num_weeks * 7
+    return lst_starts, lst_weeks
+
+
+def fiscal_month_names(start_date):
+    """
+    Return the month names for fiscal month 1 to 12.
+
+    If the start date is within the last 5 days of its month, the first fiscal month is named after the next
+    calendar month (e.g. a fiscal year starting 01/31 begins with 'February'), the same rule as applied by
+    FiscalCalendarGenerator.check_and_shift_start_date().
+
+    Args:
+        start_date (str | date): The start date of the fiscal calendar.
+
+    Returns:
+        list: 12 month names, index 0 being fiscal month 1.
+    """
+    start = date.fromordinal(to_day_number(start_date) + _EPOCH_ORDINAL)
+    shift = 1 if start.day > calendar.monthrange(start.year, start.month)[1] - 5 else 0
+    return MONTH_NAMES[shift:] + MONTH_NAMES[:shift]
+
+
+def parse_period_key(key):
+    """
+    Split a fiscal period key into its level, fiscal year and number within the fiscal year.
+
+    Keys are the fiscal year ('2024' or 2024) or the fiscal year, a level letter and the number e.g. '2024S2',
+    '2024Q3', '2024M07' or '2024W33', the same format as the fiscal_week_iso_code column.
+
+    Args:
+        key (str | int): The period key.
+
+    Returns:
+        tuple: (level, fiscal_year, number), number is 1 for fiscal years.
+    """
+    key = str(key).strip().upper()
+    if key.isdigit():
+        return 'year', int(key), 1
+    year, letter, number = key[:4], key[4:5], key[5:]
+    if not (year.isdigit() and number.isdigit() and letter in PERIOD_KEY_LETTERS):
+        raise ValueError(f"Invalid fiscal period key '{key}', use e.g. '2024', '2024S2', '2024Q3', '2024M07' or "
+                         f"'2024W33'")
+    return PERIOD_KEY_LETTERS[letter], int(year), int(number)
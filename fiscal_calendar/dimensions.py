@@ -0,0 +1,276 @@
+# -*- coding: utf-8 -*-
+"""
+Week-grain and month-grain dimension tables (dim_fiscal_week and dim_fiscal_month), built directly from the fiscal
+year layout instead of deduplicating the day-grain calendar of create_dataframe().
+
+Columns shared with create_dataframe() have the same name and, for typed tables, the same dtype. Unlike the
+fiscal_month_start_date and fiscal_month_end_date columns of the day-grain calendar, which repeat the first date of the
+calendar, the dimension tables carry the actual first and last day of every fiscal week and month.
+"""
+import numpy as np
+import pandas as pd
+
+from fiscal_calendar.engine import (MONTH_FIRST_WEEK, MONTH_WEEKS, SEASON_NAMES, WEEK_TO_MONTH, fiscal_month_names,
+                                    fiscal_year_layout, format_dates, to_day_number)
+
+# number of weeks per fiscal year of the last year and prior year equivalents (52 weeks = 364 days per year back)
+LAST_YEAR_WEEKS = 52
+
+# output columns of build_week_dimension() in order
+WEEK_COLUMNS = (
+    'time_fiscal_week_id_pk', 'fiscal_week_iso_code', 'fiscal_week_of_year', 'fiscal_week_of_season',
+    'fiscal_week_of_quarter', 'fiscal_week_of_month', 'fiscal_week_start_date', 'fiscal_week_end_date',
+    'fiscal_week_number_of_days', 'fiscal_month_of_year', 'fiscal_month_name', 'fiscal_month_short_name',
+    'fiscal_month_number_of_weeks', 'fiscal_quarter_of_year', 'fiscal_quarter_of_year_str', 'fiscal_season_of_year',
+    'fiscal_season_name', 'fiscal_year', 'fiscal_year_2_digit', 'fiscal_year_start_date', 'fiscal_year_end_date',
+    'fiscal_year_number_of_weeks', 'last_year_equiv_week_fk', 'last_year_fiscal_year',
+    'last_year_fiscal_month_of_year', 'prior_year_from_last_year_equiv_week_fk', 'time_fiscal_month_id_fk',
+    'first_fiscal_week_of_fiscal_month_ind', 'last_fiscal_week_of_fiscal_month_ind',
+    'first_fiscal_week_of_fiscal_year_ind', 'last_fiscal_week_of_fiscal_year_ind',
+)
+
+# output columns of build_month_dimension() in order
+MONTH_COLUMNS = (
+    'time_fiscal_month_id_pk', 'fiscal_month_iso_code', 'fiscal_month_of_year', 'fiscal_month_of_season',
+    'fiscal_month_of_quarter', 'fiscal_month_name', 'fiscal_month_short_name', 'fiscal_month_start_date',
+    'fiscal_month_end_date', 'fiscal_month_number_of_weeks', 'fiscal_month_number_of_days', 'first_fiscal_week_fk',
+    'last_fiscal_week_fk', 'fiscal_quarter_of_year', 'fiscal_quarter_of_year_str', 'fiscal_quarter_of_season',
+    'fiscal_season_of_year', 'fiscal_season_name', 'fiscal_year', 'fiscal_year_2_digit', 'fiscal_year_start_date',
+    'fiscal_year_end_date', 'fiscal_year_number_of_weeks', 'last_year_equiv_month_fk', 'last_year_fiscal_year',
+    'prior_year_from_last_year_equiv_month_fk', 'first_fiscal_month_of_fiscal_quarter_ind',
+    'last_fiscal_month_of_fiscal_quarter_ind', 'first_fiscal_month_of_fiscal_year_ind',
+    'last_fiscal_month_of_fiscal_year_ind',
+)
+
+
+class _Formatter:
+    """
+    Formats integer arrays as the string columns of create_dataframe() or as the typed columns of
+    create_dataframe(typed=True).
+    """
+
+    def __init__(self, typed):
+        self.typed = typed
+
+    def dates(self, days):
+        if self.typed:
+            return np.asarray(days, dtype=np.int64).astype('datetime64[D]')
+        return format_dates(days, '%m/%d/%Y')
+
+    def week_keys(self, years, weeks):
+        # '2024W07' or 202407
+        if self.typed:
+            return (years * 100 + weeks).astype(np.int32)
+        return np.array([f'{year}W{week:02d}' for year, week in zip(years.tolist(), weeks.tolist())], dtype=object)
+
+    def month_keys(self, years, months):
+        # '2024M07' or 202407
+        if self.typed:
+            return (years * 100 + months).astype(np.int32)
+        return np.array([f'{year}M{month:02d}' for year, month in zip(years.tolist(), months.tolist())], dtype=object)
+
+    def names(self, codes, categories):
+        if self.typed:
+            return pd.Categorical.from_codes(codes, categories=list(categories), ordered=True)
+        return np.asarray(categories, dtype=object)[codes]
+
+    def small(self, values):
+        # counters, numbers within the fiscal year and indicators
+        return np.asarray(values).astype(np.int8 if self.typed else np.int64)
+
+    def wide(self, values):
+        # day counts and years
+        return np.asarray(values).astype(np.int16 if self.typed else np.int64)
+
+    def years(self, values):
+        if self.typed:
+            return values.astype(np.int16)
+        return values.astype(str).astype(object)
+
+    def two_digit_years(self, values):
+        if self.typed:
+            return (values % 100).astype(np.int8)
+        return np.array([str(year)[-2:] for year in values.tolist()], dtype=object)
+
+
+class _Layout:
+    """
+    Fiscal years covering start_date to end_date, with the number of every week and month of the dimension tables.
+    """
+
+    def __init__(self, start_date, end_date):
+        start_day = to_day_number(start_date)
+        if np.datetime64(start_day, 'D').astype(object).month != 1:
+            raise ValueError(f"Dimension tables require a start date in January, got {start_date}")
+        self.end_day = to_day_number(end_date)
+        self.year_starts, self.year_weeks = fiscal_year_layout(start_date, end_date)
+        self.first_fiscal_year = np.datetime64(start_day, 'D').astype(object).year
+        self.month_names = fiscal_month_names(start_date)
+
+    @property
+    def year_labels(self):
+        return self.first_fiscal_year + np.arange(len(self.year_starts), dtype=np.int64)
+
+    def month_weeks(self, year_index, month):
+        # the 53rd week is appended to fiscal month 12
+        return MONTH_WEEKS[month - 1] + ((month == 12) & (self.year_weeks[year_index] == 53))
+
+
+def _equivalent_rows(num_rows, rows_per_year, years_back):
+    """
+    Row of the equivalent period a number of fiscal years back, and the number of fiscal years to move the label of
+    rows that have no equivalent row in the table (the first years_back * rows_per_year rows), same rules as
+    FiscalCalendarGenerator.equivalent_year_keys().
+    """
+    rows = np.arange(num_rows)
+    shift = rows_per_year * years_back
+    has_equivalent = rows >= shift
+    equivalent_rows = np.where(has_equivalent, rows - shift, rows % rows_per_year)
+    missing_years = np.where(has_equivalent, 0, years_back - rows // rows_per_year)
+    return equivalent_rows, missing_years
+
+
+def build_week_dimension(start_date, end_date, typed=False):
+    """
+    Build the week-grain dimension table, one row per fiscal week starting on or before end_date.
+
+    Args:
+        start_date (str): The start date of the fiscal calendar in the format 'yyyy-mm-dd', in January.
+        end_date (str): The end date of the fiscal calendar in the format 'yyyy-mm-dd'.
+        typed (bool, optional): If True, return compact typed columns like create_dataframe(typed=True), with week keys
+            as int32 yyyyww and month keys as int32 yyyymm (default is False).
+
+    Returns:
+        pd.DataFrame: Columns of WEEK_COLUMNS.
+
+    The last year equivalent week is always 52 weeks back, like the last_year_equiv_week_fk column of the day-grain
+    calendar: week 53 of a 53-week year is equivalent to week 1 of the same fiscal year, and the weeks of the first
+    fiscal year refer to the same week of the previous fiscal year.
+    """
+    layout = _Layout(start_date, end_date)
+    fmt = _Formatter(typed)
+
+    # every week of every fiscal year, cut off after the week containing end_date
+    year_index = np.repeat(np.arange(len(layout.year_starts)), layout.year_weeks)
+    week_index = np.arange(len(year_index)) - np.repeat(np.cumsum(layout.year_weeks) - layout.year_weeks,
+                                                        layout.year_weeks)
+    week_starts = layout.year_starts[year_index] + week_index * 7
+    keep = week_starts <= layout.end_day
+    year_index, week_index, week_starts = year_index[keep], week_index[keep], week_starts[keep]
+
+    year_labels = layout.year_labels[year_index]
+    week = week_index + 1
+    month = WEEK_TO_MONTH[week_index]
+    quarter = np.minimum(week_index // 13, 3) + 1
+    season = np.where(quarter <= 2, 1, 2)
+    month_weeks = layout.month_weeks(year_index, month)
+    week_of_month = week_index - MONTH_FIRST_WEEK[month - 1] + 1
+    year_weeks = layout.year_weeks[year_index]
+
+    ly_rows, ly_missing = _equivalent_rows(len(week), LAST_YEAR_WEEKS, 1)
+    py_rows, py_missing = _equivalent_rows(len(week), LAST_YEAR_WEEKS, 2)
+    week_keys = fmt.week_keys(year_labels, week)
+
+    data = {
+        'time_fiscal_week_id_pk': week_keys,
+        'fiscal_week_iso_code': week_keys.copy(),
+        'fiscal_week_of_year': fmt.small(week),
+        'fiscal_week_of_season': fmt.small(np.where(week <= 26, week, week - 26)),
+        'fiscal_week_of_quarter': fmt.small(week - 13 * (quarter - 1)),
+        'fiscal_week_of_month': fmt.small(week_of_month),
+        'fiscal_week_start_date': fmt.dates(week_starts),
+        'fiscal_week_end_date': fmt.dates(week_starts + 6),
+        'fiscal_week_number_of_days': fmt.small(np.full(len(week), 7)),
+        'fiscal_month_of_year': fmt.small(month),
+        'fiscal_month_name': fmt.names(month - 1, layout.month_names),
+        'fiscal_month_short_name': fmt.names(month - 1, [name[0:3] for name in layout.month_names]),
+        'fiscal_month_number_of_weeks': fmt.small(month_weeks),
+        'fiscal_quarter_of_year': fmt.small(quarter),
+        'fiscal_quarter_of_year_str': fmt.names(quarter - 1, ['Q1', 'Q2', 'Q3', 'Q4']),
+        'fiscal_season_of_year': fmt.small(season),
+        'fiscal_season_name': fmt.names(season - 1, SEASON_NAMES),
+        'fiscal_year': fmt.years(year_labels),
+        'fiscal_year_2_digit': fmt.two_digit_years(year_labels),
+        'fiscal_year_start_date': fmt.dates(layout.year_starts[year_index]),
+        'fiscal_year_end_date': fmt.dates(layout.year_starts[year_index] + year_weeks * 7 - 1),
+        'fiscal_year_number_of_weeks': fmt.small(year_weeks),
+        'last_year_equiv_week_fk': fmt.week_keys(year_labels[ly_rows] - ly_missing, week[ly_rows]),
+        'last_year_fiscal_year': fmt.wide(year_labels - 1),
+        'last_year_fiscal_month_of_year': fmt.small(month[ly_rows]),
+        'prior_year_from_last_year_equiv_week_fk': fmt.week_keys(year_labels[py_rows] - py_missing, week[py_rows]),
+        'time_fiscal_month_id_fk': fmt.month_keys(year_labels, month),
+        'first_fiscal_week_of_fiscal_month_ind': fmt.small(week_of_month == 1),
+        'last_fiscal_week_of_fiscal_month_ind': fmt.small(week_of_month == month_weeks),
+        'first_fiscal_week_of_fiscal_year_ind': fmt.small(week == 1),
+        'last_fiscal_week_of_fiscal_year_ind': fmt.small(week == year_weeks),
+    }
+    return pd.DataFrame(data, copy=False)
+
+
+def build_month_dimension(start_date, end_date, typed=False):
+    """
+    Build the month-grain dimension table, one row per fiscal month starting on or before end_date.
+
+    Args:
+        start_date (str): The start date of the fiscal calendar in the format 'yyyy-mm-dd', in January.
+        end_date (str): The end date of the fiscal calendar in the format 'yyyy-mm-dd'.
+        typed (bool, optional): If True, return compact typed columns like create_dataframe(typed=True), with week keys
+            as int32 yyyyww and month keys as int32 yyyymm (default is False).
+
+    Returns:
+        pd.DataFrame: Columns of MONTH_COLUMNS.
+
+    The last year and prior year equivalent months are the same fiscal month one and two fiscal years back.
+    """
+    layout = _Layout(start_date, end_date)
+    fmt = _Formatter(typed)
+
+    # every month of every fiscal year, cut off after the month containing end_date
+    year_index = np.repeat(np.arange(len(layout.year_starts)), 12)
+    month = np.tile(np.arange(1, 13), len(layout.year_starts))
+    month_weeks = layout.month_weeks(year_index, month)
+    month_starts = layout.year_starts[year_index] + MONTH_FIRST_WEEK[month - 1] * 7
+    keep = month_starts <= layout.end_day
+    year_index, month, month_weeks, month_starts = year_index[keep], month[keep], month_weeks[keep], month_starts[keep]
+
+    year_labels = layout.year_labels[year_index]
+    quarter = (month - 1) // 3 + 1
+    season = np.where(quarter <= 2, 1, 2)
+    month_of_quarter = (month - 1) % 3 + 1
+    first_week = MONTH_FIRST_WEEK[month - 1] + 1
+    year_weeks = layout.year_weeks[year_index]
+    month_keys = fmt.month_keys(year_labels, month)
+
+    data = {
+        'time_fiscal_month_id_pk': month_keys,
+        'fiscal_month_iso_code': month_keys.copy(),
+        'fiscal_month_of_year': fmt.small(month),
+        'fiscal_month_of_season': fmt.small(np.where(month <= 6, month, month - 6)),
+        'fiscal_month_of_quarter': fmt.small(month_of_quarter),
+        'fiscal_month_name': fmt.names(month - 1, layout.month_names),
+        'fiscal_month_short_name': fmt.names(month - 1, [name[0:3] for name in layout.month_names]),
+        'fiscal_month_start_date': fmt.dates(month_starts),
+        'fiscal_month_end_date': fmt.dates(month_starts + month_weeks * 7 - 1),
+        'fiscal_month_number_of_weeks': fmt.small(month_weeks),
+        'fiscal_month_number_of_days': fmt.wide(month_weeks * 7),
+        'first_fiscal_week_fk': fmt.week_keys(year_labels, first_week),
+        'last_fiscal_week_fk': fmt.week_keys(year_labels, first_week + month_weeks - 1),
+        'fiscal_quarter_of_year': fmt.small(quarter),
+        'fiscal_quarter_of_year_str': fmt.names(quarter - 1, ['Q1', 'Q2', 'Q3', 'Q4']),
+        'fiscal_quarter_of_season': fmt.small(np.where(quarter <= 2, quarter, quarter - 2)),
+        'fiscal_season_of_year': fmt.small(season),
+        'fiscal_season_name': fmt.names(season - 1, SEASON_NAMES),
+        'fiscal_year': fmt.years(year_labels),
+        'fiscal_year_2_digit': fmt.two_digit_years(year_labels),
+        'fiscal_year_start_date': fmt.dates(layout.year_starts[year_index]),
+        'fiscal_year_end_date': fmt.dates(layout.year_starts[year_index] + year_weeks * 7 - 1),
+        'fiscal_year_number_of_weeks': fmt.small(year_weeks),
+        'last_year_equiv_month_fk': fmt.month_keys(year_labels - 1, month),
+        'last_year_fiscal_year': fmt.wide(year_labels - 1),
+        'prior_year_from_last_year_equiv_month_fk': fmt.month_keys(year_labels - 2, month),
+        'first_fiscal_month_of_fiscal_quarter_ind': fmt.small(month_of_quarter == 1),
+        'last_fiscal_month_of_fiscal_quarter_ind': fmt.small(month_of_quarter == 3),
+        'first_fiscal_month_of_fiscal_year_ind': fmt.small(month == 1),
+        'last_fiscal_month_of_fiscal_year_ind': fmt.small(month == 12),
+    }
+    return pd.DataFrame(data, copy=False)
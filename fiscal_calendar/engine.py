@@ -0,0 +1,680 @@
+# -*- coding: utf-8 -*-
+# standard libraries
+from datetime import date
+from functools import cached_property
+
+import numpy as np
+import pandas as pd
+
+# constants and scalar helpers of the standard library core, re-exported as part of the engine module
+from fiscal_calendar import core
+from fiscal_calendar.core import (COLUMNS, DEFAULT_PATTERN, LAST_YEAR_DAYS, MONTH_NAMES, PRIOR_YEAR_DAYS,
+                                  WEEK_PATTERNS, _EPOCH_ORDINAL, fiscal_month_names, has_53_weeks, to_day_number)
+from fiscal_calendar.instrumentation import run_stage
+
+
+def month_weeks_table(pattern=DEFAULT_PATTERN):
+    """
+    Number of weeks of fiscal month 1 to 12 of a week pattern, for fiscal years of 52 and 53 weeks.
+
+    Args:
+        pattern (str): '4-4-5', '4-5-4' or '5-4-4' (default is '4-5-4').
+
+    Returns:
+        np.ndarray: int64 array of shape (2, 12), row 0 for 52-week years and row 1 for 53-week years, which have the
+        53rd week appended to fiscal month 12. The month layout of a fiscal year is table[has_53_weeks].
+    """
+    return np.array(core.pattern_month_weeks(pattern), dtype=np.int64)
+
+
+# NumPy forms of the lookup tables of fiscal_calendar.core, indexed with arrays of weeks, months and days
+MONTH_WEEKS = np.array(core.MONTH_WEEKS, dtype=np.int64)
+MONTH_FIRST_WEEK = np.array(core.MONTH_FIRST_WEEK, dtype=np.int64)
+WEEK_TO_MONTH = np.array(core.WEEK_TO_MONTH, dtype=np.int64)
+DAY_NAMES = np.array(core.DAY_NAMES, dtype=object)
+DAY_SHORT_NAMES = np.array(core.DAY_SHORT_NAMES, dtype=object)
+DAY_LETTERS = np.array(core.DAY_LETTERS, dtype=object)
+SEASON_NAMES = np.array(core.SEASON_NAMES, dtype=object)
+
+
+def fiscal_year_layout(start_date, end_date):
+    """
+    Calculate the start day and number of weeks of each fiscal year covering the range start_date to end_date, see
+    fiscal_calendar.core.year_layout().
+
+    Args:
+        start_date (str | date): First day of the first fiscal year.
+        end_date (str | date): Last day that needs to be covered.
+
+    Returns:
+        tuple: (year_starts, year_weeks) as int64 arrays, year_starts in days since 1970-01-01.
+    """
+    year_starts, year_weeks = core.year_layout(start_date, end_date)
+    return np.array(year_starts, dtype=np.int64), np.array(year_weeks, dtype=np.int64)
+
+
+def format_dates(days, fmt):
+    """
+    Vectorized formatting of day numbers to strings.
+
+    Args:
+        days (np.ndarray): Days since 1970-01-01.
+        fmt (str): Either '%m/%d/%Y' or '%Y%m%d', the only two date formats used by the fiscal calendar.
+
+    Returns:
+        np.ndarray: Object array of Python strings.
+    """
+    # numpy renders datetime64[D] as 'yyyy-mm-dd', rearrange the characters instead of calling strftime per value
+    chars = np.asarray(days, dtype=np.int64).astype('datetime64[D]').astype('U10').view('U1').reshape(-1, 10)
+    if fmt == '%m/%d/%Y':
+        out = np.empty((len(chars), 10), dtype='U1')
+        out[:, 0:2] = chars[:, 5:7]
+        out[:, 2] = '/'
+        out[:, 3:5] = chars[:, 8:10]
+        out[:, 5] = '/'
+        out[:, 6:10] = chars[:, 0:4]
+        return out.view('U10').ravel().astype(object)
+    if fmt == '%Y%m%d':
+        return np.ascontiguousarray(chars[:, [0, 1, 2, 3, 5, 6, 8, 9]]).view('U8').ravel().astype(object)
+    raise ValueError(f"Unsupported date format '{fmt}'")
+
+
+def day_keys(days):
+    """
+    Vectorized conversion of day numbers to integer keys in the format yyyymmdd.
+
+    Args:
+        days (np.ndarray): Days since 1970-01-01.
+
+    Returns:
+        np.ndarray: int64 array e.g. 20240204.
+    """
+    dates = np.asarray(days, dtype=np.int64).astype('datetime64[D]')
+    months = dates.astype('datetime64[M]')
+    year = months.astype(np.int64) // 12 + 1970
+    month = months.astype(np.int64) % 12 + 1
+    day = (dates - months.astype('datetime64[D]')).astype(np.int64) + 1
+    return year * 10000 + month * 100 + day
+
+
+class FiscalCalendarEngine:
+    """
+    Vectorized engine that derives every column of FiscalCalendarGenerator.create_dataframe() with NumPy integer
+    arithmetic.
+
+    The fiscal year layout (start day and 52/53 weeks per year) is computed once. For every day the offset relative
+    to the start of its fiscal year determines the fiscal week, month, quarter and season, after which all other
+    columns are simple lookups.
+
+    Attributes:
+        - start_date (str): The start date of the fiscal calendar in the format 'yyyy-mm-dd'.
+        - end_date (str): The end date of the fiscal calendar in the format 'yyyy-mm-dd'.
+
+    Usage:
+        engine = FiscalCalendarEngine(start_date='2021-01-31', end_date='2025-02-01')
+        df_fiscal_calendar = engine.build()
+    """
+
+    def __init__(self, start_date, end_date):
+        self.start_date = start_date
+        self.end_date = end_date
+        self.start_day = to_day_number(start_date)
+        self.end_day = to_day_number(end_date)
+        self.num_rows = max(self.end_day - self.start_day + 1, 0)
+        self.year_starts, self.year_weeks = fiscal_year_layout(start_date, end_date)
+        self.first_fiscal_year = date.fromordinal(self.start_day + _EPOCH_ORDINAL).year
+        self.month_names = np.array(fiscal_month_names(start_date), dtype=object)
+
+    @cached_property
+    def year_index_by_row(self):
+        # fiscal year index of every row of the calendar (and the remainder of the last fiscal year), used as a lookup
+        # table instead of searching the fiscal year starts for every day
+        return np.repeat(np.arange(len(self.year_starts), dtype=np.int64), self.year_weeks * 7)
+
+    @cached_property
+    def day_of_year_by_row(self):
+        return np.arange(len(self.year_index_by_row), dtype=np.int64) - (
+                self.year_starts - self.start_day)[self.year_index_by_row]
+
+    def year_row_ranges(self):
+        """
+        Row ranges of the fiscal years in the calendar.
+
+        Returns:
+            list: (start_row, stop_row) tuple per fiscal year, the last year is cut off at end_date.
+        """
+        bounds = np.clip(np.append(self.year_starts, self.year_starts[-1] + self.year_weeks[-1] * 7) - self.start_day,
+                         0, self.num_rows)
+        return [(int(start), int(stop)) for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+
+    def build(self, columns=None, start_row=0, stop_row=None, typed=False, instrument=None):
+        """
+        Build the fiscal calendar DataFrame.
+
+        Args:
+            columns (list, optional): Columns to return, defaults to all columns of create_dataframe().
+            start_row (int, optional): First row (day offset from start_date) to build (default is 0).
+            stop_row (int, optional): Row to stop before (default is None, which builds up to end_date).
+            typed (bool, optional): If True, return compact typed columns instead of strings, see
+                _TypedColumnBlock for the dtypes (default is False).
+            instrument (callable, optional): Called with a StageRecord per column and for the assembly of the
+                DataFrame, see fiscal_calendar.instrumentation (default is None).
+
+        Returns:
+            pd.DataFrame: Fiscal calendar with one row per day.
+        """
+        stop_row = self.num_rows if stop_row is None else max(stop_row, start_row)
+        days = np.arange(start_row, stop_row, dtype=np.int64) + self.start_day
+        return self._frame(days, columns, typed, pd.RangeIndex(start_row, stop_row), instrument)
+
+    def map_days(self, days, columns=None, typed=False, index=None):
+        """
+        Fiscal attributes of an arbitrary array of days, aligned to the input.
+
+        Args:
+            days (np.ndarray): Days since 1970-01-01, in any order and with duplicates. Every day must be within
+                start_date and end_date.
+            columns (list, optional): Columns to return, defaults to all columns of create_dataframe().
+            typed (bool, optional): If True, return compact typed columns instead of strings (default is False).
+            index (pd.Index, optional): Index of the returned DataFrame (default is a RangeIndex).
+
+        Returns:
+            pd.DataFrame: One row per input day.
+        """
+        days = np.asarray(days, dtype=np.int64)
+        if len(days) and (days.min() < self.start_day or days.max() > self.end_day):
+            raise ValueError(f"Dates must be within the fiscal calendar {self.start_date} - {self.end_date}")
+        return self._frame(days, columns, typed, index)
+
+    def _frame(self, days, columns, typed, index, instrument=None):
+        block = (_TypedColumnBlock if typed else _ColumnBlock)(self, days)
+        columns = COLUMNS if columns is None else columns
+        if instrument is None:
+            # the block owns its arrays, so they can be handed to pandas without another copy
+            return pd.DataFrame({name: getattr(block, name) for name in columns}, index=index, copy=False)
+
+        # intermediate arrays are computed once, their time is reported with the first column that needs them
+        engine = 'typed' if typed else 'vectorized'
+        data = {name: run_stage(instrument, name, engine, getattr, block, name) for name in columns}
+        return run_stage(instrument, 'assemble_dataframe', engine, lambda: pd.DataFrame(data, index=index, copy=False))
+
+
+class _ColumnBlock:
+    """
+    Lazily computed arrays for an array of days. Every intermediate array and column is computed at most once and
+    only when requested.
+    """
+
+    def __init__(self, engine, days):
+        self.engine = engine
+        self.days = days
+
+    # ------------------------------------------------------------------------------------------------------------
+    # intermediate arrays
+    # ------------------------------------------------------------------------------------------------------------
+    @cached_property
+    def rows(self):
+        # row of the day in the full calendar
+        return self.days - self.engine.start_day
+
+    @cached_property
+    def year_index(self):
+        return self.engine.year_index_by_row[self.rows]
+
+    @cached_property
+    def day_of_year(self):
+        return self.engine.day_of_year_by_row[self.rows]
+
+    @cached_property
+    def week_index(self):
+        # zero-based fiscal week of year
+        return self.day_of_year // 7
+
+    @cached_property
+    def day_index(self):
+        # day of week with sunday = 0, the epoch 1970-01-01 was a thursday
+        return (self.days + 4) % 7
+
+    @cached_property
+    def year_labels(self):
+        return self.engine.first_fiscal_year + np.arange(len(self.engine.year_starts), dtype=np.int64)
+
+    @cached_property
+    def year_label_strings(self):
+        return self.year_labels.astype(str).astype(object)
+
+    @cached_property
+    def year_number_of_weeks(self):
+        return self.engine.year_weeks[self.year_index]
+
+    @cached_property
+    def iso_codes(self):
+        # fiscal week iso code for every (year, week) pair, starting with the year before the first fiscal year
+        labels = np.append(self.year_labels[0] - 1, self.year_labels).astype(str).astype(object)
+        weeks = np.array([f'W{week:02d}' for week in range(1, 54)], dtype=object)
+        return np.add.outer(labels, weeks).ravel()
+
+    @cached_property
+    def iso_index(self):
+        # position of the fiscal week in iso_codes
+        return (self.year_index + 1) * 53 + self.week_index
+
+    @cached_property
+    def last_year_iso_index(self):
+        # the week of the row 364 days earlier, the first 364 rows take the same week of the previous year
+        has_prior = self.rows >= LAST_YEAR_DAYS
+        prior_rows = np.where(has_prior, self.rows - LAST_YEAR_DAYS, self.rows)
+        prior_year_index = self.engine.year_index_by_row[prior_rows] + has_prior
+        prior_week_index = self.engine.day_of_year_by_row[prior_rows] // 7
+        return prior_year_index * 53 + prior_week_index
+
+    def _span_strings(self, fmt):
+        # format the day range once (including the last year / prior year and week end offsets), columns then
+        # take from it instead of formatting the same dates again
+        first = self.days.min() - PRIOR_YEAR_DAYS if len(self.days) else 0
+        last = self.days.max() + 6 if len(self.days) else -1
+        return first, format_dates(np.arange(first, last + 1), fmt)
+
+    @cached_property
+    def mdy_span(self):
+        return self._span_strings('%m/%d/%Y')
+
+    @cached_property
+    def ymd_span(self):
+        return self._span_strings('%Y%m%d')
+
+    def _mdy(self, days):
+        first, strings = self.mdy_span
+        return strings[days - first]
+
+    def _ymd(self, days):
+        first, strings = self.ymd_span
+        return strings[days - first]
+
+    # ------------------------------------------------------------------------------------------------------------
+    # output columns
+    # ------------------------------------------------------------------------------------------------------------
+    @cached_property
+    def time_day_id_pk(self):
+        return self._ymd(self.days)
+
+    @cached_property
+    def day_date(self):
+        return self._mdy(self.days)
+
+    @cached_property
+    def day_of_week_short_name(self):
+        return DAY_SHORT_NAMES[self.day_index]
+
+    @cached_property
+    def day_of_week_name(self):
+        return DAY_NAMES[self.day_index]
+
+    @cached_property
+    def day_of_week_letter(self):
+        return DAY_LETTERS[self.day_index]
+
+    @cached_property
+    def fiscal_day_of_week(self):
+        return self.day_index + 1
+
+    @cached_property
+    def fiscal_week_of_year(self):
+        return self.week_index + 1
+
+    @cached_property
+    def fiscal_week_of_season(self):
+        week = self.fiscal_week_of_year
+        return np.where(week <= 26, week, week - 26)
+
+    @cached_property
+    def fiscal_week_of_quarter(self):
+        # the 53rd week is counted as the 14th week of the fourth quarter
+        return self.fiscal_week_of_year - 13 * np.minimum(self.week_index // 13, 3)
+
+    @cached_property
+    def fiscal_week_of_month(self):
+        return self.week_index - MONTH_FIRST_WEEK[self.fiscal_month_of_year - 1] + 1
+
+    @cached_property
+    def fiscal_week_start_date(self):
+        return self._mdy(self.days - self.day_index)
+
+    @cached_property
+    def fiscal_week_end_date(self):
+        return self._mdy(self.days - self.day_index + 6)
+
+    @cached_property
+    def fiscal_week_iso_code(self):
+        return self.iso_codes[self.iso_index]
+
+    @cached_property
+    def fiscal_month_of_year(self):
+        return WEEK_TO_MONTH[self.week_index]
+
+    @cached_property
+    def fiscal_month_of_season(self):
+        month = self.fiscal_month_of_year
+        return np.where(month <= 6, month, month - 6)
+
+    @cached_property
+    def fiscal_month_of_quarter(self):
+        return (self.fiscal_month_of_year - 1) % 3 + 1
+
+    @cached_property
+    def fiscal_month_name(self):
+        return self.engine.month_names[self.fiscal_month_of_year - 1]
+
+    @cached_property
+    def fiscal_month_short_name(self):
+        return np.array([name[0:3] for name in self.engine.month_names], dtype=object)[self.fiscal_month_of_year - 1]
+
+    @cached_property
+    def fiscal_month_start_date(self):
+        # mirrors add_fiscal_month_start_date(), which repeats the first date of the calendar on every row
+        return np.repeat(format_dates([self.engine.start_day], '%m/%d/%Y'), len(self.days))
+
+    @cached_property
+    def fiscal_month_end_date(self):
+        # mirrors add_fiscal_month_end_date(), which repeats the first date of the calendar + 27 days on every row
+        return np.repeat(format_dates([self.engine.start_day + 28 - 1], '%m/%d/%Y'), len(self.days))
+
+    @cached_property
+    def fiscal_month_number_of_weeks(self):
+        month = self.fiscal_month_of_year
+        return MONTH_WEEKS[month - 1] + ((month == 12) & (self.year_number_of_weeks == 53))
+
+    @cached_property
+    def fiscal_month_number_of_days(self):
+        return self.fiscal_month_number_of_weeks * 7
+
+    @cached_property
+    def fiscal_quarter_of_year(self):
+        # quarters span 91 days, the 53rd week is part of the fourth quarter
+        return np.minimum(self.day_of_year // 91, 3) + 1
+
+    @cached_property
+    def fiscal_quarter_of_year_str(self):
+        return np.array(['Q1', 'Q2', 'Q3', 'Q4'], dtype=object)[self.fiscal_quarter_of_year - 1]
+
+    @cached_property
+    def fiscal_quarter_of_season(self):
+        quarter = self.fiscal_quarter_of_year
+        return np.where(quarter <= 2, quarter, quarter - 2)
+
+    @cached_property
+    def fiscal_season_of_year(self):
+        return np.where(self.fiscal_quarter_of_year <= 2, 1, 2)
+
+    @cached_property
+    def fiscal_season_name(self):
+        return SEASON_NAMES[self.fiscal_season_of_year - 1]
+
+    @cached_property
+    def fiscal_year(self):
+        return self.year_label_strings[self.year_index]
+
+    @cached_property
+    def fiscal_year_2_digit(self):
+        return np.array([label[-2:] for label in self.year_label_strings], dtype=object)[self.year_index]
+
+    @cached_property
+    def fiscal_year_start_date(self):
+        return format_dates(self.engine.year_starts, '%m/%d/%Y')[self.year_index]
+
+    @cached_property
+    def fiscal_year_end_date(self):
+        year_ends = self.engine.year_starts + self.engine.year_weeks * 7 - 1
+        return format_dates(year_ends, '%m/%d/%Y')[self.year_index]
+
+    @cached_property
+    def fiscal_year_number_of_weeks(self):
+        return self.year_number_of_weeks
+
+    @cached_property
+    def fiscal_year_number_of_days(self):
+        return self.year_number_of_weeks * 7
+
+    @cached_property
+    def last_year_equiv_day_fk(self):
+        return self._ymd(self.days - LAST_YEAR_DAYS)
+
+    @cached_property
+    def last_year_equiv_week_fk(self):
+        return self.iso_codes[self.last_year_iso_index]
+
+    @cached_property
+    def last_year_equiv_day_date(self):
+        return self._mdy(self.days - LAST_YEAR_DAYS)
+
+    @cached_property
+    def last_year_fiscal_year(self):
+        return self.year_labels[self.year_index] - 1
+
+    @cached_property
+    def last_year_fiscal_month_of_year(self):
+        # the fiscal month of the row 364 days earlier, the first 364 rows keep their own fiscal month
+        prior_rows = np.where(self.rows >= LAST_YEAR_DAYS, self.rows - LAST_YEAR_DAYS, self.rows)
+        return WEEK_TO_MONTH[self.engine.day_of_year_by_row[prior_rows] // 7]
+
+    @cached_property
+    def prior_year_from_last_year_equiv_day_fk(self):
+        return self._ymd(self.days - PRIOR_YEAR_DAYS)
+
+    @cached_property
+    def prior_year_from_last_year_equiv_day_date(self):
+        return self._mdy(self.days - PRIOR_YEAR_DAYS)
+
+    @cached_property
+    def time_fiscal_week_id_fk(self):
+        return self.fiscal_week_iso_code.copy()
+
+    @cached_property
+    def first_fiscal_week_of_fiscal_month_ind(self):
+        return (self.fiscal_week_of_month == 1).astype(np.int64)
+
+    @cached_property
+    def last_fiscal_week_of_fiscal_month_ind(self):
+        return (self.fiscal_week_of_month == self.fiscal_month_number_of_weeks).astype(np.int64)
+
+    @cached_property
+    def time_day_id_pk_int(self):
+        return day_keys(self.days)
+
+
+class _TypedColumnBlock(_ColumnBlock):
+    """
+    Compact variant of _ColumnBlock used by create_dataframe(typed=True).
+
+    - dates are datetime64 values (numpy datetime64[D], stored by pandas with its coarsest resolution datetime64[s])
+    - keys are integer surrogate keys: time_day_id_pk and the day foreign keys as int32 yyyymmdd, fiscal_week_iso_code
+      and the week foreign keys as int32 yyyyww (e.g. 202401)
+    - counters and indicators are int8, day counts and years are int16
+    - day, month, quarter and season names are ordered categoricals
+    """
+
+    @staticmethod
+    def _dates(days):
+        return np.asarray(days, dtype=np.int64).astype('datetime64[D]')
+
+    @staticmethod
+    def _categorical(codes, categories):
+        return pd.Categorical.from_codes(codes, categories=list(categories), ordered=True)
+
+    @cached_property
+    def iso_keys(self):
+        # integer key yyyyww for every (year, week) pair, laid out like iso_codes
+        labels = np.append(self.year_labels[0] - 1, self.year_labels)
+        return np.add.outer(labels * 100, np.arange(1, 54)).ravel().astype(np.int32)
+
+    @cached_property
+    def time_day_id_pk(self):
+        return day_keys(self.days).astype(np.int32)
+
+    @cached_property
+    def day_date(self):
+        return self._dates(self.days)
+
+    @cached_property
+    def day_of_week_short_name(self):
+        return self._categorical(self.day_index, DAY_SHORT_NAMES)
+
+    @cached_property
+    def day_of_week_name(self):
+        return self._categorical(self.day_index, DAY_NAMES)
+
+    @cached_property
+    def day_of_week_letter(self):
+        return self._categorical(self.day_index, DAY_LETTERS)
+
+    @cached_property
+    def fiscal_day_of_week(self):
+        return (self.day_index + 1).astype(np.int8)
+
+    @cached_property
+    def fiscal_week_of_year(self):
+        return (self.week_index + 1).astype(np.int8)
+
+    @cached_property
+    def fiscal_week_of_season(self):
+        return super().fiscal_week_of_season.astype(np.int8)
+
+    @cached_property
+    def fiscal_week_of_quarter(self):
+        return super().fiscal_week_of_quarter.astype(np.int8)
+
+    @cached_property
+    def fiscal_week_of_month(self):
+        return super().fiscal_week_of_month.astype(np.int8)
+
+    @cached_property
+    def fiscal_week_start_date(self):
+        return self._dates(self.days - self.day_index)
+
+    @cached_property
+    def fiscal_week_end_date(self):
+        return self._dates(self.days - self.day_index + 6)
+
+    @cached_property
+    def fiscal_week_iso_code(self):
+        return self.iso_keys[self.iso_index]
+
+    @cached_property
+    def fiscal_month_of_year(self):
+        return WEEK_TO_MONTH[self.week_index].astype(np.int8)
+
+    @cached_property
+    def fiscal_month_of_season(self):
+        return super().fiscal_month_of_season.astype(np.int8)
+
+    @cached_property
+    def fiscal_month_of_quarter(self):
+        return super().fiscal_month_of_quarter.astype(np.int8)
+
+    @cached_property
+    def fiscal_month_name(self):
+        return self._categorical(self.fiscal_month_of_year - 1, self.engine.month_names)
+
+    @cached_property
+    def fiscal_month_short_name(self):
+        return self._categorical(self.fiscal_month_of_year - 1, [name[0:3] for name in self.engine.month_names])
+
+    @cached_property
+    def fiscal_month_start_date(self):
+        return np.repeat(self._dates([self.engine.start_day]), len(self.days))
+
+    @cached_property
+    def fiscal_month_end_date(self):
+        return np.repeat(self._dates([self.engine.start_day + 28 - 1]), len(self.days))
+
+    @cached_property
+    def fiscal_month_number_of_weeks(self):
+        return super().fiscal_month_number_of_weeks.astype(np.int8)
+
+    @cached_property
+    def fiscal_month_number_of_days(self):
+        return self.fiscal_month_number_of_weeks.astype(np.int16) * 7
+
+    @cached_property
+    def fiscal_quarter_of_year(self):
+        return super().fiscal_quarter_of_year.astype(np.int8)
+
+    @cached_property
+    def fiscal_quarter_of_year_str(self):
+        return self._categorical(self.fiscal_quarter_of_year - 1, ['Q1', 'Q2', 'Q3', 'Q4'])
+
+    @cached_property
+    def fiscal_quarter_of_season(self):
+        return super().fiscal_quarter_of_season.astype(np.int8)
+
+    @cached_property
+    def fiscal_season_of_year(self):
+        return super().fiscal_season_of_year.astype(np.int8)
+
+    @cached_property
+    def fiscal_season_name(self):
+        return self._categorical(self.fiscal_season_of_year - 1, SEASON_NAMES)
+
+    @cached_property
+    def fiscal_year(self):
+        return self.year_labels[self.year_index].astype(np.int16)
+
+    @cached_property
+    def fiscal_year_2_digit(self):
+        return (self.fiscal_year % 100).astype(np.int8)
+
+    @cached_property
+    def fiscal_year_start_date(self):
+        return self._dates(self.engine.year_starts)[self.year_index]
+
+    @cached_property
+    def fiscal_year_end_date(self):
+        return self._dates(self.engine.year_starts + self.engine.year_weeks * 7 - 1)[self.year_index]
+
+    @cached_property
+    def fiscal_year_number_of_weeks(self):
+        return self.year_number_of_weeks.astype(np.int8)
+
+    @cached_property
+    def fiscal_year_number_of_days(self):
+        return self.year_number_of_weeks.astype(np.int16) * 7
+
+    @cached_property
+    def last_year_equiv_day_fk(self):
+        return day_keys(self.days - LAST_YEAR_DAYS).astype(np.int32)
+
+    @cached_property
+    def last_year_equiv_week_fk(self):
+        return self.iso_keys[self.last_year_iso_index]
+
+    @cached_property
+    def last_year_equiv_day_date(self):
+        return self._dates(self.days - LAST_YEAR_DAYS)
+
+    @cached_property
+    def last_year_fiscal_year(self):
+        return (self.fiscal_year - 1).astype(np.int16)
+
+    @cached_property
+    def last_year_fiscal_month_of_year(self):
+        return super().last_year_fiscal_month_of_year.astype(np.int8)
+
+    @cached_property
+    def prior_year_from_last_year_equiv_day_fk(self):
+        return day_keys(self.days - PRIOR_YEAR_DAYS).astype(np.int32)
+
+    @cached_property
+    def prior_year_from_last_year_equiv_day_date(self):
+        return self._dates(self.days - PRIOR_YEAR_DAYS)
+
+    @cached_property
+    def first_fiscal_week_of_fiscal_month_ind(self):
+        return super().first_fiscal_week_of_fiscal_month_ind.astype(np.int8)
+
+    @cached_property
+    def last_fiscal_week_of_fiscal_month_ind(self):
+        return super().last_fiscal_week_of_fiscal_month_ind.astype(np.int8)
+
+    @cached_property
+    def time_day_id_pk_int(self):
+        return self.time_day_id_pk.copy()
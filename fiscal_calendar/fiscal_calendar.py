@@ -4,13 +4,95 @@ import pandas as pd
 from datetime import datetime
 from datetime import timedelta
 import numpy as np
-import calendar
-from tabulate import tabulate
 
-# packages related to pdf reporting
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
-from reportlab.pdfbase.pdfmetrics import stringWidth
+# vectorized engine
+from fiscal_calendar.engine import (COLUMNS, DEFAULT_PATTERN, LAST_YEAR_DAYS, FiscalCalendarEngine, day_keys,
+                                    fiscal_month_names, fiscal_year_layout, format_dates, has_53_weeks,
+                                    month_weeks_table, to_day_number)
+from fiscal_calendar.boundaries import FiscalBoundaryIndex
+from fiscal_calendar.cache import CalendarCache
+from fiscal_calendar.comps import ComparableAlignment
+from fiscal_calendar.config import FiscalCalendarConfig
+from fiscal_calendar.dimensions import build_month_dimension, build_week_dimension
+from fiscal_calendar.instrumentation import run_stage
+from fiscal_calendar.parallel import build_parallel
+from fiscal_calendar.render import render_fiscal_years
+from fiscal_calendar.resolver import FiscalDateResolver
+
+
+# temporary columns of generate_fiscal_calendar(), available to every stage of the legacy engine
+LEGACY_BASE_COLUMNS = ('Date', 'Fiscal Wk', 'Weekday', 'Day', 'Fiscal Month', 'Fiscal Qtr', 'Fiscal Year')
+
+# stages of the legacy engine of create_dataframe() in order, with the columns each add_* method adds and the columns
+# it reads. Used to run only the stages a column projection depends on, a stage only reads columns of earlier stages
+LEGACY_STAGES = {
+    'add_time_day_id_pk': (('time_day_id_pk',), ('Date',)),  # Column 1
+    'add_day_date': (('day_date',), ('Date',)),  # Column 2
+    'add_day_of_week_short_name': (('day_of_week_short_name',), ('Date',)),  # Column 3
+    'add_day_of_week_name': (('day_of_week_name',), ('Weekday',)),  # Column 4
+    'add_day_of_week_letter': (('day_of_week_letter',), ('day_of_week_short_name',)),  # Column 5
+    'add_fiscal_day_of_week': (('fiscal_day_of_week',), ('Weekday',)),  # Column 6
+    'add_fiscal_week_of_year': (('fiscal_week_of_year',), ('Fiscal Wk',)),  # Column 7
+    'add_fiscal_week_of_season': (('fiscal_week_of_season',), ('fiscal_week_of_year',)),  # Column 8
+    'add_fiscal_week_of_quarter': (('fiscal_week_of_quarter',), ('fiscal_week_of_year',)),  # Column 9
+    'add_fiscal_week_of_month': (('fiscal_week_of_month',), ('Fiscal Year',)),  # Column 10
+    'add_fiscal_week_start_date': (('fiscal_week_start_date',), ('Date',)),  # Column 11
+    'add_fiscal_week_end_date': (('fiscal_week_end_date',), ('Date',)),  # Column 12
+    'add_fiscal_week_iso_code': (('fiscal_week_iso_code',), ('Fiscal Wk', 'Fiscal Year')),  # Column 13
+    'add_fiscal_month_of_year': (('fiscal_month_of_year',), ('Fiscal Month',)),  # Column 14
+    'add_fiscal_month_of_season': (('fiscal_month_of_season',), ('fiscal_month_of_year',)),  # Column 15
+    'add_fiscal_month_of_quarter': (('fiscal_month_of_quarter',), ('fiscal_month_of_year',)),  # Column 16
+    'add_fiscal_month_name': (('fiscal_month_name',), ('fiscal_month_of_year',)),  # Column 17
+    'add_fiscal_month_short_name': (('fiscal_month_short_name',), ('fiscal_month_name',)),  # Column 18
+    'add_fiscal_month_start_date': (('fiscal_month_start_date',), ('Date',)),  # Column 19
+    'add_fiscal_month_end_date': (('fiscal_month_end_date',), ('Date',)),  # Column 20
+    'add_fiscal_month_number_of_weeks': (('fiscal_month_number_of_weeks',), ()),  # Column 21
+    'add_fiscal_month_number_of_days': (('fiscal_month_number_of_days',), ()),  # Column 22
+    'add_fiscal_quarter_of_year': (('fiscal_quarter_of_year',), ('Fiscal Qtr',)),  # Column 23
+    'add_fiscal_quarter_of_year_str': (('fiscal_quarter_of_year_str',), ('Fiscal Qtr',)),  # Column 24
+    'add_fiscal_quarter_of_season': (('fiscal_quarter_of_season',), ('fiscal_quarter_of_year',)),  # Column 25
+    'add_fiscal_season_of_year': (('fiscal_season_of_year',), ('fiscal_quarter_of_year',)),  # Column 26
+    'add_fiscal_season_name': (('fiscal_season_name',), ('fiscal_season_of_year',)),  # Column 27
+    'add_fiscal_year': (('fiscal_year',), ('Fiscal Year',)),  # Column 28
+    'add_fiscal_year_2_digit': (('fiscal_year_2_digit',), ('fiscal_year',)),  # Column 29
+    'add_fiscal_year_start_date': (('fiscal_year_start_date',), ('Date',)),  # Column 30
+    'add_fiscal_year_end_date': (('fiscal_year_end_date',), ('Date',)),  # Column 31
+    'add_fiscal_year_number_of_weeks': (('fiscal_year_number_of_weeks',), ('Date',)),  # Column 32
+    'add_fiscal_year_number_of_days': (('fiscal_year_number_of_days',), ('fiscal_year_number_of_weeks',)),  # Column 33
+    'add_equivalent_year_keys': (('last_year_equiv_day_fk', 'last_year_equiv_week_fk',
+                                  'prior_year_from_last_year_equiv_day_fk'),
+                                 ('Date', 'fiscal_week_iso_code')),  # Column 34, 35 and 39
+    'add_last_year_equiv_day_date': (('last_year_equiv_day_date',), ('Date',)),  # Column 36
+    'add_last_year_fiscal_year': (('last_year_fiscal_year',), ('fiscal_year',)),  # Column 37
+    'add_last_year_fiscal_month_of_year': (('last_year_fiscal_month_of_year',), ('fiscal_month_of_year',)),  # Column 38
+    'add_prior_year_from_last_year_equiv_day_date': (('prior_year_from_last_year_equiv_day_date',),
+                                                     ('Date',)),  # Column 41
+    'add_time_fiscal_week_id_fk': (('time_fiscal_week_id_fk',), ('fiscal_week_iso_code',)),  # Column 42
+    'add_first_fiscal_week_of_fiscal_month_ind': (('first_fiscal_week_of_fiscal_month_ind',),
+                                                  ('fiscal_week_of_month',)),  # Column 43
+    'add_last_fiscal_week_of_fiscal_month_ind': (('last_fiscal_week_of_fiscal_month_ind',), ()),  # Column 44
+    'add_time_day_id_pk_int': (('time_day_id_pk_int',), ('time_day_id_pk',)),  # Column 44
+}
+
+
+def legacy_stages_for(columns):
+    """
+    Stages of the legacy engine needed to calculate a projection of the columns of create_dataframe().
+
+    Args:
+        columns (list): Columns of create_dataframe().
+
+    Returns:
+        list: Names of the add_* methods to run in order, including the stages the columns depend on.
+    """
+    needed = set(columns)
+    lst_stages = []
+    # walk the stages backwards, a needed stage adds its input columns to the needed columns of the earlier stages
+    for stage, (outputs, inputs) in reversed(LEGACY_STAGES.items()):
+        if needed.intersection(outputs):
+            lst_stages.append(stage)
+            needed.update(inputs)
+    return lst_stages[::-1]
 
 
 class FiscalCalendarGenerator:
@@ -20,6 +102,8 @@ class FiscalCalendarGenerator:
     Attributes:
         - start_date (str): The start date of the fiscal calendar in the format 'yyyy-mm-dd'.
         - end_date (str): The end date of the fiscal calendar in the format 'yyyy-mm-dd'.
+        - pattern (str): Number of weeks of the three fiscal months of every quarter, '4-4-5', '4-5-4' or '5-4-4'
+          (default is '4-5-4'). The 53rd week of a fiscal year is appended to its last fiscal month.
 
     Methods:
         - create_dataframe(): Generates the fiscal calendar and returns it as a DataFrame.
@@ -44,11 +128,20 @@ class FiscalCalendarGenerator:
 
         # Pretty print the fiscal calendar for the year 2022
         fc.pretty_print_year(df_fiscal_calendar, year=2022)
+
+    Thread safety:
+        create_dataframe(), iter_fiscal_years(), resolve_date(), map_dates() and the other read methods do not modify
+        the instance, the legacy chain runs on a private instance per call. One generator can therefore serve
+        concurrent requests of a thread pool without locks. extend() is the only method that changes the instance
+        (its end_date).
     """
 
-    def __init__(self, start_date, end_date):
+    def __init__(self, start_date, end_date, pattern=DEFAULT_PATTERN):
+        # validates the pattern, the table is looked up again for every calendar
+        month_weeks_table(pattern)
         self.start_date = start_date
         self.end_date = end_date
+        self.pattern = pattern
         self.date_format = "%Y-%m-%d"
         self.month_dict = {1: 'Jan', 2: 'Feb', 3: 'Mar', 4: 'Apr', 5: 'May', 6: 'Jun', 7: 'Jul', 8: 'Aug', 9: 'Sep',
                            10: 'Oct', 11: 'Nov', 12: 'Dec'}
@@ -66,6 +159,22 @@ class FiscalCalendarGenerator:
         self.lst_years = []
         self.lst_week_months = []
         self.fiscal_start_date = None
+        self.boundary_index = None
+        self._resolver = None
+
+    @classmethod
+    def from_config(cls, config):
+        """
+        Create a generator from an immutable fiscal_calendar.config.FiscalCalendarConfig.
+        """
+        return cls(config.start_date, config.end_date, config.pattern)
+
+    @property
+    def config(self):
+        """
+        The immutable FiscalCalendarConfig of the generator, e.g. to share it between threads or use it as cache key.
+        """
+        return FiscalCalendarConfig(self.start_date, self.end_date, self.pattern)
 
     def print_fiscal_calendar(self, df_fiscal_calendar: pd.DataFrame, columns: int = 3, week_number: bool = False,
                               year: int = None):
@@ -83,8 +192,8 @@ class FiscalCalendarGenerator:
         includes its corresponding fiscal week number.
 
         Note: The function assumes that the DataFrame (df_fiscal_calendar) contains the following columns:
-        'fiscal_year', 'fiscal_month_of_year', 'fiscal_month_name', 'day_date', 'day_of_week_short_name',
-        'fiscal_day_of_week', and 'fiscal_week_of_year'.
+        'fiscal_year', 'fiscal_month_of_year', 'fiscal_month_name', 'day_date', 'fiscal_day_of_week' and
+        'fiscal_week_of_year', either as strings or as the typed columns of create_dataframe(typed=True).
 
         Args:
             df_fiscal_calendar (pd.DataFrame): DataFrame containing fiscal calendar data.
@@ -93,7 +202,7 @@ class FiscalCalendarGenerator:
             year (int, optional): The specific fiscal year to print (default is None, which prints all available years).
 
         Returns:
-            None
+            str: The month grids of every requested fiscal year, one after the other.
 
         Example:
         ```python
@@ -108,124 +217,15 @@ class FiscalCalendarGenerator:
         fiscal_calendar_generator.print_fiscal_calendar(df_fiscal_calendar, columns=6, week_number=False, year=2022)
         ```
         """
-        # Check if the fiscal year input is provided by user
-        if year is not None:
-            # Convert the year to a string
-            fiscal_years = [str(year)]
-        else:
-            # Get the unique fiscal years from the DataFrame
-            fiscal_years = df_fiscal_calendar['fiscal_year'].unique()
-
-        # Create a mapping dictionary
-        day_of_week_mapping = {'SUN': 'Su', 'MON': 'Mo', 'TUE': 'Tu', 'WED': 'We', 'THU': 'Th', 'FRI': 'Fr',
-                               'SAT': 'Sa'}
-
-        # Loop through each fiscal year
-        for fiscal_year in fiscal_years:
-            # Get the fiscal year data from the DataFrame
-            fiscal_year_data = df_fiscal_calendar[df_fiscal_calendar['fiscal_year'] == fiscal_year]
-
-            # Create a list to store the formatted months
-            formatted_months = []
-            # Loop through each fiscal month
-            for fiscal_month in range(1, 13):
-                # Get the fiscal month data from the DataFrame
-                fiscal_month_data = fiscal_year_data[fiscal_year_data['fiscal_month_of_year'] == fiscal_month]
-
-                # Check if the fiscal month data is empty
-                if not fiscal_month_data.empty:
-                    # Get the fiscal month name from the first row
-                    fiscal_month_name = fiscal_month_data['fiscal_month_name'].iloc[0]
-                    # Create a string to represent the month
-                    month_str = f"{fiscal_month_name} FY{fiscal_year}\n"
-
-                    # if user wants to see fiscal week number and if week number is 2 digits -> add +1 space
-                    if week_number and any(fiscal_month_data['fiscal_week_of_year'] > 9):
-                        month_str += "W  | Su Mo Tu We Th Fr Sa\n"
-                    # if user wants to see fiscal week number and if week number is 1 digit -> remove -1 space
-                    elif week_number and any(fiscal_month_data['fiscal_week_of_year'] <= 9):
-                        month_str += "W | Su Mo Tu We Th Fr Sa\n"
-                    # else user does not want to see fiscal week number in calendar
-                    else:
-                        month_str += "Su Mo Tu We Th Fr Sa\n"
-
-                    # Create a list to represent the calendar
-                    calendar = [['  '] * 7 for _ in range(6)]  # Add an extra column for the week number if needed
-
-                    # Create a list to store the week numbers
-                    week_numbers = ['  '] * 6
-
-                    # Sort fiscal_month_data based on day_date
-                    fiscal_month_data = fiscal_month_data.sort_values('day_date')
-
-                    # Get the minimum fiscal_week_of_year for the current month
-                    min_week_of_year = fiscal_month_data['fiscal_week_of_year'].min()
-
-                    for _, day_data in fiscal_month_data.iterrows():
-                        day_date = datetime.strptime(day_data['day_date'], '%m/%d/%Y')
-                        day_str = f"{day_date.day:2d}"
-                        day_of_week = day_data['day_of_week_short_name'].upper()  # Convert to uppercase
-
-                        # Map the day of the week to the desired format
-                        day_of_week = day_of_week_mapping.get(day_of_week, '  ')  # Use '  ' if not found in the mapping
-
-                        # Use the day index from the dataframe, subtract 1 because Python uses 0-based indexing
-                        day_index = day_data['fiscal_day_of_week'] - 1
-
-                        # Use the fiscal_week_of_year of dataframe, adjust it to fit within the range of calendar lst
-                        week_num = day_data['fiscal_week_of_year'] - min_week_of_year
-
-                        # Fill the calendar array
-                        calendar[week_num][day_index] = day_str
-
-                        # Store the week number for each day
-                        if week_number:
-                            week_numbers[week_num] = str(day_data['fiscal_week_of_year'])
-
-                    # Add the calendar to the month string
-                    for week_num, week in enumerate(calendar):
-                        week_line = " ".join(day_str if day_str != '  ' else "    " for day_str in week)
-                        if week_line.strip():  # Only add the line if it's not empty
-                            if week_number:
-                                month_str += f"{week_numbers[week_num]} | " + week_line + "\n"
-                            else:
-                                month_str += week_line + "\n"
-
-                    # Add the month string to the list of formatted months
-                    formatted_months.append(month_str)
-
-            # Instead of printing, append the output to a list of strings
-            output = []
-            # Loop through the formatted months, stepping by the number of columns
-            for i in range(0, len(formatted_months), columns):
-                # Split each month into lines and store them in a list
-                split_months = [month.split("\n") for month in formatted_months[i:i + columns]]
-                # Get the maximum number of lines in a month
-                max_lines = max(len(split_month) for split_month in split_months)
-                # Loop through each line
-                for j in range(max_lines):
-                    # Initialize a list to store the lines for each month
-                    line = []
-                    # Loop through each split month
-                    for split_month in split_months:
-                        # Append the line from the split month to the line list, or append an empty string if the
-                        # line doesn't exist
-                        line.append(split_month[j].ljust(28) if j < len(split_month) else "".ljust(28))
-                    # Join the lines into a single string and append it to the output list
-                    output.append("   ".join(line))
-                    # Append a newline to the output list
-                    output.append("\n")
-                # Append an additional newline to the output list to separate the rows of months
-                output.append("\n")
-
-            # Join the list of strings into a single string and return it
-            return "".join(output)
+        # group the frame once and render the month grids of every requested fiscal year from integer arrays
+        fiscal_years = None if year is None else [year]
+        return "".join(render_fiscal_years(df_fiscal_calendar, columns, week_number, fiscal_years).values())
 
     def save_fiscal_calendar_to_pdf(self, df_fiscal_calendar: pd.DataFrame, columns: int = 3,
                                     week_number: bool = False,
-                                    year: int = None, filename: str = "fiscal_calendar.pdf"):
+                                    year: int = None, filename: str = "fiscal_calendar.pdf", workers: int = None):
         """
-        Saves a fiscal calendar to a PDF file based on the provided DataFrame.
+        Saves a fiscal calendar to a PDF file based on the provided DataFrame, one page per fiscal year.
 
         Parameters:
         - df_fiscal_calendar (pd.DataFrame): The DataFrame containing fiscal calendar data.
@@ -233,62 +233,28 @@ class FiscalCalendarGenerator:
           When set to 3, each fiscal year is presented in a grid layout with 4 rows and 3 columns.
           This parameter provides a convenient way to control the visual arrangement of the calendar. (default = 3)
         - week_number (bool): A flag indicating whether to include week numbers in the calendar (default is False).
-        - year (int): The fiscal year for which the calendar is to be generated. If None, it uses the entire DataFrame.
+        - year (int | list): The fiscal year(s) for which the calendar is to be generated. If None, every fiscal year of
+          the DataFrame gets a page.
         - filename (str): The name of the PDF file to be saved (default is "fiscal_calendar.pdf").
-        """
-        # Generate the fiscal calendar as a string
-        fiscal_calendar_str = self.print_fiscal_calendar(df_fiscal_calendar, columns, week_number, year)
-
-        # Replace spaces with non-breaking spaces
-        fiscal_calendar_str = fiscal_calendar_str.replace(" ", "\u00A0")
-
-        try:
-            # Create a PDF canvas
-            c = canvas.Canvas(filename, pagesize=letter)
+        - workers (int): Number of worker processes preparing the pages (default is None, which prepares the pages in
+          the current process). Worth it for planning books of many fiscal years only.
 
-            # Set the font and size to courier
-            font = "Courier"
-            size = 10
-            c.setFont(font, size)
-
-            # Get the width and height of the page
-            page_width, page_height = letter
-
-            # Increase the top margin by changing the y-coordinate for drawing the title
-            top_margin = 700  # Adjust this value as needed
-            title = f'Fiscal Calendar {year}'
-            c.setFont(font, size + 10)  # Increase the font size for the title
-            c.drawCentredString(page_width / 2.0, top_margin, title)
-            c.setFont(font, size)  # Reset the font size
-
-            # Get the fiscal year data from the DataFrame
-            fiscal_year_data = df_fiscal_calendar[df_fiscal_calendar['fiscal_year'] == str(year)]
-            my_start_date = fiscal_year_data['day_date'].iloc[0]
-            my_end_date = fiscal_year_data['day_date'].iloc[-1]
-
-            # Draw the date range below the title
-            date_range = f"{my_start_date} - {my_end_date}"
-            c.setFont(font, size + 2)  # Increase the font size for the title
-            c.drawCentredString(page_width / 2.0, top_margin - 20, date_range)
-            c.setFont(font, size)  # Reset the font size
-
-            # Add the fiscal calendar string to the PDF
-            for i, line in enumerate(fiscal_calendar_str.split("\n")):
-                # Calculate the width of the text
-                text_width = stringWidth(line, font, size)
-
-                # Calculate the x-coordinate for the text to be centered
-                x = (page_width - text_width) / 2
-
-                # Increase the top margin for drawing the fiscal calendar
-                fiscal_calendar_y = top_margin - 72 - i * 12  # Subtract an additional 24 to create more space
-                c.drawString(x, fiscal_calendar_y, line)
-
-            # Save the PDF
-            c.save()
-        except PermissionError as e:
-            raise PermissionError(f"Failed to save PDF: Permission denied for '{filename}'. "
-                                  f"Ensure the file is not open and try again.") from e
+        Example:
+        ```python
+        # planning book of fiscal years 2000-2029, one page per fiscal year
+        fc = FiscalCalendarGenerator(start_date='2000-01-30', end_date='2030-02-02')
+        fc.save_fiscal_calendar_to_pdf(fc.create_dataframe(), week_number=True, filename='planning_book.pdf')
+        ```
+        """
+        if year is None:
+            years = None
+        elif isinstance(year, (list, tuple)):
+            years = year
+        else:
+            years = [year]
+        # reportlab is only loaded when a pdf is saved
+        from fiscal_calendar.pdf import save_pdf
+        save_pdf(df_fiscal_calendar, filename, columns, week_number, years, workers)
 
     def pretty_print_year(self, df_date, year):
         """
@@ -322,18 +288,19 @@ class FiscalCalendarGenerator:
             'first_fiscal_week_of_fiscal_month_ind', 'last_fiscal_week_of_fiscal_month_ind', 'time_day_id_pk_int'
         ]]
 
-        # Convert the DataFrame to a tabular format for pretty printing
+        # Convert the DataFrame to a tabular format for pretty printing, tabulate is only loaded when printing
+        from tabulate import tabulate
         print(tabulate(formatted_data, headers='keys', tablefmt='pretty'))
 
     def check_and_shift_start_date(self):
         """
         Checks if the start date is within the last 5 days of the month.
         If it is, shifts the month_name_dict by one.
+
+        The month names are derived from the start date on every call, so calling the method again (e.g. by a second
+        create_dataframe()) does not shift them again.
         """
-        start_date = pd.to_datetime(self.start_date)
-        if start_date.day > calendar.monthrange(start_date.year, start_date.month)[1] - 5:
-            # Shift the month_name_dict by one
-            self.month_name_dict = {k - 1 if k != 1 else 12: v for k, v in self.month_name_dict.items()}
+        self.month_name_dict = dict(enumerate(fiscal_month_names(self.start_date), start=1))
 
     def delta_days(self, mydate):
         """
@@ -386,7 +353,9 @@ class FiscalCalendarGenerator:
 
         The fiscal calendar is calculated based on the provided start and end dates and the configured fiscal
         year details such as the number of days in a week, the number of days in a month, and the fiscal month
-        dictionary.
+        dictionary. The number of weeks of every fiscal month is looked up in the table of the week pattern
+        (engine.month_weeks_table()), once per fiscal year, and the month abbreviations are mapped from integer month
+        codes after the layout of all fiscal years is known.
 
         Returns:
             pd.DataFrame: DataFrame containing the fiscal calendar information.
@@ -407,108 +376,49 @@ class FiscalCalendarGenerator:
         # Check if the start date is within the last 5 days of the month
         self.check_and_shift_start_date()
 
-        # Get the fiscal start date
-        fiscal_start_date = self.start_date
-        # Convert the fiscal start date to a datetime object
-        fiscal_start_date_dt = datetime.strptime(fiscal_start_date, self.date_format)
-        # Get the fiscal month
-        fiscal_month = fiscal_start_date_dt.month
-        # Get the fiscal year
-        fiscal_year = fiscal_start_date_dt.year
-
-        # Initialize lists to hold the fiscal weeks, months, quarters, and years
-        self.lst_months = []
-        lst_array = []
-        lst_fiscal_weeks = []
-        lst_fiscalqtrs = []
-        lst_years = []
-
-        # Initiate the 53rd week and set it equal to 0 days
-        fifthy_third_week = 0
-
         # Create a DataFrame with a date range based on the start and end dates
         df_date = pd.DataFrame(pd.date_range(start=self.start_date, end=self.end_date), columns=['Date'])
 
         # Calculate the number of years between the start and end dates
+        fiscal_start_date_dt = datetime.strptime(self.start_date, self.date_format)
         years_count = (df_date['Date'].max().year - df_date['Date'].min().year) + 1
 
-        # Loop through each year
-        for year in range(1, years_count + 1):
-            # Increment the fiscal year
-            fiscal_year += 1
-
-            # If it's not the first year, set the month to 1, otherwise use the fiscal month
-            month = 1 if year != 1 else fiscal_month
-
-            # Loop through each month
-            for i in range(month, 12 + 1):
-                # Determine the number of weeks in the month
-                if (self.delta_days(fiscal_start_date) >= 4) and (self.month_dict.get(i) == 'Dec'):
-                    # if the delta days is greater than or equal to 4 and the month is December, add 5th week
-                    num_weeks = 5
-                    # set 5th week to 7 days
-                    fifthy_third_week = 7
-                elif (i - 2) % 3 == 0:
-                    num_weeks = 5
-                else:
-                    num_weeks = 4
-
-                # Create an array of the month and append it to the list of months
-                my_array = np.repeat(self.month_dict.get(i), (num_weeks * self.num_days))
-                # Append the array to the list of months
-                lst_array.append(len(my_array))
-
-                # If we've processed 12 months, calculate the fiscal quarters and weeks
-                if len(lst_array) == 12:
-                    # Create an array of quarter numbers (1 to 4)
-                    y = np.array(list(np.arange(0, 4) + 1))
-                    # Convert the quarter numbers to strings
-                    y = np.char.mod('%d', y)
-                    # Add a 'Q' prefix to the quarter numbers
-                    y = np.char.add('Q', y)
-                    # Repeat each quarter number 91 times (to represent the days in a quarter)
-                    # and append it to the list of fiscal quarters
-                    lst_fiscalqtr = np.repeat(y, 91)
-
-                    # Count the number of days in the array equals 364 then 52 weeks in the fiscal year
-                    if sum(lst_array) == 364:
-                        x = np.array(list(np.arange(0, 52) + 1))
-                    # Count the number of days in the array equals 371 then 53 weeks in the fiscal year
-                    elif sum(lst_array) == 371:
-                        # create array with 53 weeks
-                        x = np.array(list(np.arange(0, 53) + 1))
-                        lst_fiscalqtr = np.append(lst_fiscalqtr, ['Q4'] * 7)
-                    else:
-                        continue
-
-                    weeknumber_lst = np.repeat(x, self.num_days)
-                    lst_fiscal_weeks.append(weeknumber_lst)
-                    lst_array = []
-                    lst_fiscalqtrs.append(lst_fiscalqtr)
-
-                # Append the array to the list of fiscal weeks
-                self.lst_months.append(my_array)
-
-            # Update the fiscal start date for the next year
-            fiscal_start_date_dt = datetime.strptime(fiscal_start_date, self.date_format)
-            lst_year = np.repeat((fiscal_year - 1), (364 + fifthy_third_week))
-            lst_years.append(lst_year)
-
-            # Update the fiscal start date for the next year
-            fiscal_start_date = (fiscal_start_date_dt + timedelta(days=364 + fifthy_third_week)).strftime(
-                self.date_format)
-
-            # Reset the fifthy_third_week to 0
-            fifthy_third_week = 0
+        # Decide once per fiscal year whether it has a 53rd week, each fiscal year starts 364 or 371 days after the
+        # previous one
+        year_start = to_day_number(fiscal_start_date_dt)
+        year_has_53_weeks = np.zeros(years_count, dtype=np.int64)
+        for year in range(years_count):
+            year_has_53_weeks[year] = has_53_weeks(year_start)
+            year_start += 364 + 7 * year_has_53_weeks[year]
+
+        # Look up the number of weeks of every fiscal month in the pattern table, the first year starts at the
+        # month of the start date
+        month_weeks = month_weeks_table(self.pattern)[year_has_53_weeks].ravel()[fiscal_start_date_dt.month - 1:]
+        month_codes = (np.arange(len(month_weeks)) + fiscal_start_date_dt.month - 1) % 12
+        month_days = month_weeks * self.num_days
+
+        # Fiscal month of every day as integer codes, the month abbreviations are looked up once at the end
+        output_months = np.array(list(self.month_dict.values()), dtype=object)[np.repeat(month_codes, month_days)]
+        self.lst_months = np.split(output_months, np.cumsum(month_days)[:-1])
+
+        # Fiscal weeks and quarters are numbered per block of 12 consecutive fiscal months (364 or 371 days), months
+        # after the last complete block have no fiscal week and quarter
+        num_blocks = len(month_days) // 12
+        block_days = month_days[:num_blocks * 12].reshape(num_blocks, 12).sum(axis=1)
+        day_of_block = np.arange(block_days.sum()) - np.repeat(np.cumsum(block_days) - block_days, block_days)
+        output_wks = day_of_block // self.num_days + 1
+        # quarters span 91 days, the 53rd week is part of the fourth quarter
+        output_qtrs = np.array(['Q1', 'Q2', 'Q3', 'Q4'], dtype=object)[np.minimum(day_of_block // 91, 3)]
+
+        # Every fiscal year is labeled with the calendar year of its start, for 364 or 371 days
+        year_labels = (fiscal_start_date_dt.year + np.arange(years_count)).astype(str).astype(object)
+        output_years = np.repeat(year_labels, 364 + 7 * year_has_53_weeks)
 
         ################################################################################
         # Create the fiscal week, month, quarter, and year columns in the DataFrame
         ################################################################################
-        # Concatenate the list of fiscal weeks into a single array
-        output_wks = np.hstack(lst_fiscal_weeks)
-
-        # Add the fiscal week numbers to the DataFrame
-        df_date['Fiscal Wk'] = pd.Series(list(output_wks))
+        # Add the fiscal week numbers to the DataFrame, the arrays are aligned on the index of the DataFrame
+        df_date['Fiscal Wk'] = pd.Series(output_wks)
 
         # Add the weekday names to the DataFrame
         df_date['Weekday'] = df_date['Date'].dt.day_name()
@@ -517,31 +427,49 @@ class FiscalCalendarGenerator:
         df_date['Day'] = df_date['Weekday'].map(
             {'Sunday': 1, 'Monday': 2, 'Tuesday': 3, 'Wednesday': 4, 'Thursday': 5, 'Friday': 6, 'Saturday': 7})
 
-        # Concatenate the list of fiscal months into a single array
-        output_months = np.hstack(self.lst_months)
-
-        # Add the fiscal month numbers to the DataFrame
-        df_date['Fiscal Month'] = pd.Series(list(output_months))
+        # Add the fiscal month abbreviations, quarters and years to the DataFrame
+        df_date['Fiscal Month'] = pd.Series(output_months)
+        df_date['Fiscal Qtr'] = pd.Series(output_qtrs)
+        df_date['Fiscal Year'] = pd.Series(output_years)
 
-        # Concatenate the list of fiscal quarters into a single array
-        output_qtrs = np.hstack(lst_fiscalqtrs)
-
-        # Add the fiscal quarter numbers to the DataFrame
-        df_date['Fiscal Qtr'] = pd.Series(list(output_qtrs))
-
-        # Concatenate the list of fiscal years into a single array
-        output_years = np.hstack(lst_years)
-
-        # Add the fiscal year numbers to the DataFrame and convert them to strings
-        df_date['Fiscal Year'] = pd.Series(list(output_years)).astype('str')
+        # Index the fiscal year, quarter, month and week start dates once, used by the add_fiscal_year_* methods
+        self.boundary_index = FiscalBoundaryIndex(self.start_date, [len(month) for month in self.lst_months],
+                                                  datetime.strptime(self.start_date, self.date_format).year)
 
         # Return the DataFrame with the added fiscal calendar information
         return df_date
 
-    def create_dataframe(self):
+    def create_dataframe(self, engine: str = 'vectorized', typed: bool = False, cache: CalendarCache = None,
+                         instrument=None, columns: list = None, workers: int = None):
         """
         Generate and preprocess a fiscal calendar DataFrame.
 
+        Parameters:
+            - engine (str): 'vectorized' (default) derives all columns in closed form with NumPy integer arithmetic,
+              'legacy' runs generate_fiscal_calendar() followed by the chain of add_* methods. Both produce the same
+              columns. A start date outside of January or a week pattern other than 4-5-4 always uses the legacy
+              chain, as the vectorized engine treats the start date as the first day of fiscal month 1 of a 4-5-4
+              calendar.
+            - typed (bool): If True, return compact typed columns instead of strings (default is False). Dates become
+              datetime64 values, time_day_id_pk and the day foreign keys int32 yyyymmdd keys, fiscal_week_iso_code and
+              the week foreign keys int32 yyyyww keys, fiscal_year an int16, counters int8/int16 and day, month,
+              quarter and season names ordered categoricals. Requires the vectorized engine.
+            - cache (CalendarCache | CalendarStore): Assemble the calendar from the fiscal years cached in this cache,
+              e.g. the process level fiscal_calendar.cache.default_cache, and cache the fiscal years that are missing,
+              or memory map it from a fiscal_calendar.store.CalendarStore shared by processes (default is None, which
+              does not use a cache). Requires the vectorized engine.
+            - instrument (callable): Called with a fiscal_calendar.instrumentation.StageRecord (stage, engine, rows,
+              seconds, memory_delta_bytes, peak_bytes) after every stage, e.g. a StageRecorder (default is None, which
+              records nothing). The legacy engine reports generate_fiscal_calendar, every add_* method and the drop of
+              the temporary columns, the vectorized engine every column and the assembly of the DataFrame, a cache
+              the whole lookup.
+            - columns (list): Columns to return in this order (default is None, which returns all columns). Only the
+              requested columns and the columns they depend on are calculated, e.g. fiscal_week_iso_code only needs
+              the fiscal week and fiscal year of generate_fiscal_calendar().
+            - workers (int): Build blocks of consecutive fiscal years in this number of worker processes and
+              concatenate them (default is None, which builds in the current process). Requires the vectorized
+              engine, the keys that look across fiscal years are derived from the global row of each day.
+
         Returns:
             pd.DataFrame: Processed DataFrame containing fiscal calendar information.
 
@@ -549,80 +477,396 @@ class FiscalCalendarGenerator:
         fiscal calendar, and returns the processed DataFrame. The added columns include information about time, day, week,
         month, quarter, season, and year components of the fiscal calendar.
 
-        Note: The method relies on a series of helper methods within the class to calculate and add specific columns.
+        Note: The legacy engine relies on a series of helper methods within the class to calculate and add specific
+        columns.
 
         Returns:
             pd.DataFrame: Processed DataFrame containing fiscal calendar information.
         """
-        df_date_copy = self.generate_fiscal_calendar()
-        df_date_copy.to_csv('fiscal_calendar.csv', index=False)
-
-        # removed changing 'Date' to 'time_day_id_pk'
-        df_fiscal_calendar = self.add_time_day_id_pk(df_date_copy)  # Column 1: time_day_id_pk
-        df_fiscal_calendar = self.add_day_date(df_fiscal_calendar)  # Column 2: day_date
-        df_fiscal_calendar = self.add_day_of_week_short_name(df_fiscal_calendar)  # Column 3: day_of_week_short_name
-        df_fiscal_calendar = self.add_day_of_week_name(df_fiscal_calendar)  # Column 4: day_of_week_name
-        df_fiscal_calendar = self.add_day_of_week_letter(df_fiscal_calendar)  # Column 5: day_of_week_letter
-        df_fiscal_calendar = self.add_fiscal_day_of_week(df_fiscal_calendar)  # Column 6: fiscal_day_of_week
-        df_fiscal_calendar = self.add_fiscal_week_of_year(df_fiscal_calendar)  # Column 7: fiscal_week_of_year
-        df_fiscal_calendar = self.add_fiscal_week_of_season(df_fiscal_calendar)  # Column 8: fiscal_week_of_season
-        df_fiscal_calendar = self.add_fiscal_week_of_quarter(df_fiscal_calendar)  # Column 9: fiscal_week_of_quarter
-        df_fiscal_calendar = self.add_fiscal_week_of_month(df_fiscal_calendar)  # Column 10: fiscal_week_of_month
-        df_fiscal_calendar = self.add_fiscal_week_start_date(df_fiscal_calendar)  # Column 11: fiscal_week_start_date
-        df_fiscal_calendar = self.add_fiscal_week_end_date(df_fiscal_calendar)  # Column 12: fiscal_week_end_date
-        df_fiscal_calendar = self.add_fiscal_week_iso_code(df_fiscal_calendar)  # Column 13: fiscal_week_iso_code
-        df_fiscal_calendar = self.add_fiscal_month_of_year(df_fiscal_calendar)  # Column 14: fiscal_month_of_year
-        df_fiscal_calendar = self.add_fiscal_month_of_season(df_fiscal_calendar)  # Column 15: fiscal_month_of_season
-        df_fiscal_calendar = self.add_fiscal_month_of_quarter(df_fiscal_calendar)  # Column 16: fiscal_month_of_quarter
-        df_fiscal_calendar = self.add_fiscal_month_name(df_fiscal_calendar)  # Column 17: fiscal_month_name
-        df_fiscal_calendar = self.add_fiscal_month_short_name(df_fiscal_calendar)  # Column 18: fiscal_month_short_name
-        df_fiscal_calendar = self.add_fiscal_month_start_date(df_fiscal_calendar)  # Column 19: fiscal_month_start_date
-        df_fiscal_calendar = self.add_fiscal_month_end_date(df_fiscal_calendar)  # Column 20: fiscal_month_end_date
-        df_fiscal_calendar = self.add_fiscal_month_number_of_weeks(
-            df_fiscal_calendar)  # Column 21: fiscal_month_number_of_weeks
-        df_fiscal_calendar = self.add_fiscal_month_number_of_days(
-            df_fiscal_calendar)  # Column 22: fiscal_month_number_of_days
-        df_fiscal_calendar = self.add_fiscal_quarter_of_year(df_fiscal_calendar)  # Column 23: fiscal_quarter_of_year
-        df_fiscal_calendar = self.add_fiscal_quarter_of_year_str(
-            df_fiscal_calendar)  # Column 24: fiscal_quarter_of_year_str
-        df_fiscal_calendar = self.add_fiscal_quarter_of_season(
-            df_fiscal_calendar)  # Column 25: fiscal_quarter_of_season
-        df_fiscal_calendar = self.add_fiscal_season_of_year(df_fiscal_calendar)  # Column 26: fiscal_season_of_year
-        df_fiscal_calendar = self.add_fiscal_season_name(df_fiscal_calendar)  # Column 27: fiscal_season_name
-        df_fiscal_calendar = self.add_fiscal_year(df_fiscal_calendar)  # Column 28: fiscal_year
-        df_fiscal_calendar = self.add_fiscal_year_2_digit(df_fiscal_calendar)  # Column 29: fiscal_year_2_digit
-        df_fiscal_calendar = self.add_fiscal_year_start_date(df_fiscal_calendar)  # Column 30: fiscal_year_start_date
-        df_fiscal_calendar = self.add_fiscal_year_end_date(df_fiscal_calendar)  # Column 31: fiscal_year_end_date
-        df_fiscal_calendar = self.add_fiscal_year_number_of_weeks(
-            df_fiscal_calendar)  # Column 32: fiscal_year_number_of_weeks
-        df_fiscal_calendar = self.add_fiscal_year_number_of_days(
-            df_fiscal_calendar)  # Column 33: fiscal_year_number_of_days
-        df_fiscal_calendar = self.add_last_year_equiv_day_fk(df_fiscal_calendar)  # Column 34: last_year_equiv_day_fk
-        df_fiscal_calendar = self.calculate_last_year_equiv_week_fk(
-            df_fiscal_calendar)  # Column 35: last_year_equiv_week_fk
-        df_fiscal_calendar = self.add_last_year_equiv_day_date(
-            df_fiscal_calendar)  # Column 36: last_year_equiv_day_date
-        df_fiscal_calendar = self.add_last_year_fiscal_year(df_fiscal_calendar)  # Column 37: last_year_fiscal_year
-        df_fiscal_calendar = self.add_last_year_fiscal_month_of_year(
-            df_fiscal_calendar)  # Column 38: last_year_fiscal_month_of_year
-        df_fiscal_calendar = self.add_prior_year_from_last_year_equiv_day_fk(
-            df_fiscal_calendar)  # Column 39: prior_year_from_last_year_equiv_day_fk
-        df_fiscal_calendar = self.add_prior_year_from_last_year_equiv_week_fk(
-            df_fiscal_calendar)  # Column 40: prior_year_from_last_year_equiv_week_fk
-        df_fiscal_calendar = self.add_prior_year_from_last_year_equiv_day_date(
-            df_fiscal_calendar)  # Column 41: prior_year_from_last_year_equiv_day_date
-        df_fiscal_calendar = self.add_time_fiscal_week_id_fk(df_fiscal_calendar)  # Column 42: time_fiscal_week_id_fk
-        df_fiscal_calendar = self.add_first_fiscal_week_of_fiscal_month_ind(
-            df_fiscal_calendar)  # Column 43: first_fiscal_week_of_fiscal_month_ind
-        df_fiscal_calendar = self.add_last_fiscal_week_of_fiscal_month_ind(
-            df_fiscal_calendar)  # Column 44: last_fiscal_week_of_fiscal_month_ind
-        df_fiscal_calendar = self.add_time_day_id_pk_int(df_fiscal_calendar)  # Column 44: time_day_id_pk_int
-
-        # drop temporary columns that were needed to calculate above columns
-        df_fiscal_calendar = df_fiscal_calendar.drop(
-            columns=['Date', 'Fiscal Wk', 'Weekday', 'Day', 'Fiscal Month', 'Fiscal Qtr', 'Fiscal Year'])
-
-        return df_fiscal_calendar
+        if engine not in ('vectorized', 'legacy'):
+            raise ValueError(f"Unknown engine '{engine}', use 'vectorized' or 'legacy'")
+        if columns is not None:
+            unknown_columns = [column for column in columns if column not in COLUMNS]
+            if unknown_columns:
+                raise ValueError(f"Unknown columns: {', '.join(unknown_columns)}")
+
+        # the vectorized engine derives every column from the day offset relative to each fiscal year start
+        if engine == 'vectorized' and self._supports_vectorized_engine():
+            if workers is not None:
+                if cache is not None:
+                    raise ValueError("workers and cache can not be combined")
+                if instrument is None:
+                    return build_parallel(self.start_date, self.end_date, workers, typed, columns)
+                return run_stage(instrument, 'build_parallel', engine, build_parallel, self.start_date,
+                                 self.end_date, workers, typed, columns)
+            if cache is not None:
+                if instrument is None:
+                    return cache.get_dataframe(self.start_date, self.end_date, typed=typed, columns=columns)
+                return run_stage(instrument, 'cache.get_dataframe', engine, cache.get_dataframe, self.start_date,
+                                 self.end_date, typed, columns)
+            return FiscalCalendarEngine(self.start_date, self.end_date).build(columns=columns, typed=typed,
+                                                                              instrument=instrument)
+        if typed or cache is not None or workers is not None:
+            raise ValueError("typed=True, cache and workers require the vectorized engine, the 4-5-4 pattern and a "
+                             "start date in January")
+
+        columns = list(COLUMNS) if columns is None else list(columns)
+        lst_stages = legacy_stages_for(columns)
+        # the legacy chain keeps intermediate state (lst_months, boundary_index, month_name_dict) on the instance, run
+        # it on a private instance so concurrent and repeated calls never see each other's state
+        chain = FiscalCalendarGenerator.from_config(self.config)
+        if instrument is None:
+            df_fiscal_calendar = chain.generate_fiscal_calendar()
+            for stage in lst_stages:
+                df_fiscal_calendar = getattr(chain, stage)(df_fiscal_calendar)
+            # drop temporary columns that were needed to calculate above columns and restore the column order
+            return df_fiscal_calendar[columns]
+
+        df_fiscal_calendar = run_stage(instrument, 'generate_fiscal_calendar', 'legacy', chain.generate_fiscal_calendar)
+        for stage in lst_stages:
+            df_fiscal_calendar = run_stage(instrument, stage, 'legacy', getattr(chain, stage), df_fiscal_calendar)
+        return run_stage(instrument, 'drop_temporary_columns', 'legacy', lambda df: df[columns], df_fiscal_calendar)
+
+    def export(self, sink, typed: bool = False):
+        """
+        Write the fiscal calendar to a sink, one fiscal year at a time.
+
+        Parameters:
+            - sink (CalendarSink): Destination e.g. CsvSink, ParquetSink or ArrowIpcSink from fiscal_calendar.sinks.
+              The sink is closed after the last fiscal year has been written.
+            - typed (bool): If True, write the compact typed columns of create_dataframe(typed=True) (default is False).
+
+        Only the rows of the fiscal year being written are held in memory, nothing is written to disk unless a sink is
+        provided.
+
+        Example:
+        ```python
+        from fiscal_calendar import FiscalCalendarGenerator
+        from fiscal_calendar.sinks import ParquetSink
+
+        fc = FiscalCalendarGenerator(start_date='1900-01-28', end_date='2100-02-01')
+        fc.export(ParquetSink('fiscal_calendar.parquet'), typed=True)
+        ```
+        """
+        with sink:
+            for df_fiscal_year in self.iter_fiscal_years(typed=typed):
+                sink.write(df_fiscal_year)
+
+    def iter_fiscal_years(self, typed: bool = False):
+        """
+        Generate the fiscal calendar one fiscal year at a time.
+
+        Parameters:
+            - typed (bool): If True, yield the compact typed columns of create_dataframe(typed=True) (default is False).
+
+        Yields:
+            pd.DataFrame: The rows of one fiscal year, with the same columns and row index as in create_dataframe().
+            The first and last fiscal year are cut to start_date and end_date.
+
+        Each fiscal year is computed when it is requested, so memory stays flat for ranges of several centuries.
+
+        Example:
+        ```python
+        fc = FiscalCalendarGenerator(start_date='1900-01-28', end_date='2300-02-01')
+        for df_fiscal_year in fc.iter_fiscal_years(typed=True):
+            load(df_fiscal_year)
+        ```
+        """
+        if self._supports_vectorized_engine():
+            engine = FiscalCalendarEngine(self.start_date, self.end_date)
+            for start_row, stop_row in engine.year_row_ranges():
+                yield engine.build(start_row=start_row, stop_row=stop_row, typed=typed)
+        else:
+            # the legacy chain can only build the full range, split it per fiscal year
+            df_fiscal_calendar = self.create_dataframe(engine='legacy', typed=typed)
+            for _, df_fiscal_year in df_fiscal_calendar.groupby('fiscal_year', sort=False):
+                yield df_fiscal_year
+
+    def iter_chunks(self, rows: int = 100_000, typed: bool = False):
+        """
+        Generate the fiscal calendar in chunks of a fixed number of rows.
+
+        Parameters:
+            - rows (int): Number of rows (days) per chunk, the last chunk can be shorter (default is 100000).
+            - typed (bool): If True, yield the compact typed columns of create_dataframe(typed=True) (default is False).
+
+        Yields:
+            pd.DataFrame: Consecutive rows of the fiscal calendar, with the same columns and row index as in
+            create_dataframe(). Chunks are not aligned to fiscal years.
+
+        Example:
+        ```python
+        fc = FiscalCalendarGenerator(start_date='1900-01-28', end_date='2300-02-01')
+        for df_chunk in fc.iter_chunks(rows=10_000):
+            load(df_chunk)
+        ```
+        """
+        if rows < 1:
+            raise ValueError("rows must be 1 or more")
+        if not self._supports_vectorized_engine():
+            raise ValueError("iter_chunks requires the 4-5-4 pattern and a start date in January, use "
+                             "iter_fiscal_years instead")
+
+        engine = FiscalCalendarEngine(self.start_date, self.end_date)
+        for start_row in range(0, engine.num_rows, rows):
+            yield engine.build(start_row=start_row, stop_row=min(start_row + rows, engine.num_rows), typed=typed)
+
+    def extend(self, df_fiscal_calendar: pd.DataFrame, years: int = 1):
+        """
+        Extend a fiscal calendar created by create_dataframe() with additional fiscal years.
+
+        Parameters:
+            - df_fiscal_calendar (pd.DataFrame): Calendar created by create_dataframe() of this generator, either with
+              string or with typed columns.
+            - years (int): Number of fiscal years to add after the fiscal year that contains the last row (default
+              is 1). A partial last fiscal year is completed first.
+
+        Returns:
+            pd.DataFrame: The calendar with the rows of the new fiscal years appended. The end_date of the generator
+            is moved to the last day of the new fiscal years.
+
+        Only the appended rows are calculated, the last year and prior year keys of the new rows are derived from their
+        own dates and need none of the existing rows.
+
+        Example:
+        ```python
+        fc = FiscalCalendarGenerator(start_date='2021-01-31', end_date='2025-02-01')
+        df_fiscal_calendar = fc.create_dataframe()
+
+        # add fiscal year 2025
+        df_fiscal_calendar = fc.extend(df_fiscal_calendar, years=1)
+        ```
+        """
+        if not self._supports_vectorized_engine():
+            raise ValueError("extend requires the 4-5-4 pattern and a start date in January")
+        if years < 1:
+            raise ValueError("years must be 1 or more")
+
+        start_row = len(df_fiscal_calendar)
+        start_day = to_day_number(self.start_date)
+        last_day = start_day + max(start_row, 1) - 1
+        if start_row and int(df_fiscal_calendar['time_day_id_pk'].iloc[-1]) != day_keys([last_day])[0]:
+            raise ValueError("df_fiscal_calendar does not start at the start_date of this generator")
+
+        # end of the fiscal year that contains the last row, then add the requested number of fiscal years
+        year_starts, year_weeks = fiscal_year_layout(self.start_date, np.datetime64(last_day, 'D'))
+        new_end_day = int(year_starts[-1] + year_weeks[-1] * 7 - 1)
+        for _ in range(years):
+            new_end_day += (53 if has_53_weeks(new_end_day + 1) else 52) * 7
+
+        self.end_date = str(np.datetime64(new_end_day, 'D'))
+        self._resolver = None
+        typed = df_fiscal_calendar['time_day_id_pk'].dtype != object
+        df_new_years = FiscalCalendarEngine(self.start_date, self.end_date).build(start_row=start_row, typed=typed)
+        return pd.concat([df_fiscal_calendar, df_new_years], ignore_index=True)
+
+    def resolve_date(self, day):
+        """
+        Resolve the fiscal attributes of a single date without building a DataFrame.
+
+        Parameters:
+            - day (str | date | datetime): The date to resolve, strings use the format 'yyyy-mm-dd'. Must be within
+              start_date and end_date.
+
+        Returns:
+            dict: Column name to value, identical to the row of create_dataframe() for this date.
+
+        Example:
+        ```python
+        from datetime import date
+        from fiscal_calendar import FiscalCalendarGenerator
+
+        fc = FiscalCalendarGenerator(start_date='2021-01-31', end_date='2025-02-01')
+        fc.resolve_date(date(2024, 8, 15))['fiscal_week_iso_code']  # '2024W28'
+        ```
+        """
+        if not self._supports_vectorized_engine():
+            raise ValueError("resolve_date requires the 4-5-4 pattern and a start date in January")
+        if self._resolver is None:
+            self._resolver = FiscalDateResolver(self.start_date, self.end_date)
+        return self._resolver.resolve(day)
+
+    def period_range(self, key):
+        """
+        Start and end date of a fiscal year, season, quarter, month or week, without building a DataFrame.
+
+        Parameters:
+            - key (str | int): The fiscal year ('2024' or 2024) or the fiscal year, a level letter and the number
+              e.g. '2024S2', '2024Q3', '2024M07' or '2024W33'. The 53rd week belongs to the last month, quarter and
+              season of its fiscal year.
+
+        Returns:
+            dict: 'start_date' and 'end_date' (date), 'number_of_days' and 'number_of_weeks' (int).
+
+        Example:
+        ```python
+        fc = FiscalCalendarGenerator(start_date='2021-01-31', end_date='2025-02-01')
+        fc.period_range('2024M07')  # {'start_date': date(2024, 8, 4), 'end_date': date(2024, 8, 31), ...}
+
+        # for arrays of keys, see FiscalBoundaryIndex.period_ranges()
+        fc.create_boundary_index().period_ranges('week', df_plan['fiscal_week_key'].values)
+        ```
+        """
+        if not self._supports_vectorized_engine():
+            raise ValueError("period_range requires the 4-5-4 pattern and a start date in January")
+        if self._resolver is None:
+            self._resolver = FiscalDateResolver(self.start_date, self.end_date)
+        return self._resolver.period_key_range(key)
+
+    def map_dates(self, dates, columns: list = None, typed: bool = False):
+        """
+        Fiscal attributes for a large array of dates, aligned to the input.
+
+        This replaces merging a fact table with the output of create_dataframe() on 'time_day_id_pk' or 'day_date':
+        every attribute is calculated with vectorized arithmetic on the day numbers of the input.
+
+        Parameters:
+            - dates (np.ndarray | pd.Series | pd.DatetimeIndex): datetime64 values (any unit, the time of day is
+              ignored). Every date must be within start_date and end_date.
+            - columns (list): Columns of create_dataframe() to return (default is None, which returns all columns).
+            - typed (bool): If True, return the compact typed columns of create_dataframe(typed=True) (default is False).
+
+        Returns:
+            pd.DataFrame: One row per input date, with the index of the input if it is a pd.Series.
+
+        Example:
+        ```python
+        fc = FiscalCalendarGenerator(start_date='2021-01-31', end_date='2025-02-01')
+        df_sales[['fiscal_year', 'fiscal_week_of_year']] = fc.map_dates(
+            df_sales['sale_date'], columns=['fiscal_year', 'fiscal_week_of_year'], typed=True)
+        ```
+        """
+        if not self._supports_vectorized_engine():
+            raise ValueError("map_dates requires the 4-5-4 pattern and a start date in January")
+        index = dates.index if isinstance(dates, pd.Series) else None
+        days = np.asarray(dates, dtype='datetime64[D]').astype(np.int64)
+        engine = FiscalCalendarEngine(self.start_date, self.end_date)
+        return engine.map_days(days, columns=columns, typed=typed, index=index)
+
+    def shift_dates(self, dates, periods, level: str = 'month'):
+        """
+        Shift a large array of dates by a number of fiscal weeks, months, quarters, seasons or years.
+
+        Unlike the fixed 364 and 728 day shifts of the last year and prior year columns, the shift follows the month
+        lengths of the week pattern and the 53-week years of the calendar, see FiscalBoundaryIndex.shift(). Requires a
+        start date in January, the month numbering of other calendars does not start at their start date.
+
+        Parameters:
+            - dates (np.ndarray | pd.Series | pd.DatetimeIndex): datetime64 values (any unit, the time of day is
+              ignored).
+            - periods (int | np.ndarray): Number of periods to shift, negative values shift back.
+            - level (str): 'year', 'season', 'quarter', 'month' or 'week' (default is 'month').
+
+        Returns:
+            np.ndarray | pd.Series: datetime64[D] shifted dates, NaT where a date or its shifted date is outside of the
+            calendar. A pd.Series keeps its index.
+
+        Example:
+        ```python
+        fc = FiscalCalendarGenerator(start_date='2021-01-31', end_date='2025-02-01')
+        df_sales['same_day_13_months_back'] = fc.shift_dates(df_sales['sale_date'], -13, 'month')
+        ```
+        """
+        if datetime.strptime(self.start_date, '%Y-%m-%d').month != 1:
+            raise ValueError("shift_dates requires a start date in January")
+        shifted = self.create_boundary_index().shift(np.asarray(dates, dtype='datetime64[D]'), periods, level)
+        if isinstance(dates, pd.Series):
+            return pd.Series(shifted, index=dates.index, name=dates.name)
+        return shifted
+
+    def create_comp_alignment(self, week_53: str = 'shift'):
+        """
+        Create the last year (LY) and last last year (LLY) row tables for comparable sales on fact arrays.
+
+        Parameters:
+            - week_53 (str): Handling of the 53rd week (default is 'shift'). 'shift' compares every day or week with
+              the one 52 weeks earlier, like the last_year_equiv_* columns. 'week_number' compares the same fiscal
+              week number of the previous fiscal year, week 53 then has no equivalent.
+
+        Returns:
+            ComparableAlignment: Row tables of the day grain (rows of create_dataframe()) and the week grain (rows of
+            create_week_dataframe()), see ComparableAlignment.align().
+
+        Example:
+        ```python
+        fc = FiscalCalendarGenerator(start_date='2021-01-31', end_date='2025-02-01')
+        ly_sales, lly_sales = fc.create_comp_alignment().align(weekly_sales, grain='week')
+        ```
+        """
+        if not self._supports_vectorized_engine():
+            raise ValueError("create_comp_alignment requires the 4-5-4 pattern and a start date in January")
+        return ComparableAlignment(self.start_date, self.end_date, week_53)
+
+    def create_boundary_index(self):
+        """
+        Create the sorted start dates of every fiscal year, season, quarter, month and week of the calendar.
+
+        Months, quarters and seasons are counted from start_date, i.e. start_date is the first day of fiscal month 1.
+        This matches the month columns of create_dataframe() for start dates in January only, the legacy calendars of
+        other start dates number their fiscal months from the calendar month of the start date.
+
+        Returns:
+            FiscalBoundaryIndex: Index that buckets any array of dates with np.searchsorted, see
+            FiscalBoundaryIndex.locate() and FiscalBoundaryIndex.periods_between().
+
+        Example:
+        ```python
+        fc = FiscalCalendarGenerator(start_date='2021-01-31', end_date='2025-02-01')
+        index = fc.create_boundary_index()
+        month_index = index.locate(df_sales['sale_date'].values, 'month')
+        df_sales['fiscal_month_of_year'] = index.number('month')[month_index]
+        ```
+        """
+        return FiscalBoundaryIndex.from_layout(self.start_date, self.end_date, self.pattern)
+
+    def create_week_dataframe(self, typed: bool = False):
+        """
+        Create the week-grain dimension table (dim_fiscal_week), one row per fiscal week.
+
+        The table is built from the fiscal year layout directly, instead of building the day-grain calendar and
+        deduplicating it on 'time_fiscal_week_id_fk'.
+
+        Parameters:
+            - typed (bool): If True, return compact typed columns like create_dataframe(typed=True) (default is False).
+
+        Returns:
+            pd.DataFrame: Columns of fiscal_calendar.dimensions.WEEK_COLUMNS, with the start and end date, number of
+            days, last year and prior year week keys and first/last week indicators of every fiscal week.
+
+        Example:
+        ```python
+        fc = FiscalCalendarGenerator(start_date='2021-01-31', end_date='2025-02-01')
+        df_dim_fiscal_week = fc.create_week_dataframe()
+        ```
+        """
+        if not self._supports_vectorized_engine():
+            raise ValueError("create_week_dataframe requires the 4-5-4 pattern and a start date in January")
+        return build_week_dimension(self.start_date, self.end_date, typed=typed)
+
+    def create_month_dataframe(self, typed: bool = False):
+        """
+        Create the month-grain dimension table (dim_fiscal_month), one row per fiscal month.
+
+        Parameters:
+            - typed (bool): If True, return compact typed columns like create_dataframe(typed=True) (default is False).
+
+        Returns:
+            pd.DataFrame: Columns of fiscal_calendar.dimensions.MONTH_COLUMNS, with the start and end date, number of
+            weeks and days, first and last week keys, last year and prior year month keys and first/last month
+            indicators of every fiscal month.
+
+        Example:
+        ```python
+        fc = FiscalCalendarGenerator(start_date='2021-01-31', end_date='2025-02-01')
+        df_dim_fiscal_month = fc.create_month_dataframe()
+        ```
+        """
+        if not self._supports_vectorized_engine():
+            raise ValueError("create_month_dataframe requires the 4-5-4 pattern and a start date in January")
+        return build_month_dimension(self.start_date, self.end_date, typed=typed)
+
+    def _supports_vectorized_engine(self):
+        return self.config.supports_vectorized_engine
 
     def add_time_day_id_pk(self, df_date):
         """
@@ -719,21 +963,13 @@ class FiscalCalendarGenerator:
 
         fiscal_year_counts = df_date['Fiscal Year'].value_counts().sort_index()
 
-        for daysyear in range(0, len(fiscal_year_counts)):
-            four_week_array = np.repeat(np.array(list(np.arange(0, 4) + 1)), 7)
-            five_week_array = np.repeat(np.array(list(np.arange(0, 5) + 1)), 7)
-            lst_week_month = np.hstack((four_week_array, five_week_array, four_week_array) * 4)
+        # week of month of every day of a 52-week and a 53-week fiscal year, from the pattern table
+        year_week_months = [np.repeat(np.concatenate([np.arange(1, weeks + 1) for weeks in month_weeks]), 7)
+                            for month_weeks in month_weeks_table(self.pattern)]
 
-            if fiscal_year_counts.iloc[daysyear] == 364:
-                lst_week_month = lst_week_month
-            #elif fiscal_year_counts.iloc[daysyear] == 366:
-            # was logical error with 2024 leapyear due to additional week
-            elif fiscal_year_counts.iloc[daysyear] == 371:
-                lst_week_month = np.append(lst_week_month, (list(np.arange(4, 5) + 1) * 7))
-            else:
-                pass
-
-            lst_week_months.append(lst_week_month)
+        for daysyear in range(0, len(fiscal_year_counts)):
+            # was logical error with 2024 leapyear due to additional week, only a count of 371 days is a 53-week year
+            lst_week_months.append(year_week_months[1 if fiscal_year_counts.iloc[daysyear] == 371 else 0])
 
         my_output = np.concatenate(lst_week_months).ravel().tolist()
         df_date['fiscal_week_of_month'] = pd.Series(my_output)
@@ -805,96 +1041,73 @@ class FiscalCalendarGenerator:
         df_date['fiscal_year_2_digit'] = df_date['fiscal_year'].str[-2:]
         return df_date
 
-    def add_last_year_equiv_day_fk(self, df_date):
-        df_date['last_year_equiv_day_fk'] = (df_date['Date'].dt.date - timedelta(days=364)).apply(
-            lambda x: x.strftime('%Y%m%d'))
-        return df_date
-
-    def calculate_last_year_equiv_week_fk(self, df_date):
-        # Shift original dataframe by +364 rows to match last year week
-        df_date['last_year_equiv_week_fk'] = df_date['fiscal_week_iso_code'].shift(364)
-
-        # Iterate over all rows of the dataframe
-        for i in range(len(df_date)):
-            # Start from 0, iterate 364 times
-            if i <= 363:
-                # Get the first 4 characters of the fiscal_week_iso_code
-                year_str = df_date['fiscal_week_iso_code'].iloc[i][0:4]
-
-                # Convert the string year to an integer and get the last year (year - 1)
-                left = str(int(year_str) - 1)
-
-                # Get the right part of the string (the week)
-                right = df_date['fiscal_week_iso_code'].iloc[i][4:]
-
-                # Combine strings to get last year + 'W' + the same week for the first year (364 rows)
-                df_date.at[i, 'last_year_equiv_week_fk'] = left + right
-            else:
-                # Do nothing for rows after the first 364
-                pass
-
-        return df_date
-
-    def add_time_fiscal_week_id_fk(self, df_date):
+    def add_equivalent_year_keys(self, df_date):
         """
-        This method adds the 'time_fiscal_week_id_fk' column to the DataFrame.
-        The values in this column are the same as those in the 'fiscal_week_iso_code' column.
+        Add the last year and prior year equivalent keys in a single stage.
 
         Args:
-            df_date (pd.DataFrame): DataFrame that contains the 'fiscal_week_iso_code' column.
+            df_date (pd.DataFrame): DataFrame that contains the 'Date' and 'fiscal_week_iso_code' columns.
 
         Returns:
-            pd.DataFrame: The updated DataFrame with the new 'time_fiscal_week_id_fk' column.
+            pd.DataFrame: The updated DataFrame with the new 'last_year_equiv_day_fk', 'last_year_equiv_week_fk' and
+            'prior_year_from_last_year_equiv_day_fk' columns.
         """
-        df_date['time_fiscal_week_id_fk'] = df_date['fiscal_week_iso_code']
+        last_year_day_fk, last_year_week_fk = self.equivalent_year_keys(df_date, years_back=1)
+        prior_year_day_fk, _ = self.equivalent_year_keys(df_date, years_back=2)
+        df_date['last_year_equiv_day_fk'] = last_year_day_fk
+        df_date['last_year_equiv_week_fk'] = last_year_week_fk
+        df_date['prior_year_from_last_year_equiv_day_fk'] = prior_year_day_fk
         return df_date
 
-    def add_prior_year_from_last_year_equiv_day_fk(self, df_date):
+    def equivalent_year_keys(self, df_date, years_back: int = 1):
         """
-        This method adds the 'prior_year_from_last_year_equiv_day_fk' column to the DataFrame.
-        The values in this column are calculated by subtracting 2 years (364*2 days) from the 'Date' column.
+        Day and week keys of the equivalent day a number of fiscal years back.
 
-        Args:
-            df_date (pd.DataFrame): DataFrame that contains the 'Date' column.
+        Parameters:
+            - df_date (pd.DataFrame): Consecutive days starting at the first day of a fiscal year, with the 'Date' and
+              'fiscal_week_iso_code' columns.
+            - years_back (int): Number of fiscal years back, each fiscal year back is 364 days (default is 1).
 
         Returns:
-            pd.DataFrame: The updated DataFrame with the new 'prior_year_from_last_year_equiv_day_fk' column.
+            tuple: Object arrays with the day keys (yyyymmdd) and the week keys (yyyyWww) of the equivalent days.
+
+        The equivalent day is always 52 weeks per year back, so 53-week years are handled like this:
+            - week 53 of a 53-week year is equivalent to week 1 of the same fiscal year
+            - every week of the fiscal year after a 53-week year is equivalent to the following week of the 53-week
+              year e.g. 2024W01 to 2023W02
+            - days within the first years_back * 364 rows have no equivalent row in the calendar, they use the same
+              week within the first 52 weeks of the calendar, moved back by the missing number of fiscal years
         """
-        df_date['prior_year_from_last_year_equiv_day_fk'] = (
-                df_date['Date'].dt.date - timedelta(days=364 * 2)).apply(lambda x: x.strftime('%Y%m%d'))
-        return df_date
+        days = df_date['Date'].values.astype('datetime64[D]').astype(np.int64)
+        week_iso_codes = df_date['fiscal_week_iso_code'].to_numpy(dtype=object)
+        shift = LAST_YEAR_DAYS * years_back
+
+        day_fk = format_dates(days - shift, '%Y%m%d')
+        week_fk = np.empty(len(days), dtype=object)
+        if shift < len(days):
+            week_fk[shift:] = week_iso_codes[:len(days) - shift]
+
+        # at most years_back * 364 rows, e.g. with years_back=2 the row 400 is the same week as row 400 - 364 = 36
+        # moved back by one fiscal year, the row 36 the same week as row 36 moved back by two fiscal years
+        rows = np.arange(min(shift, len(days)))
+        first_year_codes = week_iso_codes[rows % LAST_YEAR_DAYS]
+        missing_years = years_back - rows // LAST_YEAR_DAYS
+        week_fk[:len(rows)] = [f'{int(code[0:4]) - missing}{code[4:]}'
+                               for code, missing in zip(first_year_codes, missing_years)]
+        return day_fk, week_fk
 
-    def add_prior_year_from_last_year_equiv_week_fk(self, df_date):
+    def add_time_fiscal_week_id_fk(self, df_date):
         """
-        Add a column 'last_year_equiv_week_fk' to the DataFrame representing the equivalent fiscal week in the prior year.
-
-        Parameters:
-            df_date (pd.DataFrame): DataFrame containing the 'fiscal_week_iso_code' column.
+        This method adds the 'time_fiscal_week_id_fk' column to the DataFrame.
+        The values in this column are the same as those in the 'fiscal_week_iso_code' column.
 
-        This method adds a new column 'last_year_equiv_week_fk' to the DataFrame. The values in this column represent
-        the equivalent fiscal week in the prior year, derived from the 'fiscal_week_iso_code' column. The calculation
-        considers a shift of 364 rows for the initial set of rows, and then iterates over each row to determine the
-        equivalent week in the prior year.
+        Args:
+            df_date (pd.DataFrame): DataFrame that contains the 'fiscal_week_iso_code' column.
 
         Returns:
-            pd.DataFrame: DataFrame with an additional column 'last_year_equiv_week_fk' calculated based on the
-                          'fiscal_week_iso_code' column.
-        """
-        df_date['last_year_equiv_week_fk'] = df_date['fiscal_week_iso_code'].shift(364)
-
-        # iterate over all rows of the dataframe
-        for i in range(len(df_date)):
-            # e.g. start from 0, so it will be for 364 days iterate 364 times
-            if i <= 363:
-                # get first for 4 characters e.g. year <yyyy> left part convert from string to integer and get last year e.g. (year - 1)
-                left = str(int(df_date['fiscal_week_iso_code'].iloc[i][0:4]) - 1)
-                # define right-part e.g. rest of string after year has been removed e.g. (yyyyW01) -> W01
-                right = df_date['fiscal_week_iso_code'].iloc[i][4:]
-                # combine string to get last year + 'W' + same week for first year e.g. 364 rows
-                df_date.at[i, 'last_year_equiv_week_fk'] = left + right
-            else:
-                # do nothing
-                pass
+            pd.DataFrame: The updated DataFrame with the new 'time_fiscal_week_id_fk' column.
+        """
+        df_date['time_fiscal_week_id_fk'] = df_date['fiscal_week_iso_code']
         return df_date
 
     def add_last_year_equiv_day_date(self, df_date):
@@ -1029,48 +1242,17 @@ class FiscalCalendarGenerator:
             df_date (pd.DataFrame): DataFrame containing the 'Date' column.
 
         This method calculates and adds a new column 'fiscal_year_start_date' to the DataFrame. The values in this column
-        represent the start date of the fiscal year based on the provided 'Date' column. The calculation considers the
-        cumulative count of days in each month to determine the fiscal year start date.
+        represent the start date of the fiscal year based on the provided 'Date' column. The fiscal year of each date
+        is looked up in the boundary index created by generate_fiscal_calendar().
 
         Returns:
             pd.DataFrame: DataFrame with an additional column 'fiscal_year_start_date' representing the fiscal year's start date.
         """
-        # counter for number of days in year
-        count_days = 0
-        # counter for month number in for loop
-        counter_months = 0
-        # container to hold start date x number of times per year in array
-        lst_year_days = []
-        # define start date as the minimum date found within the df_date dataframe defined by user
-        my_start_date = df_date['Date'].min()
-
-        # iterate over the list of months
-        for month_iterator in self.lst_months:
-
-            # sum the days for each month up to the 12th month
-            count_days += len(month_iterator)
-            counter_months += 1
-
-            # if 12th month in loop -> determine the total number of days in year of the 12 months to update fiscal
-            # start date
-            if counter_months == 12:
-                # repeat fiscal start date x number of times whereby x equal to days in fiscal year e.g. 364 or 371
-                lst_year_days.append(np.repeat(my_start_date, count_days))
-                # update start date
-                my_start_date += timedelta(days=count_days)
-
-                # reset the counters
-                count_days = 0
-                counter_months = 0
-
-        # unstack the list of lists to a single list
-        output_lst_start_dates = np.hstack(lst_year_days)
-
-        # convert list of months to pandas dataframe series
-        df_date['fiscal_year_start_date'] = pd.Series(list(output_lst_start_dates))
+        year_index = self.boundary_index.locate(df_date['Date'].values, 'year')
 
         # change format to <m/d/yyyy>
-        df_date['fiscal_year_start_date'] = df_date['fiscal_year_start_date'].apply(lambda x: x.strftime('%m/%d/%Y'))
+        year_starts = self.boundary_index.year_starts.astype(np.int64)
+        df_date['fiscal_year_start_date'] = format_dates(year_starts, '%m/%d/%Y')[year_index]
         return df_date
 
     def add_fiscal_year_end_date(self, df_date):
@@ -1081,33 +1263,15 @@ class FiscalCalendarGenerator:
             df_date (pd.DataFrame): DataFrame containing the 'Date' column.
 
         This method calculates and adds a new column 'fiscal_year_end_date' to the DataFrame. The values in this column
-        represent the end date of the fiscal year based on the provided 'Date' column. The calculation considers the
-        cumulative count of days in each month to determine the fiscal year end date.
+        represent the end date of the fiscal year based on the provided 'Date' column. The fiscal year of each date
+        is looked up in the boundary index created by generate_fiscal_calendar().
 
         Returns:
             pd.DataFrame: DataFrame with an additional column 'fiscal_year_end_date' i.e. fiscal year's end date.
         """
-        count_days = 0
-        counter_months = 0
-        lst_num_days = []
-
-        # Use the minimum date from df_date as the initial my_start_date
-        my_start_date = df_date['Date'].min()
-        my_end_date = my_start_date
-
-        for i in self.lst_months:
-            count_days += len(i)
-            counter_months += 1
-            if counter_months == 12:
-                # Use my_end_date as the starting point for the fiscal year end date
-                lst_num_days.append(np.repeat((my_end_date + timedelta(days=(count_days - 1))), count_days))
-                my_end_date += timedelta(days=count_days)
-                count_days = 0
-                counter_months = 0
-
-        output_lst_end_dates = np.hstack(lst_num_days)
-        df_date['fiscal_year_end_date'] = pd.Series(list(output_lst_end_dates))
-        df_date['fiscal_year_end_date'] = df_date['fiscal_year_end_date'].apply(lambda x: x.strftime('%m/%d/%Y'))
+        year_index = self.boundary_index.locate(df_date['Date'].values, 'year')
+        year_ends = self.boundary_index.ends('year').astype(np.int64)
+        df_date['fiscal_year_end_date'] = format_dates(year_ends, '%m/%d/%Y')[year_index]
         return df_date
 
     def add_fiscal_year_number_of_weeks(self, df_date):
@@ -1125,38 +1289,8 @@ class FiscalCalendarGenerator:
             pd.DataFrame: DataFrame with an additional column 'fiscal_year_number_of_weeks' representing the number
                           of fiscal weeks in each corresponding fiscal year.
         """
-        # container to hold end date repeated x number of times per year in array with x equal to 364 or 371
-        lst_num_weeks = []
-        # counter for number of days in year
-        count_days = 0
-        # counter for month number in for loop
-        counter_months = 0
-
-        # iterate over the list of months
-        for i in self.lst_months:
-            # sum the days for each month up to the 12th month
-            count_days += len(i)
-            # increment the counter for the number of months
-            counter_months += 1
-
-            # if 12 months are iterated over add all the days to check if 364 or 371 days
-            if counter_months == 12:
-                # Check if count_days is equal to 364 or 371
-                if count_days == 364:
-                    # Repeat fiscal end date x number of times whereby x equal to days in fiscal year e.g. 364 or 371
-                    lst_num_weeks.append(np.repeat(52, count_days))
-                elif count_days == 371:
-                    lst_num_weeks.append(np.repeat(53, count_days))
-
-                # Reset the counters after every fiscal year (e.g., every 12 months)
-                count_days = 0
-                counter_months = 0
-
-        # unstack the list of lists to a single list
-        output_lst_num_weeks = np.hstack(lst_num_weeks)
-
-        # convert list of months to pandas dataframe series
-        df_date['fiscal_year_number_of_weeks'] = pd.Series(list(output_lst_num_weeks))
+        year_index = self.boundary_index.locate(df_date['Date'].values, 'year')
+        df_date['fiscal_year_number_of_weeks'] = self.boundary_index.year_weeks[year_index]
         return df_date
 
     def add_fiscal_year_number_of_days(self, df_date):
@@ -1194,3 +1328,29 @@ class FiscalCalendarGenerator:
         """
         df_date['time_day_id_pk_int'] = df_date['time_day_id_pk'].astype('int64')
         return df_date
+
+
+def create_calendar(config, engine: str = 'vectorized', typed: bool = False, cache: CalendarCache = None,
+                    instrument=None, columns: list = None, workers: int = None):
+    """
+    Build the fiscal calendar of a configuration, without state shared between calls.
+
+    Parameters:
+        - config (FiscalCalendarConfig): Immutable configuration of the fiscal calendar.
+        - engine, typed, cache, instrument, columns, workers: See FiscalCalendarGenerator.create_dataframe().
+
+    Returns:
+        pd.DataFrame: The same DataFrame as FiscalCalendarGenerator.from_config(config).create_dataframe().
+
+    Example:
+    ```python
+    from concurrent.futures import ThreadPoolExecutor
+    from fiscal_calendar import FiscalCalendarConfig, create_calendar
+
+    config = FiscalCalendarConfig(start_date='2021-01-31', end_date='2025-02-01')
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        lst_calendars = list(executor.map(lambda columns: create_calendar(config, columns=columns), lst_requests))
+    ```
+    """
+    return FiscalCalendarGenerator.from_config(config).create_dataframe(engine, typed, cache, instrument, columns,
+                                                                        workers)
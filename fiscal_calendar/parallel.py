@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+Parallel generation of fiscal calendars in worker processes.
+
+Fiscal years are independent once the layout of the fiscal years is known, and the vectorized engine derives the last
+year and prior year keys from the global row of each day, so blocks of fiscal years can be built in separate processes
+and concatenated without fixing up the keys that look across fiscal years.
+"""
+# standard libraries
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from fiscal_calendar.engine import FiscalCalendarEngine
+
+
+def _build_rows(start_date, end_date, start_row, stop_row, typed, columns):
+    return FiscalCalendarEngine(start_date, end_date).build(columns=columns, start_row=start_row, stop_row=stop_row,
+                                                           typed=typed)
+
+
+def _build_calendar(start_date, end_date, typed, columns):
+    return FiscalCalendarEngine(start_date, end_date).build(columns=columns, typed=typed)
+
+
+def _resolve_workers(workers):
+    if workers is None:
+        return os.cpu_count() or 1
+    return max(int(workers), 1)
+
+
+def _check_start_date(start_date):
+    # the vectorized engine treats the start date as the first day of fiscal month 1
+    if pd.Timestamp(start_date).month != 1:
+        raise ValueError(f"Parallel generation requires a start date in January, got {start_date}")
+
+
+def build_parallel(start_date, end_date, workers=None, typed=False, columns=None):
+    """
+    Build a fiscal calendar in blocks of consecutive fiscal years in worker processes.
+
+    Args:
+        start_date (str): The start date of the fiscal calendar in the format 'yyyy-mm-dd', in January.
+        end_date (str): The end date of the fiscal calendar in the format 'yyyy-mm-dd'.
+        workers (int, optional): Number of worker processes (default is None, which uses every CPU).
+        typed (bool, optional): If True, return compact typed columns instead of strings (default is False).
+        columns (list, optional): Columns to return, defaults to all columns of create_dataframe().
+
+    Returns:
+        pd.DataFrame: The same DataFrame as FiscalCalendarEngine(start_date, end_date).build(columns, typed=typed).
+    """
+    _check_start_date(start_date)
+    engine = FiscalCalendarEngine(start_date, end_date)
+    year_ranges = engine.year_row_ranges()
+    workers = min(_resolve_workers(workers), len(year_ranges))
+    if workers <= 1:
+        return engine.build(columns=columns, typed=typed)
+
+    # one block of consecutive fiscal years per worker, so every worker returns a single frame
+    lst_blocks = [(year_ranges[block[0]][0], year_ranges[block[-1]][1])
+                  for block in np.array_split(np.arange(len(year_ranges)), workers)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_build_rows, start_date, end_date, start_row, stop_row, typed, columns)
+                   for start_row, stop_row in lst_blocks]
+        return pd.concat([future.result() for future in futures], ignore_index=True)
+
+
+def build_many(configurations, workers=None, typed=False, columns=None):
+    """
+    Build the fiscal calendars of many configurations in worker processes, one calendar per task.
+
+    Args:
+        configurations (list): (start_date, end_date) tuples, every start date in January.
+        workers (int, optional): Number of worker processes (default is None, which uses every CPU).
+        typed (bool, optional): If True, return compact typed columns instead of strings (default is False).
+        columns (list, optional): Columns to return, defaults to all columns of create_dataframe().
+
+    Returns:
+        list: DataFrame of every configuration, in order of the configurations.
+
+    Example:
+    ```python
+    from fiscal_calendar.parallel import build_many
+
+    lst_calendars = build_many([('2000-01-30', '2030-02-02'), ('2021-01-31', '2025-02-01')], typed=True)
+    ```
+    """
+    for start_date, _ in configurations:
+        _check_start_date(start_date)
+    workers = min(_resolve_workers(workers), len(configurations))
+    if workers <= 1:
+        return [_build_calendar(start_date, end_date, typed, columns) for start_date, end_date in configurations]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_build_calendar, start_date, end_date, typed, columns)
+                   for start_date, end_date in configurations]
+        return [future.result() for future in futures]
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+"""
+PDF export of fiscal calendars, one letter page per fiscal year, used by
+FiscalCalendarGenerator.save_fiscal_calendar_to_pdf().
+
+The page content (month grids and the x position of every centered line) is prepared from the arrays of
+fiscal_calendar.render, optionally in worker processes, the canvas then only draws the prepared lines.
+"""
+# standard libraries
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+# packages related to pdf reporting
+from reportlab.lib.pagesizes import letter
+from reportlab.pdfgen import canvas
+from reportlab.pdfbase.pdfmetrics import stringWidth
+
+from fiscal_calendar.render import fiscal_calendar_arrays, render_arrays
+
+FONT = 'Courier'
+FONT_SIZE = 10
+TITLE_FONT_SIZE = FONT_SIZE + 10
+DATE_RANGE_FONT_SIZE = FONT_SIZE + 2
+TOP_MARGIN = 700
+LINE_HEIGHT = 12
+
+
+def prepare_pages(arrays, columns=3, week_number=False):
+    """
+    Prepare the lines of the pages of fiscal years.
+
+    Args:
+        arrays (dict): Arrays of fiscal_calendar.render.fiscal_calendar_arrays(), or the rows of some fiscal years.
+        columns (int): Number of months per row (default is 3).
+        week_number (bool): If True, prefix every week with its fiscal week number (default is False).
+
+    Returns:
+        dict: Fiscal year (str) to a list of (x, line) tuples, every line centered on the page.
+    """
+    page_width = letter[0]
+    # Courier is monospaced, so every line of the same length has the same x position
+    x_by_length = {}
+    pages = {}
+    for label, text in render_arrays(arrays, columns, week_number).items():
+        lines = []
+        # replace spaces with non-breaking spaces
+        for line in text.replace(' ', '\u00A0').split('\n'):
+            if len(line) not in x_by_length:
+                x_by_length[len(line)] = (page_width - stringWidth(line, FONT, FONT_SIZE)) / 2
+            lines.append((x_by_length[len(line)], line))
+        pages[label] = lines
+    return pages
+
+
+def draw_page(c, title, date_range, lines):
+    """
+    Draw the page of one fiscal year.
+
+    Args:
+        c (canvas.Canvas): The canvas to draw on.
+        title (str): Title at the top of the page e.g. 'Fiscal Calendar 2024'.
+        date_range (str): First and last date of the fiscal year below the title.
+        lines (list): (x, line) tuples of prepare_pages().
+    """
+    page_width = letter[0]
+    c.setFont(FONT, TITLE_FONT_SIZE)
+    c.drawCentredString(page_width / 2.0, TOP_MARGIN, title)
+    c.setFont(FONT, DATE_RANGE_FONT_SIZE)
+    c.drawCentredString(page_width / 2.0, TOP_MARGIN - 20, date_range)
+    c.setFont(FONT, FONT_SIZE)
+    for i, (x, line) in enumerate(lines):
+        c.drawString(x, TOP_MARGIN - 72 - i * LINE_HEIGHT, line)
+
+
+def save_pdf(df_fiscal_calendar, filename, columns=3, week_number=False, years=None, workers=None):
+    """
+    Save the month grids of fiscal years to a PDF file, one page per fiscal year.
+
+    Args:
+        df_fiscal_calendar (pd.DataFrame): Fiscal calendar of create_dataframe(), with string or typed columns.
+        filename (str): Path of the PDF file.
+        columns (int): Number of months per row (default is 3).
+        week_number (bool): If True, prefix every week with its fiscal week number (default is False).
+        years (list): Fiscal years to save (default is None, which saves every fiscal year of the frame).
+        workers (int): Number of worker processes preparing the pages (default is None, which prepares the pages in
+            the current process).
+
+    Raises:
+        ValueError: If the frame has no rows for the requested fiscal years.
+    """
+    arrays = fiscal_calendar_arrays(df_fiscal_calendar)
+    if years is not None:
+        keep = np.isin(arrays['fiscal_year'], [str(year) for year in years])
+        arrays = {name: values[keep] for name, values in arrays.items()}
+        df_fiscal_calendar = df_fiscal_calendar[keep]
+    if not len(arrays['fiscal_year']):
+        raise ValueError(f"No fiscal calendar rows for fiscal year(s) {years}")
+
+    # first and last date of every fiscal year, in order of the frame
+    labels, first_rows = np.unique(arrays['fiscal_year'], return_index=True)
+    _, last_rows_reversed = np.unique(arrays['fiscal_year'][::-1], return_index=True)
+    last_rows = len(arrays['fiscal_year']) - 1 - last_rows_reversed
+    order = np.argsort(first_rows)
+    day_date = df_fiscal_calendar['day_date']
+    if pd.api.types.is_datetime64_any_dtype(day_date):
+        day_date = day_date.dt.strftime('%m/%d/%Y')
+    day_date = day_date.to_numpy()
+    date_ranges = {labels[i]: f'{day_date[first_rows[i]]} - {day_date[last_rows[i]]}' for i in order}
+
+    if workers is not None and workers > 1 and len(labels) > 1:
+        # every worker prepares the pages of a consecutive block of fiscal years
+        year_blocks = [block for block in np.array_split(labels[order], min(workers, len(labels))) if len(block)]
+        pages = {}
+        with ProcessPoolExecutor(max_workers=len(year_blocks)) as executor:
+            futures = []
+            for block in year_blocks:
+                keep = np.isin(arrays['fiscal_year'], block)
+                futures.append(executor.submit(
+                    prepare_pages, {name: values[keep] for name, values in arrays.items()}, columns, week_number))
+            for future in futures:
+                pages.update(future.result())
+    else:
+        pages = prepare_pages(arrays, columns, week_number)
+
+    try:
+        c = canvas.Canvas(filename, pagesize=letter)
+        for label, lines in pages.items():
+            draw_page(c, f'Fiscal Calendar {label}', date_ranges[label], lines)
+            c.showPage()
+        c.save()
+    except PermissionError as e:
+        raise PermissionError(f"Failed to save PDF: Permission denied for '{filename}'. "
+                              f"Ensure the file is not open and try again.") from e
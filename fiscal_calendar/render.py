@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""
+Text rendering of fiscal calendars as month grids, used by FiscalCalendarGenerator.print_fiscal_calendar().
+
+The calendar frame is reduced once to integer arrays (fiscal year, fiscal month, day of month, fiscal day of week and
+fiscal week) and grouped by fiscal year and month with a single stable sort, every month grid is then filled from its
+slice of the arrays.
+"""
+import numpy as np
+import pandas as pd
+
+# width of a month column and separator between month columns of the wall calendar
+MONTH_WIDTH = 28
+COLUMN_SEPARATOR = '   '
+
+# right aligned day of month strings, index 0 is an empty cell
+_DAY_STRINGS = ['  '] + [f'{day:2d}' for day in range(1, 32)]
+_EMPTY_CELL = '    '
+
+
+def fiscal_calendar_arrays(df_fiscal_calendar):
+    """
+    Reduce a fiscal calendar frame to the arrays needed to render month grids.
+
+    Args:
+        df_fiscal_calendar (pd.DataFrame): Fiscal calendar of create_dataframe(), with string or typed columns.
+
+    Returns:
+        dict: Arrays fiscal_year (str), month (int), month_name (str), day (int), day_of_week (int, 0 = first day of
+        the fiscal week) and week (int), one value per row.
+    """
+    day_date = df_fiscal_calendar['day_date']
+    if pd.api.types.is_datetime64_any_dtype(day_date):
+        day = day_date.dt.day.to_numpy(dtype=np.int64)
+    else:
+        # day_date is formatted as mm/dd/yyyy
+        day = day_date.str.slice(3, 5).astype(np.int64).to_numpy()
+    return {
+        'fiscal_year': df_fiscal_calendar['fiscal_year'].astype(str).to_numpy(dtype=object),
+        'month': df_fiscal_calendar['fiscal_month_of_year'].to_numpy(dtype=np.int64),
+        'month_name': df_fiscal_calendar['fiscal_month_name'].astype(str).to_numpy(dtype=object),
+        'day': day,
+        'day_of_week': df_fiscal_calendar['fiscal_day_of_week'].to_numpy(dtype=np.int64) - 1,
+        'week': df_fiscal_calendar['fiscal_week_of_year'].to_numpy(dtype=np.int64),
+    }
+
+
+def render_month(month_name, fiscal_year, day, day_of_week, week, week_number=False):
+    """
+    Render the grid of one fiscal month.
+
+    Args:
+        month_name (str): Name of the fiscal month e.g. 'February'.
+        fiscal_year (str): Fiscal year e.g. '2024'.
+        day (np.ndarray): Day of month of every day of the fiscal month.
+        day_of_week (np.ndarray): Position of every day within its fiscal week (0-6).
+        week (np.ndarray): Fiscal week of year of every day.
+        week_number (bool): If True, prefix every week with its fiscal week number (default is False).
+
+    Returns:
+        str: The month title, the header with the day names and one line per fiscal week, each ending with a newline.
+    """
+    lines = [f'{month_name} FY{fiscal_year}']
+    first_week = int(week.min())
+    last_week = int(week.max())
+    if week_number:
+        lines.append('W  | Su Mo Tu We Th Fr Sa' if last_week > 9 else 'W | Su Mo Tu We Th Fr Sa')
+    else:
+        lines.append('Su Mo Tu We Th Fr Sa')
+
+    grid = np.zeros((last_week - first_week + 1, 7), dtype=np.int64)
+    grid[week - first_week, day_of_week] = day
+    for week_offset, week_days in enumerate(grid.tolist()):
+        if not any(week_days):
+            continue
+        week_line = ' '.join(_DAY_STRINGS[d] if d else _EMPTY_CELL for d in week_days)
+        lines.append(f'{first_week + week_offset} | {week_line}' if week_number else week_line)
+    return '\n'.join(lines) + '\n'
+
+
+def render_months(months, columns=3):
+    """
+    Arrange rendered month grids in rows of a number of columns.
+
+    Args:
+        months (list): Rendered months of render_month().
+        columns (int): Number of months per row (default is 3).
+
+    Returns:
+        str: The months side by side, every row of months followed by an empty line.
+    """
+    output = []
+    for i in range(0, len(months), columns):
+        split_months = [month.split('\n') for month in months[i:i + columns]]
+        max_lines = max(len(split_month) for split_month in split_months)
+        for j in range(max_lines):
+            output.append(COLUMN_SEPARATOR.join(
+                (split_month[j] if j < len(split_month) else '').ljust(MONTH_WIDTH) for split_month in split_months))
+            output.append('\n')
+        output.append('\n')
+    return ''.join(output)
+
+
+def render_fiscal_years(df_fiscal_calendar, columns=3, week_number=False, years=None):
+    """
+    Render the month grids of fiscal years.
+
+    Args:
+        df_fiscal_calendar (pd.DataFrame): Fiscal calendar of create_dataframe(), with string or typed columns.
+        columns (int): Number of months per row (default is 3).
+        week_number (bool): If True, prefix every week with its fiscal week number (default is False).
+        years (list): Fiscal years to render (default is None, which renders every fiscal year of the frame).
+
+    Returns:
+        dict: Fiscal year (str) to its rendered months, in order of the frame.
+    """
+    return render_arrays(fiscal_calendar_arrays(df_fiscal_calendar), columns, week_number, years)
+
+
+def render_arrays(arrays, columns=3, week_number=False, years=None):
+    """
+    Render the month grids of fiscal years from the arrays of fiscal_calendar_arrays().
+
+    Args:
+        arrays (dict): Arrays of fiscal_calendar_arrays(), or a subset of their rows.
+        columns (int): Number of months per row (default is 3).
+        week_number (bool): If True, prefix every week with its fiscal week number (default is False).
+        years (list): Fiscal years to render (default is None, which renders every fiscal year of the arrays).
+
+    Returns:
+        dict: Fiscal year (str) to its rendered months, in order of the arrays.
+    """
+    fiscal_year = arrays['fiscal_year']
+    if years is not None:
+        keep = np.isin(fiscal_year, [str(year) for year in years])
+        arrays = {name: values[keep] for name, values in arrays.items()}
+        fiscal_year = arrays['fiscal_year']
+
+    # number the fiscal years in order of appearance and group the rows by fiscal year and month with one stable sort
+    year_labels, first_rows, year_codes = np.unique(fiscal_year, return_index=True, return_inverse=True)
+    year_order = np.argsort(first_rows)
+    year_rank = np.empty_like(year_order)
+    year_rank[year_order] = np.arange(len(year_order))
+    group = year_rank[year_codes] * 13 + arrays['month']
+    order = np.argsort(group, kind='stable')
+    group = group[order]
+    boundaries = np.flatnonzero(np.diff(group)) + 1
+    starts = np.concatenate(([0], boundaries)) if len(group) else np.array([], dtype=np.int64)
+    stops = np.concatenate((boundaries, [len(group)])) if len(group) else np.array([], dtype=np.int64)
+
+    sorted_arrays = {name: values[order] for name, values in arrays.items()}
+    rendered = {str(year_labels[index]): [] for index in year_order}
+    for start, stop in zip(starts.tolist(), stops.tolist()):
+        label = sorted_arrays['fiscal_year'][start]
+        rendered[label].append(render_month(
+            sorted_arrays['month_name'][start], label, sorted_arrays['day'][start:stop],
+            sorted_arrays['day_of_week'][start:stop], sorted_arrays['week'][start:stop], week_number))
+
+    return {label: render_months(months, columns) for label, months in rendered.items()}
@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+# standard libraries
+from bisect import bisect_right
+from datetime import date
+
+# only the standard library core is needed to resolve a single date, NumPy and pandas are not loaded
+from fiscal_calendar.core import (COLUMNS, LAST_YEAR_DAYS, PRIOR_YEAR_DAYS, MONTH_WEEKS as _MONTH_WEEKS,
+                                  MONTH_FIRST_WEEK as _MONTH_FIRST_WEEK, WEEK_TO_MONTH as _WEEK_TO_MONTH,
+                                  DAY_NAMES as _DAY_NAMES, DAY_SHORT_NAMES as _DAY_SHORT_NAMES,
+                                  DAY_LETTERS as _DAY_LETTERS, SEASON_NAMES as _SEASON_NAMES, PERIOD_LEVELS,
+                                  year_layout, fiscal_month_names, parse_period_key, to_day_number, _EPOCH_ORDINAL)
+
+# number of periods per fiscal year of the levels with a fixed number
+_PERIODS_PER_YEAR = {'year': 1, 'season': 2, 'quarter': 4, 'month': 12}
+
+
+class FiscalDateResolver:
+    """
+    Resolves the fiscal attributes of a single date in closed form, without building a DataFrame.
+
+    The start day and number of weeks of each fiscal year are calculated once, a lookup is a binary search over the
+    fiscal year starts followed by integer arithmetic on the day offset within the fiscal year.
+
+    Attributes:
+        - start_date (str): The start date of the fiscal calendar in the format 'yyyy-mm-dd', in January.
+        - end_date (str): The end date of the fiscal calendar in the format 'yyyy-mm-dd'.
+
+    Usage:
+        resolver = FiscalDateResolver(start_date='2021-01-31', end_date='2025-02-01')
+        attributes = resolver.resolve(date(2024, 8, 15))
+        attributes['fiscal_week_iso_code']  # '2024W28'
+        resolver.period_range('month', 2024, 7)['start_date']  # date(2024, 8, 4)
+    """
+
+    def __init__(self, start_date, end_date):
+        # like the vectorized engine, the start date is the first day of fiscal month 1, which matches the month
+        # numbering of create_dataframe() only for start dates in January
+        if date.fromordinal(to_day_number(start_date) + _EPOCH_ORDINAL).month != 1:
+            raise ValueError(f"FiscalDateResolver requires a start date in January, got {start_date}")
+        self.start_date = start_date
+        self.end_date = end_date
+        self.start_day = to_day_number(start_date)
+        self.end_day = to_day_number(end_date)
+        self.year_starts, self.year_weeks = year_layout(start_date, end_date)
+        self.first_fiscal_year = date.fromordinal(self.start_day + _EPOCH_ORDINAL).year
+        self.month_names = fiscal_month_names(start_date)
+
+    def _locate(self, day):
+        # fiscal year index and zero-based fiscal week of year of a day number
+        year_index = bisect_right(self.year_starts, day) - 1
+        return year_index, (day - self.year_starts[year_index]) // 7
+
+    def resolve(self, day):
+        """
+        Resolve all fiscal attributes of a date.
+
+        Args:
+            day (str | date | datetime | np.datetime64 | pd.Timestamp): The date to resolve, strings use the format
+                'yyyy-mm-dd'. Must be within start_date and end_date.
+
+        Returns:
+            dict: Column name to value, identical to the row of create_dataframe() for this date.
+        """
+        day_number = to_day_number(day)
+        if not self.start_day <= day_number <= self.end_day:
+            raise ValueError(f"Date {day} is outside of the fiscal calendar {self.start_date} - {self.end_date}")
+
+        row = day_number - self.start_day
+        year_index, week_index = self._locate(day_number)
+        year_start = self.year_starts[year_index]
+        year_weeks = self.year_weeks[year_index]
+        day_of_year = day_number - year_start
+        fiscal_year = self.first_fiscal_year + year_index
+        day_index = (day_number + 4) % 7  # sunday = 0, the epoch 1970-01-01 was a thursday
+
+        week = week_index + 1
+        month = _WEEK_TO_MONTH[week_index]
+        month_weeks = _MONTH_WEEKS[month - 1] + (1 if month == 12 and year_weeks == 53 else 0)
+        week_of_month = week_index - _MONTH_FIRST_WEEK[month - 1] + 1
+        quarter = min(day_of_year // 91, 3) + 1
+        season = 1 if quarter <= 2 else 2
+        week_iso_code = f'{fiscal_year}W{week:02d}'
+
+        # the last year equivalent week and month refer to the row 364 days earlier, the first 364 rows of the
+        # calendar use the same week of the previous year and their own month instead
+        if row >= LAST_YEAR_DAYS:
+            last_year_index, last_year_week_index = self._locate(day_number - LAST_YEAR_DAYS)
+            last_year_week = f'{self.first_fiscal_year + last_year_index}W{last_year_week_index + 1:02d}'
+            last_year_month = _WEEK_TO_MONTH[last_year_week_index]
+        else:
+            last_year_week = f'{fiscal_year - 1}W{week:02d}'
+            last_year_month = month
+
+        day_date = _to_date(day_number)
+        week_start = _to_date(day_number - day_index)
+        last_year_date = _to_date(day_number - LAST_YEAR_DAYS)
+        prior_year_date = _to_date(day_number - PRIOR_YEAR_DAYS)
+        month_name = self.month_names[month - 1]
+        day_key = _ymd(day_date)
+
+        values = (
+            day_key,  # time_day_id_pk
+            _mdy(day_date),  # day_date
+            _DAY_SHORT_NAMES[day_index],  # day_of_week_short_name
+            _DAY_NAMES[day_index],  # day_of_week_name
+            _DAY_LETTERS[day_index],  # day_of_week_letter
+            day_index + 1,  # fiscal_day_of_week
+            week,  # fiscal_week_of_year
+            week if week <= 26 else week - 26,  # fiscal_week_of_season
+            week - 13 * min(week_index // 13, 3),  # fiscal_week_of_quarter
+            week_of_month,  # fiscal_week_of_month
+            _mdy(week_start),  # fiscal_week_start_date
+            _mdy(_to_date(day_number - day_index + 6)),  # fiscal_week_end_date
+            week_iso_code,  # fiscal_week_iso_code
+            month,  # fiscal_month_of_year
+            month if month <= 6 else month - 6,  # fiscal_month_of_season
+            (month - 1) % 3 + 1,  # fiscal_month_of_quarter
+            month_name,  # fiscal_month_name
+            month_name[0:3],  # fiscal_month_short_name
+            _mdy(_to_date(self.start_day)),  # fiscal_month_start_date (first date of the calendar)
+            _mdy(_to_date(self.start_day + 28 - 1)),  # fiscal_month_end_date (first date of the calendar + 27)
+            month_weeks,  # fiscal_month_number_of_weeks
+            month_weeks * 7,  # fiscal_month_number_of_days
+            quarter,  # fiscal_quarter_of_year
+            f'Q{quarter}',  # fiscal_quarter_of_year_str
+            quarter if quarter <= 2 else quarter - 2,  # fiscal_quarter_of_season
+            season,  # fiscal_season_of_year
+            _SEASON_NAMES[season - 1],  # fiscal_season_name
+            str(fiscal_year),  # fiscal_year
+            str(fiscal_year)[-2:],  # fiscal_year_2_digit
+            _mdy(_to_date(year_start)),  # fiscal_year_start_date
+            _mdy(_to_date(year_start + year_weeks * 7 - 1)),  # fiscal_year_end_date
+            year_weeks,  # fiscal_year_number_of_weeks
+            year_weeks * 7,  # fiscal_year_number_of_days
+            _ymd(last_year_date),  # last_year_equiv_day_fk
+            last_year_week,  # last_year_equiv_week_fk
+            _mdy(last_year_date),  # last_year_equiv_day_date
+            fiscal_year - 1,  # last_year_fiscal_year
+            last_year_month,  # last_year_fiscal_month_of_year
+            _ymd(prior_year_date),  # prior_year_from_last_year_equiv_day_fk
+            _mdy(prior_year_date),  # prior_year_from_last_year_equiv_day_date
+            week_iso_code,  # time_fiscal_week_id_fk
+            1 if week_of_month == 1 else 0,  # first_fiscal_week_of_fiscal_month_ind
+            1 if week_of_month == month_weeks else 0,  # last_fiscal_week_of_fiscal_month_ind
+            int(day_key),  # time_day_id_pk_int
+        )
+        return dict(zip(COLUMNS, values))
+
+    def period_range(self, level, fiscal_year, number=1):
+        """
+        Start and end date of a fiscal year, season, quarter, month or week, without searching the calendar.
+
+        The period is found by its offset within the fiscal year, the 53rd week of a fiscal year belongs to the last
+        week, month, quarter and season. Periods are returned whole, even if they end after end_date.
+
+        Args:
+            level (str): 'year', 'season', 'quarter', 'month' or 'week'.
+            fiscal_year (int): Fiscal year e.g. 2024.
+            number (int): Number of the period within the fiscal year e.g. 1-12 for months (default is 1).
+
+        Returns:
+            dict: 'start_date' and 'end_date' (date), 'number_of_days' and 'number_of_weeks' (int).
+        """
+        if level not in PERIOD_LEVELS:
+            raise ValueError(f"Unknown level '{level}', use one of {', '.join(PERIOD_LEVELS)}")
+        year_index = fiscal_year - self.first_fiscal_year
+        if not 0 <= year_index < len(self.year_starts):
+            raise ValueError(f"Fiscal year {fiscal_year} is outside of the fiscal calendar {self.start_date} - "
+                             f"{self.end_date}")
+        year_weeks = self.year_weeks[year_index]
+        num_periods = _PERIODS_PER_YEAR.get(level, year_weeks)
+        if not 1 <= number <= num_periods:
+            raise ValueError(f"Fiscal {level} {number} does not exist in fiscal year {fiscal_year}, use 1 to "
+                             f"{num_periods}")
+
+        # first zero-based week and number of weeks of the period, the 53rd week is added to the last period
+        if level == 'week':
+            first_week, num_weeks = number - 1, 1
+        else:
+            if level == 'month':
+                first_week, num_weeks = _MONTH_FIRST_WEEK[number - 1], _MONTH_WEEKS[number - 1]
+            else:
+                num_weeks = 52 // num_periods
+                first_week = num_weeks * (number - 1)
+            if number == num_periods:
+                num_weeks += year_weeks - 52
+
+        period_start = self.year_starts[year_index] + first_week * 7
+        return {
+            'start_date': _to_date(period_start),
+            'end_date': _to_date(period_start + num_weeks * 7 - 1),
+            'number_of_days': num_weeks * 7,
+            'number_of_weeks': num_weeks,
+        }
+
+    def period_key_range(self, key):
+        """
+        Start and end date of the fiscal period of a key, see period_range().
+
+        Args:
+            key (str | int): The fiscal year ('2024' or 2024) or the fiscal year, a level letter and the number
+                e.g. '2024S2', '2024Q3', '2024M07' or '2024W33'.
+
+        Returns:
+            dict: 'start_date' and 'end_date' (date), 'number_of_days' and 'number_of_weeks' (int).
+        """
+        return self.period_range(*parse_period_key(key))
+
+
+def _to_date(day_number):
+    return date.fromordinal(day_number + _EPOCH_ORDINAL)
+
+
+def _mdy(day):
+    return f'{day.month:02d}/{day.day:02d}/{day.year}'
+
+
+def _ymd(day):
+    return f'{day.year}{day.month:02d}{day.day:02d}'
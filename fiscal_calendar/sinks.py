@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""
+Sinks that receive the fiscal calendar chunk by chunk, used by FiscalCalendarGenerator.export().
+
+Each sink is written one fiscal year at a time, so exporting a large range never holds the whole calendar in memory.
+Parquet and Arrow IPC sinks require the optional dependency pyarrow (pip install fiscal_calendar[arrow]).
+"""
+
+
+class CalendarSink:
+    """
+    Base class for fiscal calendar sinks.
+
+    Subclasses implement write(df_chunk) and close(). Sinks can be used as context managers, which closes them on exit.
+    """
+
+    def write(self, df_chunk):
+        """
+        Write a chunk of rows.
+
+        Args:
+            df_chunk (pd.DataFrame): Consecutive fiscal calendar rows, every chunk has the same columns.
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """
+        Flush and close the sink.
+        """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class CsvSink(CalendarSink):
+    """
+    Appends each chunk to a CSV file, the header is written with the first chunk.
+
+    Args:
+        path (str): Path of the CSV file.
+        **to_csv_kwargs: Additional keyword arguments for pd.DataFrame.to_csv().
+    """
+
+    def __init__(self, path, **to_csv_kwargs):
+        self.path = path
+        self.to_csv_kwargs = to_csv_kwargs
+        self._file = None
+
+    def write(self, df_chunk):
+        header = self._file is None
+        if self._file is None:
+            self._file = open(self.path, 'w', newline='', encoding='utf-8')
+        df_chunk.to_csv(self._file, header=header, index=False, **self.to_csv_kwargs)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class ParquetSink(CalendarSink):
+    """
+    Writes each chunk as a row group of a Parquet file.
+
+    Args:
+        path (str): Path of the Parquet file.
+        **writer_kwargs: Additional keyword arguments for pyarrow.parquet.ParquetWriter (e.g. compression).
+    """
+
+    def __init__(self, path, **writer_kwargs):
+        self.pa = _import_pyarrow()
+        import pyarrow.parquet as pq
+        self.pq = pq
+        self.path = path
+        self.writer_kwargs = writer_kwargs
+        self._writer = None
+
+    def write(self, df_chunk):
+        table = self.pa.Table.from_pandas(df_chunk, preserve_index=False)
+        if self._writer is None:
+            self._writer = self.pq.ParquetWriter(self.path, table.schema, **self.writer_kwargs)
+        self._writer.write_table(table)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+class ArrowIpcSink(CalendarSink):
+    """
+    Writes each chunk as a record batch of an Arrow IPC (Feather v2) file.
+
+    Args:
+        path (str): Path of the Arrow IPC file.
+        **writer_kwargs: Additional keyword arguments for pyarrow.ipc.new_file (e.g. options).
+    """
+
+    def __init__(self, path, **writer_kwargs):
+        self.pa = _import_pyarrow()
+        self.path = path
+        self.writer_kwargs = writer_kwargs
+        self._sink = None
+        self._writer = None
+
+    def write(self, df_chunk):
+        batch = self.pa.RecordBatch.from_pandas(df_chunk, preserve_index=False)
+        if self._writer is None:
+            self._sink = self.pa.OSFile(self.path, 'wb')
+            self._writer = self.pa.ipc.new_file(self._sink, batch.schema, **self.writer_kwargs)
+        self._writer.write_batch(batch)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._sink.close()
+            self._writer = None
+            self._sink = None
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError("Parquet and Arrow IPC sinks require pyarrow, install it with "
+                          "'pip install fiscal_calendar[arrow]'") from e
+    return pyarrow
@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+"""
+Persistent on-disk store of generated fiscal calendars, loaded with memory mapping.
+
+Every calendar is saved as one .npy file per column plus a manifest.json, in a directory named after the hash of its
+configuration. Loading memory maps the .npy files read-only, so processes that open the same calendar share one
+physical copy of the data through the page cache and need no computation at startup. Typed calendars
+(create_dataframe(typed=True)) load zero-copy: numeric and datetime columns are the memory mapped arrays, categorical
+columns use the memory mapped codes. String calendars store fixed width unicode arrays, which are converted to Python
+strings when loaded.
+"""
+# standard libraries
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from fiscal_calendar.engine import COLUMNS, FiscalCalendarEngine, to_day_number
+
+# bump when the layout of the files or the columns of the calendar change, older entries are then rebuilt
+STORE_VERSION = 1
+MANIFEST = 'manifest.json'
+
+
+class CalendarStore:
+    """
+    Directory of generated fiscal calendars keyed by configuration hash.
+
+    The store can be passed as cache to create_dataframe(), calendars that are missing are built and saved on first use.
+    Entries are written to a temporary directory and renamed into place, so processes starting at the same time never
+    read a partially written calendar.
+
+    Attributes:
+        - directory (str): Root directory of the store, created if missing.
+
+    Usage:
+        store = CalendarStore('/var/cache/fiscal_calendar')
+        fc = FiscalCalendarGenerator(start_date='1900-01-28', end_date='2100-02-01')
+
+        # the first process builds and saves the calendar, every other process memory maps it
+        df_fiscal_calendar = fc.create_dataframe(typed=True, cache=store)
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def key(start_date, end_date, typed=False):
+        """
+        Configuration hash of a calendar.
+
+        Args:
+            start_date (str | date): The start date of the fiscal calendar.
+            end_date (str | date): The end date of the fiscal calendar.
+            typed (bool, optional): True for the typed columns of create_dataframe(typed=True) (default is False).
+
+        Returns:
+            str: Hex digest identifying the calendar, also the name of its directory.
+        """
+        configuration = {'version': STORE_VERSION, 'start_day': to_day_number(start_date),
+                         'end_day': to_day_number(end_date), 'typed': bool(typed), 'columns': list(COLUMNS)}
+        return hashlib.sha256(json.dumps(configuration, sort_keys=True).encode('utf-8')).hexdigest()[:32]
+
+    def path(self, start_date, end_date, typed=False):
+        """
+        Directory of a calendar in the store, whether it exists or not.
+        """
+        return os.path.join(self.directory, self.key(start_date, end_date, typed))
+
+    def __contains__(self, configuration):
+        start_date, end_date, typed = configuration
+        return os.path.exists(os.path.join(self.path(start_date, end_date, typed), MANIFEST))
+
+    def save(self, start_date, end_date, typed=False):
+        """
+        Build a calendar with the vectorized engine and save it to the store.
+
+        Args:
+            start_date (str): The start date of the fiscal calendar in the format 'yyyy-mm-dd', in January.
+            end_date (str): The end date of the fiscal calendar in the format 'yyyy-mm-dd'.
+            typed (bool, optional): If True, save the typed columns of create_dataframe(typed=True) (default is False).
+
+        Returns:
+            str: Directory of the saved calendar.
+        """
+        df_fiscal_calendar = FiscalCalendarEngine(start_date, end_date).build(typed=typed)
+        target = self.path(start_date, end_date, typed)
+        tmp_dir = tempfile.mkdtemp(prefix='.tmp-', dir=self.directory)
+        try:
+            manifest = {'version': STORE_VERSION, 'start_date': str(start_date), 'end_date': str(end_date),
+                        'typed': bool(typed), 'rows': len(df_fiscal_calendar), 'columns': {}}
+            for position, (name, values) in enumerate(df_fiscal_calendar.items()):
+                file_name = f'{position:02d}_{name}.npy'
+                entry = {'file': file_name}
+                if isinstance(values.dtype, pd.CategoricalDtype):
+                    entry.update(kind='category', categories=values.cat.categories.tolist(),
+                                 ordered=bool(values.cat.ordered))
+                    array = values.cat.codes.to_numpy()
+                elif values.dtype == object:
+                    entry['kind'] = 'str'
+                    array = values.to_numpy().astype(str)
+                else:
+                    entry['kind'] = 'array'
+                    array = values.to_numpy()
+                np.save(os.path.join(tmp_dir, file_name), array, allow_pickle=False)
+                manifest['columns'][name] = entry
+            with open(os.path.join(tmp_dir, MANIFEST), 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, indent=2)
+
+            try:
+                os.rename(tmp_dir, target)
+            except OSError:
+                # another process saved the same calendar first, keep its copy
+                if not os.path.exists(os.path.join(target, MANIFEST)):
+                    raise
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+        return target
+
+    def load(self, start_date, end_date, typed=False, columns=None):
+        """
+        Memory map a saved calendar.
+
+        Args:
+            start_date (str | date): The start date of the fiscal calendar.
+            end_date (str | date): The end date of the fiscal calendar.
+            typed (bool, optional): True for the typed columns of create_dataframe(typed=True) (default is False).
+            columns (list, optional): Columns to load, defaults to all columns.
+
+        Returns:
+            pd.DataFrame: The calendar, read-only for the memory mapped columns.
+
+        Raises:
+            KeyError: If the calendar is not in the store.
+        """
+        target = self.path(start_date, end_date, typed)
+        try:
+            with open(os.path.join(target, MANIFEST), encoding='utf-8') as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            raise KeyError(f"Fiscal calendar {start_date} - {end_date} (typed={typed}) is not in the store") from None
+
+        data = {}
+        for name in manifest['columns'] if columns is None else columns:
+            entry = manifest['columns'][name]
+            array = np.load(os.path.join(target, entry['file']), mmap_mode='r', allow_pickle=False)
+            if entry['kind'] == 'category':
+                data[name] = pd.Categorical.from_codes(array, categories=entry['categories'],
+                                                       ordered=entry['ordered'])
+            elif entry['kind'] == 'str':
+                data[name] = array.astype(object)
+            else:
+                data[name] = array
+        return pd.DataFrame(data, index=pd.RangeIndex(manifest['rows']), copy=False)
+
+    def get_dataframe(self, start_date, end_date, typed=False, columns=None):
+        """
+        Load a calendar from the store, building and saving it first if it is missing. Same interface as
+        CalendarCache.get_dataframe(), so the store can be passed as cache to create_dataframe().
+
+        Args:
+            start_date (str): The start date of the fiscal calendar in the format 'yyyy-mm-dd', in January.
+            end_date (str): The end date of the fiscal calendar in the format 'yyyy-mm-dd'.
+            typed (bool, optional): If True, return compact typed columns instead of strings (default is False).
+            columns (list, optional): Columns to return, defaults to all columns.
+
+        Returns:
+            pd.DataFrame: The same DataFrame as FiscalCalendarEngine(start_date, end_date).build(columns, typed=typed).
+        """
+        if (start_date, end_date, typed) not in self:
+            self.save(start_date, end_date, typed)
+        return self.load(start_date, end_date, typed, columns)
+
+    def clear(self):
+        """
+        Remove every calendar from the store.
+        """
+        for name in os.listdir(self.directory):
+            shutil.rmtree(os.path.join(self.directory, name), ignore_errors=True)
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from fiscal_calendar import FiscalCalendarGenerator
+
+
+def test_locate_matches_dataframe():
+    fc = FiscalCalendarGenerator('2021-01-31', '2025-02-01')
+    df = fc.create_dataframe(typed=True)
+    index = fc.create_boundary_index()
+
+    for level, column in [('year', None), ('quarter', 'fiscal_quarter_of_year'), ('month', 'fiscal_month_of_year'),
+                          ('week', 'fiscal_week_of_year')]:
+        position = index.locate(df['day_date'].values, level)
+        assert (index.fiscal_year(level)[position] == df['fiscal_year']).all()
+        if column is not None:
+            assert (index.number(level)[position] == df[column]).all()
+
+    assert index.year_weeks.tolist() == [52, 52, 53, 52]
+    assert index.has_53_weeks.tolist() == [False, False, True, False]
+    assert index.ends('year')[-1] == np.datetime64('2025-02-01')
+
+
+def test_locate_and_periods_between_outside_index():
+    index = FiscalCalendarGenerator('2021-01-31', '2025-02-01').create_boundary_index()
+    dates = np.array(['2021-01-30', '2025-02-02'], dtype='datetime64[D]')
+    assert index.locate(dates, 'week').tolist() == [-1, -1]
+
+    months = index.periods_between('2024-01-01', '2024-03-10', 'month')
+    assert index.number('month')[months].tolist() == [12, 1, 2]
+    assert index.periods_between('2030-01-01', '2030-12-31', 'month') == slice(48, 48)
+
+
+def test_period_ranges_match_starts_and_ends():
+    index = FiscalCalendarGenerator('2021-01-31', '2025-02-01').create_boundary_index()
+    for level in ['year', 'season', 'quarter', 'month', 'week']:
+        fiscal_years, numbers = index.fiscal_year(level), index.number(level)
+        keys = fiscal_years if level == 'year' else fiscal_years * 100 + numbers
+        ranges = index.period_ranges(level, keys[::-1])
+        assert (ranges['start_date'] == index.starts(level)[::-1]).all()
+        assert (ranges['end_date'] == index.ends(level)[::-1]).all()
+        assert (ranges['number_of_weeks'] * 7 == ranges['number_of_days']).all()
+        assert (index.positions(level, fiscal_years, numbers) == np.arange(len(keys))).all()
+
+    assert index.period_ranges('season', [202302])['number_of_weeks'].tolist() == [27]
+    with pytest.raises(ValueError):
+        index.period_ranges('week', [202253])
+
+
+def test_shift_keeps_day_of_week_and_follows_month_lengths():
+    fc = FiscalCalendarGenerator('2021-01-31', '2025-02-01')
+    df = fc.create_dataframe(typed=True)
+    index = fc.create_boundary_index()
+    dates = df['day_date'].values.astype('datetime64[D]')
+
+    for periods in [-13, -1, 1, 7]:
+        shifted = index.shift(dates, periods, 'month')
+        valid = ~np.isnat(shifted)
+        source_position = index.locate(dates[valid], 'month')
+        assert (index.locate(shifted[valid], 'month') == source_position + periods).all()
+        assert ((shifted[valid] - dates[valid]).astype(np.int64) % 7 == 0).all()
+        assert valid.sum() == ((source_position + periods >= 0) & (source_position + periods < 48)).sum()
+
+    assert (index.shift(dates, -13, 'week')[91:] == dates[:-91]).all()
+
+    # the 53rd week moves to the last week of a 52-week year, and a 5-week month to the last week of a 4-week month
+    assert index.shift(np.datetime64('2024-02-03'), 1, 'year') == np.datetime64('2025-02-01')
+    assert index.shift(np.datetime64('2023-04-01'), 1, 'month') == np.datetime64('2023-04-29')
+
+
+def test_shift_dates_requires_january_start():
+    dates = np.array(['2020-08-15'], dtype='datetime64[D]')
+    with pytest.raises(ValueError):
+        FiscalCalendarGenerator('2019-05-05', '2022-05-01').shift_dates(dates, 1, 'month')
+    # other week patterns keep their own month lengths
+    fc = FiscalCalendarGenerator('2020-01-26', '2024-02-03', pattern='4-4-5')
+    index = fc.create_boundary_index()
+    assert (index.locate(fc.shift_dates(dates, 1, 'month'), 'month') == index.locate(dates, 'month') + 1).all()
@@ -0,0 +1,42 @@
+import pandas as pd
+
+from fiscal_calendar import FiscalCalendarGenerator
+from fiscal_calendar.cache import CalendarCache
+
+
+def test_overlapping_ranges_are_assembled_from_cached_years():
+    cache = CalendarCache()
+    df_first = FiscalCalendarGenerator('2021-01-31', '2023-01-28').create_dataframe(cache=cache)
+    assert cache.stats()['misses'] == 2
+
+    fc = FiscalCalendarGenerator('2021-01-31', '2024-06-01')
+    df_second = fc.create_dataframe(cache=cache)
+    assert cache.stats()['hits'] == 2
+    assert cache.stats()['misses'] == 4
+
+    pd.testing.assert_frame_equal(df_first, FiscalCalendarGenerator('2021-01-31', '2023-01-28').create_dataframe())
+    pd.testing.assert_frame_equal(df_second, fc.create_dataframe())
+    pd.testing.assert_frame_equal(fc.create_dataframe(cache=cache, typed=True), fc.create_dataframe(typed=True))
+
+
+def test_least_recently_used_years_are_evicted():
+    fc = FiscalCalendarGenerator('2021-01-31', '2025-02-01')
+    year_bytes = CalendarCache().get_dataframe('2021-01-31', '2022-01-29').memory_usage(index=False, deep=True).sum()
+    cache = CalendarCache(max_bytes=int(year_bytes * 2.5))
+
+    fc.create_dataframe(cache=cache)
+    stats = cache.stats()
+    assert stats['fragments'] == 2
+    assert stats['evictions'] == 2
+    assert stats['bytes'] <= stats['max_bytes']
+
+    # a scan over four years never finds the first years in a cache that holds two
+    FiscalCalendarGenerator('2021-01-31', '2025-02-01').create_dataframe(cache=cache)
+    FiscalCalendarGenerator('2021-01-31', '2023-01-28').create_dataframe(cache=cache)
+    assert cache.stats()['hits'] == 0
+
+    FiscalCalendarGenerator('2021-01-31', '2023-01-28').create_dataframe(cache=cache)
+    assert cache.stats()['hits'] == 2
+
+    cache.clear()
+    assert cache.stats()['fragments'] == 0
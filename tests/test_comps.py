@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from fiscal_calendar import ComparableAlignment, FiscalCalendarGenerator
+
+
+def test_shift_rows_match_last_year_columns():
+    fc = FiscalCalendarGenerator('2021-01-31', '2025-02-01')
+    df = fc.create_dataframe()
+    df_week = fc.create_week_dataframe()
+    alignment = fc.create_comp_alignment()
+
+    day_keys = df['time_day_id_pk'].values
+    for years_back, column in [(1, 'last_year_equiv_day_fk'), (2, 'prior_year_from_last_year_equiv_day_fk')]:
+        rows = alignment.rows('day', years_back)
+        assert (rows[:364 * years_back] == -1).all()
+        assert (day_keys[rows[364 * years_back:]] == df[column].values[364 * years_back:]).all()
+
+    week_keys = df_week['time_fiscal_week_id_pk'].values
+    rows = alignment.rows('week')
+    assert (week_keys[rows[52:]] == df_week['last_year_equiv_week_fk'].values[52:]).all()
+
+
+def test_align_day_and_week_values():
+    alignment = ComparableAlignment('2021-01-31', '2025-02-01')
+    sales = np.arange(alignment.num_rows['day'] * 2, dtype=np.float64).reshape(-1, 2)
+    ly_sales, lly_sales = alignment.align(sales, grain='day')
+    assert ly_sales.shape == sales.shape
+    assert np.isnan(ly_sales[:364]).all() and np.isnan(lly_sales[:728]).all()
+    assert (ly_sales[364:] == sales[:-364]).all() and (lly_sales[728:] == sales[:-728]).all()
+
+    weekly_units = np.arange(alignment.num_rows['week'])
+    ly_units, _ = alignment.align(weekly_units, grain='week', fill_value=-1)
+    assert ly_units.dtype == weekly_units.dtype
+    assert ly_units[:53].tolist() == [-1] * 52 + [0]
+
+    with pytest.raises(ValueError):
+        alignment.align(weekly_units, grain='day')
+
+
+def test_week_number_policy_skips_the_53rd_week():
+    fc = FiscalCalendarGenerator('2021-01-31', '2025-02-01')
+    week_keys = fc.create_week_dataframe(typed=True)['time_fiscal_week_id_pk'].values
+    alignment = fc.create_comp_alignment(week_53='week_number')
+    ly_keys = dict(zip(week_keys.tolist(), np.where(alignment.rows('week') >= 0,
+                                                    week_keys[alignment.rows('week')], -1).tolist()))
+    assert ly_keys[202353] == -1
+    assert ly_keys[202352] == 202252
+    assert ly_keys[202401] == 202301
+    assert ly_keys[202101] == -1
+
+    # days keep their fiscal week number and day of week
+    day_rows = alignment.rows('day', 2)
+    df = fc.create_dataframe(typed=True)
+    equivalent = df.iloc[day_rows[day_rows >= 0]]
+    source = df[day_rows >= 0]
+    assert (equivalent['fiscal_week_of_year'].values == source['fiscal_week_of_year'].values).all()
+    assert (equivalent['fiscal_day_of_week'].values == source['fiscal_day_of_week'].values).all()
+    assert (equivalent['fiscal_year'].values == source['fiscal_year'].values - 2).all()
+
+    with pytest.raises(ValueError):
+        ComparableAlignment('2021-01-31', '2025-02-01', week_53='drop')
+
+
+def test_comp_alignment_requires_vectorized_engine():
+    for fc in [FiscalCalendarGenerator('2019-05-05', '2022-05-01'),
+               FiscalCalendarGenerator('2021-01-31', '2025-02-01', pattern='4-4-5')]:
+        with pytest.raises(ValueError):
+            fc.create_comp_alignment(week_53='week_number')
@@ -0,0 +1,61 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+
+from fiscal_calendar import FiscalCalendarConfig, FiscalCalendarGenerator, create_calendar
+
+
+@pytest.mark.parametrize('engine', ['vectorized', 'legacy'])
+def test_repeated_calls_give_identical_results(engine):
+    fc = FiscalCalendarGenerator('2021-01-31', '2025-02-01')
+    df_first = fc.create_dataframe(engine=engine)
+    df_second = fc.create_dataframe(engine=engine)
+    pd.testing.assert_frame_equal(df_first, df_second)
+    assert df_second['fiscal_month_name'].iloc[0] == 'February'
+
+
+def test_create_dataframe_does_not_modify_the_generator():
+    fc = FiscalCalendarGenerator('2022-03-27', '2026-02-01')
+    month_name_dict = dict(fc.month_name_dict)
+    fc.create_dataframe(engine='legacy')
+    assert fc.lst_months == []
+    assert fc.boundary_index is None
+    assert fc.month_name_dict == month_name_dict
+
+
+def test_shared_generator_across_threads():
+    fc = FiscalCalendarGenerator('2019-02-03', '2021-01-30')
+    lst_requests = [('legacy', None), ('vectorized', None), ('legacy', ['fiscal_month_name', 'fiscal_year']),
+                    ('vectorized', ['fiscal_week_iso_code'])] * 2
+    lst_expected = [FiscalCalendarGenerator('2019-02-03', '2021-01-30').create_dataframe(engine=engine, columns=columns)
+                    for engine, columns in lst_requests]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        lst_results = list(executor.map(lambda request: fc.create_dataframe(*request[:1], columns=request[1]),
+                                        lst_requests))
+    for df_result, df_expected in zip(lst_results, lst_expected):
+        pd.testing.assert_frame_equal(df_result, df_expected)
+
+
+def test_config_is_immutable_and_hashable():
+    config = FiscalCalendarConfig('2021-01-31', '2025-02-01')
+    assert config.pattern == '4-5-4'
+    assert config.supports_vectorized_engine
+    assert not FiscalCalendarConfig('2021-02-28', '2025-02-01').supports_vectorized_engine
+    assert not FiscalCalendarConfig('2021-01-31', '2025-02-01', '4-4-5').supports_vectorized_engine
+    with pytest.raises(AttributeError):
+        config.end_date = '2030-02-02'
+    assert {config: 1}[FiscalCalendarConfig('2021-01-31', '2025-02-01', '4-5-4')] == 1
+    with pytest.raises(ValueError):
+        FiscalCalendarConfig('2021-01-31', '2025-02-01', '4-4-4')
+    with pytest.raises(ValueError):
+        FiscalCalendarConfig('01/31/2021', '2025-02-01')
+
+
+def test_create_calendar_matches_generator():
+    config = FiscalCalendarConfig('2021-01-31', '2025-02-01')
+    fc = FiscalCalendarGenerator.from_config(config)
+    assert fc.config == config
+    pd.testing.assert_frame_equal(create_calendar(config, typed=True), fc.create_dataframe(typed=True))
+    pd.testing.assert_frame_equal(create_calendar(config, engine='legacy', columns=['fiscal_month_name']),
+                                  fc.create_dataframe(engine='legacy', columns=['fiscal_month_name']))
@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fiscal_calendar import FiscalCalendarGenerator
+from fiscal_calendar.dimensions import MONTH_COLUMNS, WEEK_COLUMNS
+from fiscal_calendar.engine import COLUMNS
+
+
+@pytest.mark.parametrize('typed', [False, True])
+def test_week_dimension_matches_day_grain(typed):
+    fc = FiscalCalendarGenerator('2015-01-25', '2025-02-01')
+    df_week = fc.create_week_dataframe(typed=typed)
+    assert tuple(df_week.columns) == WEEK_COLUMNS
+    shared = [column for column in WEEK_COLUMNS if column in COLUMNS]
+    df_day = fc.create_dataframe(typed=typed).drop_duplicates('time_fiscal_week_id_fk', ignore_index=True)
+    pd.testing.assert_frame_equal(df_week[shared], df_day[shared])
+    assert (df_week['time_fiscal_week_id_pk'] == df_day['time_fiscal_week_id_fk']).all()
+    assert (df_week['last_year_equiv_week_fk'] == df_day['last_year_equiv_week_fk']).all()
+
+
+def test_week_dimension_keys_and_indicators():
+    df_week = FiscalCalendarGenerator('2015-01-25', '2025-02-01').create_week_dataframe()
+    week_53 = df_week[df_week['fiscal_week_iso_code'] == '2023W53'].iloc[0]
+    assert week_53['last_year_equiv_week_fk'] == '2023W01'
+    assert week_53['last_fiscal_week_of_fiscal_year_ind'] == 1
+    assert week_53['time_fiscal_month_id_fk'] == '2023M12'
+    assert df_week['prior_year_from_last_year_equiv_week_fk'].iloc[0] == '2013W01'
+    assert df_week['prior_year_from_last_year_equiv_week_fk'].iloc[52] == '2014W01'
+    assert df_week['prior_year_from_last_year_equiv_week_fk'].iloc[104] == '2015W01'
+    assert df_week['first_fiscal_week_of_fiscal_year_ind'].sum() == len(df_week['fiscal_year'].unique())
+
+
+@pytest.mark.parametrize('typed', [False, True])
+def test_month_dimension_matches_day_grain(typed):
+    fc = FiscalCalendarGenerator('2015-01-25', '2025-02-01')
+    df_month = fc.create_month_dataframe(typed=typed)
+    assert tuple(df_month.columns) == MONTH_COLUMNS
+    # the day-grain fiscal_month_start_date and fiscal_month_end_date repeat the first date of the calendar
+    shared = [column for column in MONTH_COLUMNS if column in COLUMNS
+              and column not in ('fiscal_month_start_date', 'fiscal_month_end_date')]
+    df_day = fc.create_dataframe(typed=typed).drop_duplicates(['fiscal_year', 'fiscal_month_of_year'],
+                                                              ignore_index=True)
+    pd.testing.assert_frame_equal(df_month[shared], df_day[shared])
+
+
+def test_month_dimension_boundaries():
+    fc = FiscalCalendarGenerator('2015-01-25', '2025-02-01')
+    df_month = fc.create_month_dataframe(typed=True)
+    index = fc.create_boundary_index()
+    assert np.array_equal(df_month['fiscal_month_start_date'].to_numpy(), index.starts('month').astype('datetime64[ns]'))
+    assert np.array_equal(df_month['fiscal_month_end_date'].to_numpy(), index.ends('month').astype('datetime64[ns]'))
+    december_2023 = df_month[df_month['time_fiscal_month_id_pk'] == 202312].iloc[0]
+    assert december_2023['fiscal_month_number_of_days'] == 35
+    assert december_2023['last_fiscal_week_fk'] == 202353
+    assert december_2023['last_year_equiv_month_fk'] == 202212
+
+
+def test_dimensions_require_january_start():
+    fc = FiscalCalendarGenerator('2021-02-01', '2025-02-01')
+    with pytest.raises(ValueError):
+        fc.create_week_dataframe()
+    with pytest.raises(ValueError):
+        fc.create_month_dataframe()
@@ -0,0 +1,119 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fiscal_calendar import FiscalCalendarGenerator
+from fiscal_calendar.engine import COLUMNS
+from fiscal_calendar.fiscal_calendar import LEGACY_STAGES, legacy_stages_for
+
+
+@pytest.mark.parametrize('start_date, end_date', [
+    ('2021-01-31', '2025-02-01'),  # fiscal year 2023 has 53 weeks
+    ('2023-01-29', '2024-02-10'),  # range ends in the week after a 53-week year
+    ('2021-01-03', '2022-12-01'),  # every fiscal year has 53 weeks
+    ('2019-01-27', '2019-12-31'),  # shorter than a year
+])
+def test_vectorized_engine_matches_legacy(start_date, end_date):
+    df_legacy = FiscalCalendarGenerator(start_date, end_date).create_dataframe(engine='legacy')
+    df_vectorized = FiscalCalendarGenerator(start_date, end_date).create_dataframe()
+    pd.testing.assert_frame_equal(df_legacy, df_vectorized, check_exact=True)
+
+
+def test_unknown_engine():
+    with pytest.raises(ValueError):
+        FiscalCalendarGenerator('2021-01-31', '2022-01-29').create_dataframe(engine='fast')
+
+
+def test_typed_columns_match_string_columns():
+    fc = FiscalCalendarGenerator('2021-01-31', '2025-02-01')
+    df_typed = fc.create_dataframe(typed=True)
+    df_strings = fc.create_dataframe()
+
+    assert list(df_typed.columns) == list(df_strings.columns)
+    assert df_typed['fiscal_week_of_year'].dtype == 'int8'
+    assert df_typed['fiscal_month_name'].dtype == 'category'
+    assert (df_typed['day_date'].dt.strftime('%m/%d/%Y') == df_strings['day_date']).all()
+    assert (df_typed['fiscal_year_end_date'].dt.strftime('%m/%d/%Y') == df_strings['fiscal_year_end_date']).all()
+    assert (df_typed['time_day_id_pk'].astype(str) == df_strings['time_day_id_pk']).all()
+    week_keys = df_typed['last_year_equiv_week_fk'].astype(str)
+    assert (week_keys.str[:4] + 'W' + week_keys.str[4:] == df_strings['last_year_equiv_week_fk']).all()
+    assert (df_typed['fiscal_month_name'].astype(str) == df_strings['fiscal_month_name']).all()
+
+
+def test_map_dates_aligned_to_input():
+    fc = FiscalCalendarGenerator('2021-01-31', '2025-02-01')
+    df = fc.create_dataframe()
+    rows = np.random.default_rng(0).integers(0, len(df), 1000)
+    dates = pd.Series(np.datetime64('2021-01-31') + rows, index=rows * 10)
+    columns = ['fiscal_year', 'fiscal_week_iso_code', 'last_year_equiv_week_fk', 'last_year_fiscal_month_of_year']
+
+    df_mapped = fc.map_dates(dates, columns=columns)
+
+    assert (df_mapped.index == dates.index).all()
+    pd.testing.assert_frame_equal(df_mapped.reset_index(drop=True), df.iloc[rows][columns].reset_index(drop=True))
+
+
+def test_map_dates_outside_calendar():
+    fc = FiscalCalendarGenerator('2021-01-31', '2025-02-01')
+    with pytest.raises(ValueError):
+        fc.map_dates(np.array(['2021-01-30'], dtype='datetime64[D]'))
+
+
+@pytest.mark.parametrize('typed', [False, True])
+def test_extend_matches_full_calendar(typed):
+    fc = FiscalCalendarGenerator('2021-01-31', '2023-06-01')
+    df_extended = fc.extend(fc.create_dataframe(typed=typed), years=2)
+
+    # the partial fiscal year 2023 (53 weeks) is completed, then fiscal years 2024 and 2025 are added
+    assert fc.end_date == '2026-01-31'
+    df_full = FiscalCalendarGenerator('2021-01-31', fc.end_date).create_dataframe(typed=typed)
+    pd.testing.assert_frame_equal(df_extended, df_full, check_exact=True)
+
+
+def test_iter_fiscal_years_and_chunks_match_full_calendar():
+    fc = FiscalCalendarGenerator('2021-01-31', '2025-02-15')
+    df = fc.create_dataframe()
+
+    lst_years = list(fc.iter_fiscal_years())
+    assert [df_year['fiscal_year'].iloc[0] for df_year in lst_years] == ['2021', '2022', '2023', '2024', '2025']
+    pd.testing.assert_frame_equal(pd.concat(lst_years), df)
+
+    lst_chunks = list(fc.iter_chunks(rows=500))
+    assert [len(df_chunk) for df_chunk in lst_chunks] == [500, 500, 477]
+    pd.testing.assert_frame_equal(pd.concat(lst_chunks), df)
+
+
+def test_equivalent_year_keys_years_back():
+    fc = FiscalCalendarGenerator('2019-02-03', '2025-02-01')
+    df_date = fc.generate_fiscal_calendar()
+    df_date = fc.add_fiscal_week_iso_code(fc.add_fiscal_year(df_date))
+
+    day_fk, week_fk = fc.equivalent_year_keys(df_date, years_back=3)
+
+    assert day_fk[2000] == (df_date['Date'][2000] - pd.Timedelta(days=3 * 364)).strftime('%Y%m%d')
+    assert week_fk[2000] == df_date['fiscal_week_iso_code'][2000 - 3 * 364]
+    # rows without an equivalent row in the calendar use the same week of the first fiscal year
+    assert df_date['fiscal_week_iso_code'][400] == '2020W06'
+    assert week_fk[400] == '2017W06'
+    assert week_fk[0] == '2016W01'
+
+
+@pytest.mark.parametrize('column', COLUMNS)
+def test_legacy_column_projection(column):
+    df_full = FiscalCalendarGenerator('2019-02-03', '2020-03-01').create_dataframe(engine='legacy')
+    df_projected = FiscalCalendarGenerator('2019-02-03', '2020-03-01').create_dataframe(columns=[column])
+    pd.testing.assert_frame_equal(df_projected, df_full[[column]])
+
+
+def test_column_projection_runs_only_dependencies():
+    assert legacy_stages_for(['fiscal_week_iso_code']) == ['add_fiscal_week_iso_code']
+    assert legacy_stages_for(['fiscal_season_name', 'time_day_id_pk_int']) == [
+        'add_time_day_id_pk', 'add_fiscal_quarter_of_year', 'add_fiscal_season_of_year', 'add_fiscal_season_name',
+        'add_time_day_id_pk_int']
+    assert legacy_stages_for(COLUMNS) == list(LEGACY_STAGES)
+
+    columns = ['fiscal_year', 'fiscal_week_iso_code', 'day_date']
+    df = FiscalCalendarGenerator('2021-01-31', '2025-02-01').create_dataframe(columns=columns, typed=True)
+    assert list(df.columns) == columns
+    with pytest.raises(ValueError):
+        FiscalCalendarGenerator('2021-01-31', '2025-02-01').create_dataframe(columns=['Fiscal Wk'])
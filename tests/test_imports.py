@@ -0,0 +1,51 @@
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+HEAVY_MODULES = ('numpy', 'pandas', 'reportlab', 'tabulate')
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def run_python(code, *options):
+    # a fresh interpreter, the test session has already imported everything
+    return subprocess.run([sys.executable, *options, '-c', code], capture_output=True, text=True, check=True,
+                          cwd=REPO_ROOT)
+
+
+def loaded_modules(code):
+    result = run_python(code + '\nimport sys\nprint(",".join(m for m in %r if m in sys.modules))' % (HEAVY_MODULES,))
+    return set(filter(None, result.stdout.strip().split(',')))
+
+
+def test_resolver_needs_only_the_standard_library():
+    code = ("from fiscal_calendar import FiscalDateResolver\n"
+            "FiscalDateResolver('2021-01-31', '2025-02-01').resolve('2024-08-15')")
+    assert loaded_modules(code) == set()
+
+
+def test_config_needs_only_the_standard_library():
+    assert loaded_modules("from fiscal_calendar import FiscalCalendarConfig\n"
+                          "FiscalCalendarConfig('2021-01-31', '2025-02-01')") == set()
+
+
+def test_generator_does_not_load_rendering_dependencies():
+    assert loaded_modules("from fiscal_calendar import FiscalCalendarGenerator") == {'numpy', 'pandas'}
+
+
+def test_unknown_export():
+    import fiscal_calendar
+    with pytest.raises(AttributeError):
+        fiscal_calendar.NotAName
+    assert 'FiscalDateResolver' in dir(fiscal_calendar)
+
+
+def test_resolver_import_time():
+    # -X importtime reports the cumulative import time of every module in microseconds on stderr
+    result = run_python("import fiscal_calendar.resolver", '-X', 'importtime')
+    match = re.search(r'\|\s*(\d+)\s*\|\s*fiscal_calendar\.resolver$', result.stderr, re.MULTILINE)
+    assert match is not None
+    # generous bound, loading pandas alone takes several hundred milliseconds
+    assert int(match.group(1)) < 200_000
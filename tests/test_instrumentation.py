@@ -0,0 +1,29 @@
+import pandas as pd
+
+from fiscal_calendar import FiscalCalendarGenerator
+from fiscal_calendar.fiscal_calendar import LEGACY_STAGES
+from fiscal_calendar.instrumentation import StageRecorder
+
+
+def test_legacy_stages_are_recorded():
+    recorder = StageRecorder()
+    with recorder:
+        df = FiscalCalendarGenerator('2021-01-31', '2022-01-29').create_dataframe(engine='legacy', instrument=recorder)
+
+    stages = [record.stage for record in recorder.records]
+    assert stages == ['generate_fiscal_calendar', *LEGACY_STAGES, 'drop_temporary_columns']
+    assert all(record.rows == len(df) and record.engine == 'legacy' for record in recorder.records)
+    assert all(record.memory_delta_bytes is not None for record in recorder.records)
+    pd.testing.assert_frame_equal(df, FiscalCalendarGenerator('2021-01-31', '2022-01-29').create_dataframe(
+        engine='legacy'))
+
+
+def test_vectorized_columns_are_recorded():
+    recorder = StageRecorder(trace_memory=False)
+    df = FiscalCalendarGenerator('2021-01-31', '2022-01-29').create_dataframe(typed=True, instrument=recorder)
+
+    df_records = recorder.to_dataframe()
+    assert list(df_records['stage']) == list(df.columns) + ['assemble_dataframe']
+    assert (df_records['engine'] == 'typed').all()
+    assert df_records['memory_delta_bytes'].isna().all()
+    assert recorder.total_seconds() > 0
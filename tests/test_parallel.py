@@ -0,0 +1,28 @@
+import pandas as pd
+import pytest
+
+from fiscal_calendar import FiscalCalendarGenerator
+from fiscal_calendar.parallel import build_many
+
+
+@pytest.mark.parametrize('typed', [False, True])
+def test_parallel_matches_serial(typed):
+    # blocks of fiscal years split around the 53-week fiscal years 2017 and 2023
+    fc = FiscalCalendarGenerator('2015-01-25', '2025-02-15')
+    pd.testing.assert_frame_equal(fc.create_dataframe(typed=typed, workers=3), fc.create_dataframe(typed=typed))
+
+
+def test_build_many():
+    configurations = [('2021-01-31', '2025-02-01'), ('2019-01-27', '2019-12-31')]
+    lst_calendars = build_many(configurations, workers=2, columns=['fiscal_week_iso_code', 'last_year_equiv_week_fk'])
+
+    for (start_date, end_date), df in zip(configurations, lst_calendars):
+        df_serial = FiscalCalendarGenerator(start_date, end_date).create_dataframe()
+        pd.testing.assert_frame_equal(df, df_serial[['fiscal_week_iso_code', 'last_year_equiv_week_fk']])
+
+
+def test_parallel_requires_january_start():
+    with pytest.raises(ValueError):
+        FiscalCalendarGenerator('2019-02-03', '2022-01-01').create_dataframe(workers=2)
+    with pytest.raises(ValueError):
+        build_many([('2019-02-03', '2022-01-01')])
@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fiscal_calendar import FiscalCalendarGenerator
+from fiscal_calendar.engine import WEEK_PATTERNS, month_weeks_table
+
+
+@pytest.mark.parametrize('pattern', list(WEEK_PATTERNS))
+def test_month_weeks_table(pattern):
+    table = month_weeks_table(pattern)
+    assert table.shape == (2, 12)
+    assert table.sum(axis=1).tolist() == [52, 53]
+    assert tuple(table[0, :3]) == WEEK_PATTERNS[pattern]
+
+
+@pytest.mark.parametrize('pattern', list(WEEK_PATTERNS))
+def test_legacy_calendar_follows_pattern(pattern):
+    fc = FiscalCalendarGenerator('2021-01-31', '2025-02-01', pattern=pattern)
+    df = fc.create_dataframe()
+    table = month_weeks_table(pattern)
+
+    df_months = df.groupby(['fiscal_year', 'fiscal_month_of_year'], sort=False).agg(
+        days=('day_date', 'size'), weeks=('fiscal_month_number_of_weeks', 'first'),
+        weeks_of_month=('fiscal_week_of_month', 'max'), last_weeks=('last_fiscal_week_of_fiscal_month_ind', 'sum'))
+    for fiscal_year, df_year in df_months.groupby(level=0):
+        expected = table[1 if fiscal_year == '2023' else 0]
+        assert df_year['days'].tolist() == (expected * 7).tolist()
+        assert df_year['weeks'].tolist() == expected.tolist()
+        assert df_year['weeks_of_month'].tolist() == expected.tolist()
+        assert df_year['last_weeks'].tolist() == [7] * 12
+
+    # fiscal weeks and quarters do not depend on the pattern
+    df_default = FiscalCalendarGenerator('2021-01-31', '2025-02-01').create_dataframe()
+    for column in ('fiscal_week_iso_code', 'fiscal_quarter_of_year', 'fiscal_year_end_date'):
+        pd.testing.assert_series_equal(df[column], df_default[column])
+
+    month_starts = pd.to_datetime(df.groupby(['fiscal_year', 'fiscal_month_of_year'], sort=False)['day_date'].first(),
+                                  format='%m/%d/%Y').to_numpy().astype('datetime64[D]')
+    assert np.array_equal(fc.create_boundary_index().starts('month'), month_starts)
+
+
+def test_pattern_other_than_4_5_4_uses_legacy_engine():
+    fc = FiscalCalendarGenerator('2021-01-31', '2025-02-01', pattern='4-4-5')
+    with pytest.raises(ValueError):
+        fc.create_dataframe(typed=True)
+    with pytest.raises(ValueError):
+        fc.resolve_date('2024-08-15')
+    with pytest.raises(ValueError):
+        FiscalCalendarGenerator('2021-01-31', '2025-02-01', pattern='4-4-4')
@@ -0,0 +1,28 @@
+import pytest
+from reportlab import rl_config
+
+from fiscal_calendar import FiscalCalendarGenerator
+
+
+def _page_count(path):
+    return path.read_bytes().count(b'/Type /Page\n')
+
+
+def test_pdf_has_one_page_per_fiscal_year(tmp_path, monkeypatch):
+    monkeypatch.setattr(rl_config, 'invariant', 1)
+    fc = FiscalCalendarGenerator('2021-01-31', '2025-02-01')
+    df = fc.create_dataframe()
+
+    fc.save_fiscal_calendar_to_pdf(df, week_number=True, filename=str(tmp_path / 'serial.pdf'))
+    fc.save_fiscal_calendar_to_pdf(df, week_number=True, filename=str(tmp_path / 'parallel.pdf'), workers=2)
+    fc.save_fiscal_calendar_to_pdf(df, year=2023, filename=str(tmp_path / 'single.pdf'))
+
+    assert _page_count(tmp_path / 'serial.pdf') == 4
+    assert (tmp_path / 'serial.pdf').read_bytes() == (tmp_path / 'parallel.pdf').read_bytes()
+    assert _page_count(tmp_path / 'single.pdf') == 1
+
+
+def test_pdf_unknown_year(tmp_path):
+    fc = FiscalCalendarGenerator('2021-01-31', '2025-02-01')
+    with pytest.raises(ValueError):
+        fc.save_fiscal_calendar_to_pdf(fc.create_dataframe(), year=2030, filename=str(tmp_path / 'empty.pdf'))
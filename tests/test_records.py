@@ -0,0 +1,69 @@
+import pickle
+from datetime import date
+
+import numpy as np
+import pytest
+
+from fiscal_calendar import FiscalCalendarGenerator, PackedFiscalCalendar
+from fiscal_calendar.boundaries import FiscalBoundaryIndex
+from fiscal_calendar.records import FiscalDay, FiscalPeriod
+
+
+def test_days_match_dataframe():
+    calendar = PackedFiscalCalendar('2021-01-31', '2025-02-01')
+    df = FiscalCalendarGenerator('2021-01-31', '2025-02-01').create_dataframe(typed=True)
+    lst_days = list(calendar)
+    assert len(lst_days) == len(calendar) == len(df)
+    assert [day.day_date for day in lst_days] == list(df['day_date'].dt.date)
+    assert [day.fiscal_year for day in lst_days] == df['fiscal_year'].astype(int).tolist()
+    assert [day.fiscal_quarter for day in lst_days] == df['fiscal_quarter_of_year'].astype(int).tolist()
+    assert [day.fiscal_month for day in lst_days] == df['fiscal_month_of_year'].astype(int).tolist()
+    assert [day.fiscal_week for day in lst_days] == df['fiscal_week_of_year'].astype(int).tolist()
+    assert [day.fiscal_day_of_week for day in lst_days] == df['fiscal_day_of_week'].astype(int).tolist()
+    df_iso = FiscalCalendarGenerator('2021-01-31', '2025-02-01').create_dataframe(columns=['fiscal_week_iso_code'])
+    assert [day.fiscal_week_iso_code for day in lst_days] == df_iso['fiscal_week_iso_code'].tolist()
+    assert [day.time_day_id for day in lst_days] == df['time_day_id_pk_int'].tolist()
+    assert calendar[-1] == lst_days[-1]
+    assert calendar.day('2024-02-03') == lst_days[len(lst_days) - 365]
+
+
+def test_weeks_and_periods_match_boundary_index():
+    calendar = PackedFiscalCalendar('2021-01-31', '2025-02-01')
+    index = FiscalBoundaryIndex.from_layout('2021-01-31', '2025-02-01')
+    lst_weeks = list(calendar.weeks())
+    assert [np.datetime64(week.start_date) for week in lst_weeks] == list(index.starts('week'))
+    assert lst_weeks[-1].fiscal_week_iso_code == '2024W52'
+    for level in ('year', 'quarter', 'month'):
+        lst_periods = list(calendar.periods(level))
+        assert [np.datetime64(period.start_date) for period in lst_periods] == list(index.starts(level))
+        assert [np.datetime64(period.end_date) for period in lst_periods] == list(index.ends(level))
+        assert [period.number for period in lst_periods] == index.number(level).tolist()
+    december_2023 = [period for period in calendar.periods('month') if (period.fiscal_year, period.number) == (2023, 12)]
+    assert december_2023[0].number_of_weeks == 5
+
+
+def test_packed_calendar_size():
+    calendar = PackedFiscalCalendar('1900-01-28', '2400-02-01')
+    assert calendar.nbytes < 5_000
+    assert calendar.day('2024-08-15').fiscal_week_iso_code == '2024W28'
+
+
+def test_records_are_slotted_values():
+    fiscal_day = FiscalDay(date(2024, 8, 15), 2024, 3, 7, 28, 5)
+    with pytest.raises(AttributeError):
+        fiscal_day.note = 'x'
+    assert fiscal_day == pickle.loads(pickle.dumps(fiscal_day))
+    assert len({fiscal_day, FiscalDay(date(2024, 8, 15), 2024, 3, 7, 28, 5)}) == 1
+    assert repr(FiscalPeriod('year', 2024, 1, date(2024, 2, 4), date(2025, 2, 1))).startswith("FiscalPeriod(level='year'")
+
+
+def test_packed_calendar_errors():
+    with pytest.raises(ValueError):
+        PackedFiscalCalendar('2021-02-01', '2025-02-01')
+    calendar = PackedFiscalCalendar('2021-01-31', '2025-02-01')
+    with pytest.raises(ValueError):
+        calendar.day('2025-02-02')
+    with pytest.raises(IndexError):
+        calendar[len(calendar)]
+    with pytest.raises(ValueError):
+        calendar.periods('week')
@@ -0,0 +1,27 @@
+from fiscal_calendar import FiscalCalendarGenerator
+
+
+def test_print_fiscal_calendar_renders_every_year():
+    fc = FiscalCalendarGenerator('2021-01-31', '2025-02-01')
+    df = fc.create_dataframe()
+
+    rendered = fc.print_fiscal_calendar(df, week_number=True)
+
+    assert rendered.count(' FY') == 4 * 12
+    assert rendered == ''.join(fc.print_fiscal_calendar(df, week_number=True, year=year) for year in range(2021, 2025))
+    # the 53rd week of fiscal year 2023 is rendered in the last fiscal month
+    assert '53 | 28 29 30 31  1  2  3' in fc.print_fiscal_calendar(df, week_number=True, year=2023)
+
+
+def test_print_fiscal_calendar_month_grid():
+    fc = FiscalCalendarGenerator('2021-01-31', '2022-01-29')
+    rendered = fc.print_fiscal_calendar(fc.create_dataframe(typed=True), columns=1, week_number=True, year=2021)
+
+    assert rendered.splitlines()[:6] == [
+        'February FY2021             ',
+        'W | Su Mo Tu We Th Fr Sa    ',
+        '1 | 31  1  2  3  4  5  6    ',
+        '2 |  7  8  9 10 11 12 13    ',
+        '3 | 14 15 16 17 18 19 20    ',
+        '4 | 21 22 23 24 25 26 27    ',
+    ]
@@ -0,0 +1,67 @@
+from datetime import date
+
+import pytest
+
+from fiscal_calendar import FiscalCalendarGenerator, FiscalDateResolver
+
+
+def test_resolve_date_matches_dataframe_rows():
+    fc = FiscalCalendarGenerator('2021-01-31', '2025-02-01')
+    df = fc.create_dataframe()
+    for row in df.iloc[::7].to_dict('records'):
+        month, day, year = (int(part) for part in row['day_date'].split('/'))
+        assert fc.resolve_date(date(year, month, day)) == row
+
+
+def test_resolve_date_53rd_week():
+    fc = FiscalCalendarGenerator('2021-01-31', '2025-02-01')
+    attributes = fc.resolve_date('2024-02-03')
+    assert attributes['fiscal_week_iso_code'] == '2023W53'
+    assert attributes['fiscal_month_number_of_weeks'] == 5
+    assert attributes['fiscal_year_number_of_days'] == 371
+
+
+def test_resolve_date_outside_calendar():
+    fc = FiscalCalendarGenerator('2021-01-31', '2025-02-01')
+    with pytest.raises(ValueError):
+        fc.resolve_date('2025-02-02')
+
+
+def test_period_range_matches_dataframe():
+    fc = FiscalCalendarGenerator('2021-01-31', '2025-02-01')
+    df = fc.create_dataframe(typed=True)
+    for key, mask in [('2023', df['fiscal_year'] == 2023),
+                      ('2023S2', (df['fiscal_year'] == 2023) & (df['fiscal_season_of_year'] == 2)),
+                      ('2023Q4', (df['fiscal_year'] == 2023) & (df['fiscal_quarter_of_year'] == 4)),
+                      ('2024M07', (df['fiscal_year'] == 2024) & (df['fiscal_month_of_year'] == 7)),
+                      ('2023W53', df['fiscal_week_iso_code'] == 202353)]:
+        days = df.loc[mask, 'day_date']
+        period = fc.period_range(key)
+        assert (period['start_date'], period['end_date']) == (days.min().date(), days.max().date())
+        assert period['number_of_days'] == len(days)
+        assert period['number_of_weeks'] == len(days) // 7
+
+
+def test_period_range_invalid_keys():
+    fc = FiscalCalendarGenerator('2021-01-31', '2025-02-01')
+    for key in ['2022W53', '2024M13', '2030', '2024X01', 'FY24']:
+        with pytest.raises(ValueError):
+            fc.period_range(key)
+
+
+@pytest.mark.parametrize('start_date, end_date', [('2019-05-05', '2022-05-01'), ('2020-02-02', '2024-02-03')])
+def test_resolve_date_non_january_start(start_date, end_date):
+    # the legacy frame numbers fiscal months from the calendar month of the start date, the resolver can not
+    fc = FiscalCalendarGenerator(start_date, end_date)
+    df = fc.create_dataframe()
+    month, day, year = (int(part) for part in df['day_date'].iloc[100].split('/'))
+    with pytest.raises(ValueError):
+        fc.resolve_date(date(year, month, day))
+    with pytest.raises(ValueError):
+        FiscalDateResolver(start_date, end_date)
+
+
+def test_period_range_non_january_start():
+    fc = FiscalCalendarGenerator('2019-05-05', '2022-05-01')
+    with pytest.raises(ValueError):
+        fc.period_range('2020M07')
@@ -0,0 +1,40 @@
+import pandas as pd
+import pytest
+
+from fiscal_calendar import FiscalCalendarGenerator
+from fiscal_calendar.sinks import ArrowIpcSink, CsvSink, ParquetSink
+
+
+@pytest.fixture(scope='module')
+def fc():
+    return FiscalCalendarGenerator('2021-01-31', '2025-02-01')
+
+
+def test_create_dataframe_does_not_write_files(fc, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    fc.create_dataframe()
+    fc.create_dataframe(engine='legacy')
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_csv_sink(fc, tmp_path):
+    path = tmp_path / 'fiscal_calendar.csv'
+    fc.export(CsvSink(str(path)))
+    df_csv = pd.read_csv(path, dtype=str)
+    assert df_csv.equals(fc.create_dataframe().astype(str))
+
+
+def test_parquet_sink_writes_one_row_group_per_fiscal_year(fc, tmp_path):
+    pq = pytest.importorskip('pyarrow.parquet')
+    path = tmp_path / 'fiscal_calendar.parquet'
+    fc.export(ParquetSink(str(path)), typed=True)
+    assert pq.ParquetFile(path).num_row_groups == 4
+    assert pq.read_table(path).num_rows == 1463
+
+
+def test_arrow_ipc_sink(fc, tmp_path):
+    pa = pytest.importorskip('pyarrow')
+    path = tmp_path / 'fiscal_calendar.arrow'
+    fc.export(ArrowIpcSink(str(path)))
+    df_arrow = pa.ipc.open_file(str(path)).read_pandas()
+    pd.testing.assert_frame_equal(df_arrow, fc.create_dataframe())
@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fiscal_calendar import FiscalCalendarGenerator
+from fiscal_calendar.store import CalendarStore
+
+
+def _is_memory_mapped(array):
+    while array is not None:
+        if isinstance(array, np.memmap):
+            return True
+        array = array.base
+    return False
+
+
+@pytest.mark.parametrize('typed', [False, True])
+def test_store_round_trip(tmp_path, typed):
+    store = CalendarStore(str(tmp_path))
+    fc = FiscalCalendarGenerator('2021-01-31', '2025-02-01')
+
+    df_built = fc.create_dataframe(typed=typed, cache=store)
+    df_loaded = fc.create_dataframe(typed=typed, cache=store)
+
+    assert ('2021-01-31', '2025-02-01', typed) in store
+    pd.testing.assert_frame_equal(df_built, fc.create_dataframe(typed=typed))
+    pd.testing.assert_frame_equal(df_loaded, fc.create_dataframe(typed=typed))
+
+
+def test_store_memory_maps_typed_columns(tmp_path):
+    store = CalendarStore(str(tmp_path))
+    store.save('2021-01-31', '2025-02-01', typed=True)
+
+    df = store.load('2021-01-31', '2025-02-01', typed=True, columns=['fiscal_year', 'fiscal_month_name'])
+
+    assert list(df.columns) == ['fiscal_year', 'fiscal_month_name']
+    assert _is_memory_mapped(df['fiscal_year'].to_numpy())
+    assert _is_memory_mapped(df['fiscal_month_name'].cat.codes.to_numpy())
+    with pytest.raises(KeyError):
+        store.load('2021-01-31', '2026-01-31', typed=True)